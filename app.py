@@ -1,8 +1,13 @@
 import streamlit as st
 import pandas as pd
-import time
 from datetime import datetime
 from reddit_scraper import RedditScraper
+from post_store import PostStore
+from exporters import to_parquet_bytes
+from response_cache import ResponseCache
+from jobs import JobRunner
+from result_cache import ResultCache
+from metrics import Metrics
 import os
 
 # Page configuration
@@ -13,12 +18,72 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+
+@st.cache_resource
+def get_post_store():
+    """Open the SQLite post store once per server process."""
+    return PostStore(os.environ.get("REDDIT_SCRAPER_DB", "reddit_posts.db"))
+
+
+@st.cache_resource
+def get_response_cache():
+    """Open the HTTP response cache once per server process so sessions share it."""
+    return ResponseCache(os.environ.get("REDDIT_SCRAPER_HTTP_CACHE", "http_cache.db"))
+
+
+@st.cache_resource
+def get_result_cache():
+    """Share scrape results between sessions so identical scrapes run once per TTL."""
+    return ResultCache(
+        ttl=float(os.environ.get("REDDIT_SCRAPER_RESULT_TTL", "300")),
+        max_bytes=int(os.environ.get("REDDIT_SCRAPER_RESULT_CACHE_MB", "256")) * 1024 * 1024
+    )
+
+
+@st.cache_resource
+def get_job_runner():
+    """Start the background scrape executor once per server process."""
+    return JobRunner(
+        max_workers=int(os.environ.get("REDDIT_SCRAPER_WORKERS", "8")),
+        result_cache=get_result_cache()
+    )
+
+
+@st.cache_resource
+def get_metrics():
+    """Share one instrumentation registry across sessions; off unless enabled here or in the sidebar."""
+    return Metrics(enabled=os.environ.get("REDDIT_SCRAPER_METRICS", "") == "1")
+
+
+@st.cache_resource
+def get_link_enricher():
+    """Start the linked-article extractor once per server process; content is cached in the post store."""
+    from link_content import LinkEnricher
+    return LinkEnricher(
+        store=get_post_store(),
+        max_workers=int(os.environ.get("REDDIT_SCRAPER_ENRICH_WORKERS", "8"))
+    )
+
+
+post_store = get_post_store()
+job_runner = get_job_runner()
+metrics = get_metrics()
+
 # Initialize session state
 if 'scraper' not in st.session_state:
-    st.session_state.scraper = RedditScraper()
+    st.session_state.scraper = RedditScraper(
+        store=post_store,
+        cache=get_response_cache(),
+        result_cache=get_result_cache(),
+        metrics=metrics
+    )
 
-if 'scraped_data' not in st.session_state:
-    st.session_state.scraped_data = None
+if 'demo_store' not in st.session_state:
+    st.session_state.demo_store = PostStore(":memory:")
+
+# Which store, subreddits and (for a scrape) post IDs the results view shows
+if 'results' not in st.session_state:
+    st.session_state.results = None
 
 if 'scraping_status' not in st.session_state:
     st.session_state.scraping_status = None
@@ -26,6 +91,10 @@ if 'scraping_status' not in st.session_state:
 if 'demo_mode' not in st.session_state:
     st.session_state.demo_mode = False
 
+# Background scrape of this session, if one is running
+if 'job_id' not in st.session_state:
+    st.session_state.job_id = None
+
 # Main title
 st.title("🔍 Reddit Scraper")
 st.markdown("Extract and export subreddit posts with filtering options")
@@ -33,8 +102,11 @@ st.markdown("Extract and export subreddit posts with filtering options")
 # Sidebar configuration
 st.sidebar.header("Reddit API Setup")
 
+# API health is cached on the scraper, so this costs no request on most reruns
+api_connected = st.session_state.scraper.check_api_status()
+
 # API credentials section
-with st.sidebar.expander("🔑 Enter Reddit API Credentials", expanded=not st.session_state.scraper.check_api_status()):
+with st.sidebar.expander("🔑 Enter Reddit API Credentials", expanded=not api_connected):
     st.markdown("**Get free Reddit API access:**")
     st.markdown("1. Go to [reddit.com/prefs/apps](https://www.reddit.com/prefs/apps)")
     st.markdown("2. Click 'Create App' → Select 'script'")
@@ -74,10 +146,10 @@ with st.sidebar.expander("🔑 Enter Reddit API Credentials", expanded=not st.se
             st.info("🎭 Demo mode enabled - showing sample data")
 
 # Clear demo mode when API is connected
-if st.session_state.demo_mode and st.session_state.scraper.check_api_status():
+if st.session_state.demo_mode and api_connected:
     if st.sidebar.button("🔄 Switch to Real Data"):
         st.session_state.demo_mode = False
-        st.session_state.scraped_data = None
+        st.session_state.results = None
         st.rerun()
 
 st.sidebar.markdown("---")
@@ -87,9 +159,11 @@ st.sidebar.header("Scraping Configuration")
 subreddit_name = st.sidebar.text_input(
     "Subreddit Name",
     placeholder="e.g., python, technology, news",
-    help="Enter the subreddit name without 'r/'"
+    help="Enter the subreddit name without 'r/'. Separate several names with commas to scrape them together."
 )
 
+subreddit_names = [name.strip() for name in subreddit_name.split(",") if name.strip()]
+
 # Post type selection
 post_type = st.sidebar.selectbox(
     "Post Type",
@@ -109,125 +183,220 @@ time_filter = st.sidebar.selectbox(
 num_posts = st.sidebar.slider(
     "Number of Posts",
     min_value=10,
-    max_value=100,
+    max_value=1000,
     value=25,
     step=5,
-    help="Number of posts to scrape (respects Reddit's rate limits)"
+    help="Number of posts to scrape (respects Reddit's rate limits). Reddit lists at most ~1000 posts per sort."
+)
+
+# Article extraction runs behind the scrape and never slows it down
+enrich_links = st.sidebar.checkbox(
+    "Fetch linked articles",
+    value=False,
+    help="Download the pages link posts point to and extract their text in the background"
 )
+st.session_state.scraper.enricher = get_link_enricher() if enrich_links else None
 
 # Scrape button
 scrape_button = st.sidebar.button("🚀 Scrape Posts", type="primary")
 
 # Reddit API status check
 st.sidebar.markdown("### API Status")
-if st.session_state.scraper.check_api_status():
+if api_connected:
     st.sidebar.success("✅ Reddit API Connected")
 else:
     st.sidebar.error("❌ Reddit API Not Connected")
     st.sidebar.markdown("Enter your credentials above to start scraping!")
 
+# Instrumentation is process-wide and nearly free while off
+metrics.enabled = st.sidebar.checkbox(
+    "🩺 Diagnostics",
+    value=metrics.enabled,
+    help="Record request latencies, rate-limit waits, stage timings and cache hit rates"
+)
+
+# Saved posts from earlier scrapes survive page reloads
+saved_subreddits = post_store.subreddits()
+if saved_subreddits:
+    st.sidebar.markdown("### Saved Posts")
+    browse_subreddits = st.sidebar.multiselect(
+        "Saved subreddits",
+        saved_subreddits,
+        help="Browse posts stored by earlier scrapes without hitting the API"
+    )
+    if st.sidebar.button("📂 Load Saved Posts") and browse_subreddits:
+        st.session_state.results = {'demo': False, 'subreddits': browse_subreddits}
+
 # Main content area
 if scrape_button and (subreddit_name or st.session_state.demo_mode):
     # Handle demo mode
     if st.session_state.demo_mode:
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-        
-        status_text.text("🎭 Generating demo data...")
-        progress_bar.progress(30)
-        time.sleep(0.5)
-        
         demo_subreddit = subreddit_name if subreddit_name else "demo"
         scraped_data = st.session_state.scraper.get_demo_data(demo_subreddit, post_type, num_posts)
         
-        progress_bar.progress(80)
-        status_text.text("✅ Demo data ready!")
-        time.sleep(0.5)
-        
-        st.session_state.scraped_data = scraped_data
+        # Each demo run replaces the previous sample data
+        st.session_state.demo_store = PostStore(":memory:")
+        st.session_state.demo_store.upsert_posts(scraped_data)
+        st.session_state.results = {'demo': True, 'subreddits': [demo_subreddit]}
         st.session_state.scraping_status = "demo_success"
-        progress_bar.progress(100)
-        status_text.text("🎉 Demo data loaded successfully!")
-        time.sleep(1)
-        progress_bar.empty()
-        status_text.empty()
         
         st.info("🎭 You're viewing demo data. Enter your Reddit API credentials to scrape real posts!")
         
     # Handle real Reddit API scraping
-    elif not st.session_state.scraper.check_api_status():
+    elif not api_connected:
         st.error("Cannot connect to Reddit API. Please enter your credentials above or try demo mode.")
+    
     else:
-        # Create progress indicators
-        progress_bar = st.progress(0)
-        status_text = st.empty()
+        # A new scrape replaces this session's previous one
+        previous_job = job_runner.get(st.session_state.job_id) if st.session_state.job_id else None
+        if previous_job is not None:
+            previous_job.cancel()
         
-        try:
-            status_text.text("🔍 Initializing scraper...")
-            progress_bar.progress(10)
-            
-            status_text.text(f"📡 Connecting to r/{subreddit_name}...")
-            progress_bar.progress(30)
-            
-            # Perform scraping
-            status_text.text("📊 Scraping posts...")
-            progress_bar.progress(50)
-            
-            scraped_data = st.session_state.scraper.scrape_subreddit(
-                subreddit_name, 
-                post_type, 
-                num_posts,
-                time_filter if post_type == "top" else "all"
-            )
-            
-            progress_bar.progress(80)
-            status_text.text("✅ Processing data...")
-            
-            if scraped_data and not scraped_data.empty:
-                st.session_state.scraped_data = scraped_data
-                st.session_state.scraping_status = "success"
-                progress_bar.progress(100)
-                status_text.text("🎉 Scraping completed successfully!")
-                time.sleep(1)
-                progress_bar.empty()
-                status_text.empty()
-            else:
-                st.session_state.scraping_status = "no_data"
-                progress_bar.empty()
-                status_text.empty()
-                st.warning(f"No posts found in r/{subreddit_name}. The subreddit might be empty or private.")
-                
-        except Exception as e:
-            st.session_state.scraping_status = "error"
-            progress_bar.empty()
-            status_text.empty()
-            st.error(f"Error scraping r/{subreddit_name}: {str(e)}")
+        # Scrape in the background; pages land in the store and show up as they arrive
+        job = job_runner.submit(
+            st.session_state.scraper,
+            subreddit_names,
+            post_type,
+            num_posts,
+            time_filter if post_type == "top" else "all"
+        )
+        st.session_state.job_id = job.job_id
+        st.session_state.job_pages_shown = 0
+        # Only this scrape's posts, not everything stored for these subreddits by earlier runs
+        st.session_state.results = {'demo': False, 'subreddits': subreddit_names, 'post_ids': job.post_ids}
+        st.session_state.scraping_status = "running"
 
 elif scrape_button and not subreddit_name and not st.session_state.demo_mode:
     st.warning("Please enter a subreddit name or try demo mode first!")
 
-# Display results
-if st.session_state.scraped_data is not None and not st.session_state.scraped_data.empty:
-    df = st.session_state.scraped_data
+
+@st.fragment(run_every=1.0)
+def show_job_progress():
+    """Poll the background scrape and refresh the page when new posts arrive."""
+    job = job_runner.get(st.session_state.job_id)
+    if job is None:
+        st.session_state.job_id = None
+        return
+    
+    snapshot = job.snapshot()
+    names = ", ".join(f"r/{name}" for name in snapshot['subreddits'])
+    
+    if not job.finished:
+        st.progress(
+            snapshot['progress'],
+            text=f"📊 Scraping {names}: {snapshot['fetched']} posts from {snapshot['pages']} pages "
+                 f"({snapshot['elapsed']:.0f}s)"
+        )
+        if st.button("⏹️ Cancel scrape"):
+            job.cancel()
+        
+        # Rerun the whole page so the results view picks up the newly stored posts
+        if snapshot['pages'] > st.session_state.job_pages_shown:
+            st.session_state.job_pages_shown = snapshot['pages']
+            st.rerun(scope="app")
+        return
     
+    st.session_state.job_id = None
+    if snapshot['status'] == "done" and snapshot['fetched']:
+        st.session_state.scraping_status = "success"
+    elif snapshot['status'] == "done":
+        st.session_state.scraping_status = "no_data"
+    else:
+        st.session_state.scraping_status = snapshot['status']
+    # Shown once on the rerun below
+    st.session_state.job_outcome = snapshot
+    st.rerun(scope="app")
+
+
+if st.session_state.job_id is not None:
+    show_job_progress()
+
+# Outcome of the background scrape that just finished
+job_outcome = st.session_state.pop('job_outcome', None)
+if job_outcome is not None:
+    for error in job_outcome['errors']:
+        if error['error_type'] in ("NotFound", "Private"):
+            st.warning(f"r/{error['subreddit']}: {error['error']}")
+        elif error['error_type'] in ("RateLimited", "CircuitOpen"):
+            st.error(f"Reddit is throttling requests for r/{error['subreddit']}. Try again shortly.")
+        else:
+            st.error(f"Error scraping r/{error['subreddit']}: {error['error']}")
+    
+    if job_outcome['status'] == "cancelled":
+        st.info("Scrape cancelled. Posts fetched before cancelling were kept.")
+    elif not job_outcome['fetched'] and not job_outcome['errors']:
+        st.warning(f"No posts found in {', '.join(f'r/{name}' for name in job_outcome['subreddits'])}. "
+                   "The subreddit might be empty or private.")
+    elif job_outcome['fetched']:
+        st.success(f"🎉 Scraped {job_outcome['fetched']} posts in {job_outcome['elapsed']:.1f}s")
+
+# Display results
+if st.session_state.results is not None:
+    results = st.session_state.results
+    results_store = st.session_state.demo_store if results['demo'] else post_store
+    result_subreddits = results['subreddits']
+    # The job keeps appending to its list, so take a copy per rerun
+    result_post_ids = list(results['post_ids']) if results.get('post_ids') is not None else None
+    summary = results_store.summary(result_subreddits, post_ids=result_post_ids)
+else:
+    summary = None
+
+if summary is not None and summary['total_posts'] > 0:
     # Summary metrics
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Total Posts", len(df))
+        st.metric("Total Posts", summary['total_posts'])
     
     with col2:
-        avg_score = df['score'].mean()
+        avg_score = summary['avg_score']
         st.metric("Avg Score", f"{avg_score:.1f}")
     
     with col3:
-        total_comments = df['num_comments'].sum()
+        total_comments = summary['total_comments']
         st.metric("Total Comments", f"{total_comments:,}")
     
     with col4:
-        avg_upvote_ratio = df['upvote_ratio'].mean() * 100
+        avg_upvote_ratio = summary['avg_upvote_ratio'] * 100
         st.metric("Avg Upvote %", f"{avg_upvote_ratio:.1f}%")
     
+    # Rollups are maintained as posts are stored, so this reads a few bucket rows, not the post history
+    with st.expander("📈 Activity"):
+        window_label = st.radio("Buckets", ["Hourly", "Daily"], horizontal=True)
+        window = 3600 if window_label == "Hourly" else 86400
+        activity = results_store.query_rollups("subreddit", window, keys=result_subreddits)
+        
+        if activity.empty:
+            st.info("No activity recorded yet.")
+        else:
+            chart_data = activity.pivot_table(
+                index='bucket_date', columns='key', values=['posts_per_hour', 'score_velocity', 'comment_growth'],
+                aggfunc='sum'
+            )
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.markdown("**Posts per hour**")
+                st.line_chart(chart_data['posts_per_hour'])
+            with col2:
+                st.markdown("**Score velocity** (points/hour)")
+                st.line_chart(chart_data['score_velocity'])
+            with col3:
+                st.markdown("**Comment growth** (comments/hour)")
+                st.line_chart(chart_data['comment_growth'])
+            st.caption("Velocity and growth come from posts seen in more than one scrape or snapshot.")
+            
+            # Most active authors of the last day, across all stored subreddits
+            authors = results_store.query_rollups("author", 3600, since_utc=datetime.now().timestamp() - 86400)
+            if not authors.empty:
+                st.markdown("**Most active authors (24h, all stored subreddits)**")
+                st.dataframe(
+                    authors.groupby('key')[['posts', 'score', 'comments', 'score_gained']].sum()
+                    .nlargest(10, ['posts', 'score'])
+                    .rename_axis('author')
+                    .reset_index(),
+                    hide_index=True
+                )
+    
     st.markdown("---")
     
     # Filters
@@ -252,38 +421,71 @@ if st.session_state.scraped_data is not None and not st.session_state.scraped_da
             help="Filter posts by minimum number of comments"
         )
     
-    # Apply filters
-    filtered_df = df[
-        (df['score'] >= min_score) & 
-        (df['num_comments'] >= min_comments)
-    ]
+    view_mode = st.radio(
+        "View",
+        ["Table", "Cards"],
+        horizontal=True,
+        help="Table shows 500 posts per page in a sortable grid; Cards shows 10 posts per page with previews"
+    )
+    
+    # Filtering, counting and paging run in SQL, so only the visible page is ever loaded
+    filters = {
+        'subreddits': result_subreddits,
+        'min_score': min_score,
+        'min_comments': min_comments,
+        'post_ids': result_post_ids
+    }
+    filtered_count = results_store.count_posts(**filters)
     
-    if len(filtered_df) == 0:
+    if filtered_count == 0:
         st.warning("No posts match the current filters.")
     else:
         # Display filtered count
-        if len(filtered_df) < len(df):
-            st.info(f"Showing {len(filtered_df)} of {len(df)} posts after filtering")
+        if filtered_count < summary['total_posts']:
+            st.info(f"Showing {filtered_count} of {summary['total_posts']} posts after filtering")
         
-        # Export functionality
+        # Export functionality: files are only built once the user asks for them, and only the latest is kept
         col1, col2 = st.columns([3, 1])
         
         with col2:
-            csv_data = filtered_df.to_csv(index=False)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"reddit_{subreddit_name}_{timestamp}.csv"
-            
-            st.download_button(
-                label="📥 Export to CSV",
-                data=csv_data,
-                file_name=filename,
-                mime="text/csv",
-                help="Download the filtered data as CSV file"
+            filename = f"reddit_{'_'.join(result_subreddits)}_{datetime.now():%Y%m%d_%H%M%S}"
+            export_key = (
+                id(results_store), results_store.version(), tuple(result_subreddits), min_score, min_comments,
+                None if result_post_ids is None else len(result_post_ids)
             )
+            export = st.session_state.get('export')
+            
+            if export is None or export['key'] != export_key:
+                if st.button("📦 Prepare Export", help="Build CSV and Parquet files of the filtered posts"):
+                    with metrics.time('export'):
+                        export_df = results_store.query_posts(**filters)
+                        export = st.session_state.export = {
+                            'key': export_key,
+                            'csv': export_df.to_csv(index=False),
+                            'parquet': to_parquet_bytes(export_df)
+                        }
+            
+            if export is not None and export['key'] == export_key:
+                st.download_button(
+                    label="📥 Export to CSV",
+                    data=export['csv'],
+                    file_name=f"{filename}.csv",
+                    mime="text/csv",
+                    help="Download the filtered data as CSV file"
+                )
+                
+                st.download_button(
+                    label="📥 Export to Parquet",
+                    data=export['parquet'],
+                    file_name=f"{filename}.parquet",
+                    mime="application/vnd.apache.parquet",
+                    help="Download the filtered data as a compressed, typed Parquet file"
+                )
         
         # Pagination
-        posts_per_page = 10
-        total_pages = (len(filtered_df) - 1) // posts_per_page + 1
+        posts_per_page = 500 if view_mode == "Table" else 10
+        total_pages = (filtered_count - 1) // posts_per_page + 1
+        page = 1
         
         if total_pages > 1:
             page = st.selectbox(
@@ -291,56 +493,151 @@ if st.session_state.scraped_data is not None and not st.session_state.scraped_da
                 range(1, total_pages + 1),
                 format_func=lambda x: f"Page {x} of {total_pages}"
             )
-            
-            start_idx = (page - 1) * posts_per_page
-            end_idx = start_idx + posts_per_page
-            page_df = filtered_df.iloc[start_idx:end_idx]
+        
+        page_df = results_store.query_posts(**filters, limit=posts_per_page, offset=(page - 1) * posts_per_page)
+        
+        if view_mode == "Table":
+            # One virtualized grid instead of a dozen widgets per post
+            st.dataframe(
+                page_df,
+                column_order=[
+                    'title', 'subreddit', 'score', 'num_comments', 'upvote_ratio', 'author', 'created_date',
+                    'is_self', 'permalink', 'url'
+                ],
+                column_config={
+                    'title': st.column_config.TextColumn("Title", width="large"),
+                    'subreddit': st.column_config.TextColumn("Subreddit"),
+                    'score': st.column_config.NumberColumn("Score", format="%d"),
+                    'num_comments': st.column_config.NumberColumn("Comments", format="%d"),
+                    'upvote_ratio': st.column_config.ProgressColumn(
+                        "Upvote Ratio", min_value=0.0, max_value=1.0, format="%.2f"
+                    ),
+                    'author': st.column_config.TextColumn("Author"),
+                    'created_date': st.column_config.DatetimeColumn("Created (UTC)", format="YYYY-MM-DD HH:mm"),
+                    'is_self': st.column_config.CheckboxColumn("Text Post"),
+                    'permalink': st.column_config.LinkColumn("Thread", display_text="Open"),
+                    'url': st.column_config.LinkColumn("Link")
+                },
+                hide_index=True,
+                height=600
+            )
         else:
-            page_df = filtered_df
+            # Article text extracted for this page's link posts, if any
+            articles = results_store.query_link_content(page_df.loc[~page_df['is_self'], 'url'])
+            articles = articles[articles['status'] == 'ok'].set_index('url')
+            
+            # Display posts
+            for idx, row in page_df.iterrows():
+                with st.container():
+                    # Post header
+                    col1, col2, col3 = st.columns([3, 1, 1])
+                    
+                    with col1:
+                        st.markdown(f"### [{row['title']}]({row['url']})")
+                    
+                    with col2:
+                        st.metric("Score", row['score'])
+                    
+                    with col3:
+                        st.metric("Comments", row['num_comments'])
+                    
+                    # Post metadata
+                    col1, col2, col3, col4 = st.columns(4)
+                    
+                    with col1:
+                        st.text(f"👤 u/{row['author']}")
+                    
+                    with col2:
+                        st.text(f"📅 {row['created_date']:%Y-%m-%d %H:%M} UTC")
+                    
+                    with col3:
+                        st.text(f"⬆️ {row['upvote_ratio']:.1%}")
+                    
+                    with col4:
+                        if row['is_self']:
+                            st.text("📝 Text Post")
+                        else:
+                            st.text("🔗 Link Post")
+                    
+                    # Post content preview
+                    if row['selftext'] and len(row['selftext']) > 0:
+                        preview = row['selftext'][:200] + "..." if len(row['selftext']) > 200 else row['selftext']
+                        st.markdown(f"**Content Preview:** {preview}")
+                    
+                    # Post URL if it's a link post
+                    if not row['is_self'] and row['url']:
+                        st.markdown(f"**Link:** {row['url']}")
+                        
+                        if row['url'] in articles.index:
+                            with st.expander("📰 Article text"):
+                                st.text(articles.at[row['url'], 'text'])
+                    
+                    st.markdown("---")
+
+if metrics.enabled:
+    with st.expander("🩺 Diagnostics", expanded=True):
+        stats = st.session_state.scraper.stats()
+        snapshot = stats['metrics']
+        requests_total = sum(snapshot['counters'].get('http_requests_total', {}).values())
+        latencies = [
+            summary for summary in snapshot['histograms'].get('http_request_seconds', {}).values()
+            if summary['count']
+        ]
+        waits = snapshot['histograms'].get('rate_limit_wait_seconds', {}).get('')
         
-        # Display posts
-        for idx, row in page_df.iterrows():
-            with st.container():
-                # Post header
-                col1, col2, col3 = st.columns([3, 1, 1])
-                
-                with col1:
-                    st.markdown(f"### [{row['title']}]({row['url']})")
-                
-                with col2:
-                    st.metric("Score", row['score'])
-                
-                with col3:
-                    st.metric("Comments", row['num_comments'])
-                
-                # Post metadata
-                col1, col2, col3, col4 = st.columns(4)
-                
-                with col1:
-                    st.text(f"👤 u/{row['author']}")
-                
-                with col2:
-                    st.text(f"📅 {row['created_date']}")
-                
-                with col3:
-                    st.text(f"⬆️ {row['upvote_ratio']:.1%}")
-                
-                with col4:
-                    if row['is_self']:
-                        st.text("📝 Text Post")
-                    else:
-                        st.text("🔗 Link Post")
-                
-                # Post content preview
-                if row['selftext'] and len(row['selftext']) > 0:
-                    preview = row['selftext'][:200] + "..." if len(row['selftext']) > 200 else row['selftext']
-                    st.markdown(f"**Content Preview:** {preview}")
-                
-                # Post URL if it's a link post
-                if not row['is_self'] and row['url']:
-                    st.markdown(f"**Link:** {row['url']}")
-                
-                st.markdown("---")
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("HTTP Requests", f"{requests_total:,}")
+        with col2:
+            # Latency of the busiest backend
+            busiest = max(latencies, key=lambda summary: summary['count']) if latencies else None
+            st.metric("Latency p50 / p95", f"{busiest['p50'] * 1000:.0f} / {busiest['p95'] * 1000:.0f} ms"
+                      if busiest else "–")
+        with col3:
+            st.metric("Rate-limit Wait", f"{waits['sum']:.1f}s" if waits else "0.0s")
+        with col4:
+            st.metric("Posts/sec (1 min)", f"{snapshot['posts_per_second']:.0f}")
+        
+        stages = snapshot['stages']
+        if stages:
+            st.markdown("**Stage timings**")
+            st.dataframe(
+                pd.DataFrame([
+                    {
+                        'stage': stage,
+                        'calls': summary['count'],
+                        'total_s': summary['sum'],
+                        'mean_ms': summary['mean'] * 1000,
+                        'p95_ms': summary['p95'] * 1000
+                    }
+                    for stage, summary in stages.items()
+                ]).sort_values('total_s', ascending=False),
+                hide_index=True
+            )
+        
+        hit_rates = {name: rate for name, rate in stats['hit_rates'].items() if rate is not None}
+        statuses = snapshot['counters'].get('http_requests_total', {})
+        st.markdown(
+            "**Cache hit rates:** "
+            + (", ".join(f"{name.replace('_', ' ')} {rate:.0%}" for name, rate in hit_rates.items()) or "no caches")
+            + f" · **Retries:** {stats['retries']['retries']}"
+            + (f" · **Responses:** " + ", ".join(f"{labels} × {count}" for labels, count in statuses.items())
+               if statuses else "")
+        )
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.download_button(
+                label="📥 Prometheus metrics",
+                data=st.session_state.scraper.prometheus(),
+                file_name="reddit_scraper.prom",
+                mime="text/plain",
+                help="Metrics in the Prometheus text format, e.g. for node_exporter's textfile collector"
+            )
+        with col2:
+            if st.button("🔄 Reset Metrics"):
+                metrics.reset()
+                st.rerun()
 
 # Footer
 st.markdown("---")
@@ -382,6 +679,7 @@ with st.expander("ℹ️ How to Use"):
     - Number of comments
     - Creation date and time
     - Post content (for text posts)
+    - Article text of linked pages (with "Fetch linked articles" enabled)
     - Post type (text/link)
     
     ### Free & Legal
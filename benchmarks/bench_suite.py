@@ -0,0 +1,131 @@
+"""
+Offline benchmark suite for the scraping, search, normalization, merge, storage and export paths.
+
+Listings are replayed by the local fake Reddit server and bulk data comes
+from the seeded synthetic generator, so every run sees the same input and
+no network access is needed. The benchmarks use pytest-benchmark's
+``benchmark`` fixture; without the plugin, benchmarks/conftest.py times
+them with a simple timer instead. With pytest-benchmark, save a run as a
+baseline and fail later runs that regress against it:
+
+    pytest benchmarks --benchmark-autosave
+    pytest benchmarks --benchmark-compare --benchmark-compare-fail=median:20%
+"""
+import os
+import time
+
+import pytest
+
+from fake_reddit import FakeReddit, load_fixture, make_scraper
+from json_listing import listing_to_frame
+from normalize import merge_sorted, order_posts, posts_to_frame
+from post_store import PostStore
+from synthetic import synthetic_comments, synthetic_posts
+
+# Posts per scrape (max 1000); the local data sets scale with it
+POSTS = 1000
+
+# Queries for the local search benchmark; they all hit the synthetic titles
+SEARCH_QUERIES = ["python", "machine learning", "sourdough", "debugging", "chess OR astronomy"]
+
+
+def run(benchmark, func):
+    """Benchmark ``func``, which returns the number of items it processed, and record the count."""
+    items = benchmark(func)
+    benchmark.extra_info['items'] = items
+    return items
+
+
+@pytest.fixture(scope="module")
+def server():
+    with FakeReddit(depth=POSTS) as server:
+        yield server
+
+
+@pytest.fixture(scope="module")
+def frame():
+    return synthetic_posts(POSTS * 10, ["python", "rust", "news"], seed=2)
+
+
+@pytest.fixture(scope="module")
+def local_scraper(frame, tmp_path_factory):
+    """JSON-backend scraper over a store holding ``frame``; it never reaches the network."""
+    store = PostStore(str(tmp_path_factory.mktemp("bench") / "bench.db"))
+    store.upsert_posts(frame)
+    scraper = make_scraper("http://127.0.0.1:9", "json")
+    scraper.store = store
+    yield scraper
+    store.close()
+
+
+@pytest.mark.parametrize("backend", ["praw", "json"])
+def test_scrape(benchmark, server, backend):
+    scraper = make_scraper(server.url, backend)
+
+    def scrape():
+        df = scraper.scrape_subreddit("Python", "new", POSTS)
+        assert len(df) == POSTS, f"scrape returned {len(df)} posts"
+        return len(df)
+
+    run(benchmark, scrape)
+
+
+@pytest.mark.parametrize("backend", ["praw", "json"])
+def test_search_remote(benchmark, server, backend):
+    scraper = make_scraper(server.url, backend)
+    run(benchmark, lambda: len(scraper.search_posts("Python", "python", "new", limit=POSTS, source="reddit")))
+
+
+def test_normalize_listing(benchmark):
+    children = load_fixture()['data']['children']
+    children = (children * (POSTS // len(children) + 1))[:POSTS]
+    run(benchmark, lambda: len(listing_to_frame(children)))
+
+
+def test_normalize_records(benchmark):
+    records = synthetic_posts(POSTS, seed=1).to_dict('records')
+    run(benchmark, lambda: len(posts_to_frame(records)))
+
+
+@pytest.mark.parametrize("top", [None, POSTS], ids=["all", "top"])
+def test_merge_sorted(benchmark, top):
+    runs = [order_posts(synthetic_posts(POSTS * 10, [f"sub{index}"], seed=index)) for index in range(10)]
+    run(benchmark, lambda: len(merge_sorted(runs, top=top)))
+
+
+def test_search_local(benchmark, local_scraper):
+    run(benchmark, lambda: sum(
+        len(local_scraper.search_posts("python", query, limit=100, source="local")) for query in SEARCH_QUERIES
+    ))
+
+
+def test_store_posts(benchmark, frame):
+    def store_posts():
+        target = PostStore(":memory:")
+        try:
+            # Insert in scrape-sized batches, then re-scrape everything so the rollups see score changes
+            for _ in range(2):
+                for start in range(0, len(frame), 100):
+                    target.upsert_posts(frame.iloc[start:start + 100])
+        finally:
+            target.close()
+        return 2 * len(frame)
+
+    run(benchmark, store_posts)
+
+
+def test_generate_posts(benchmark):
+    run(benchmark, lambda: len(synthetic_posts(POSTS * 10, seed=3)))
+
+
+def test_generate_comments(benchmark, frame):
+    run(benchmark, lambda: len(synthetic_comments(frame.head(POSTS), seed=3)))
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "arrow", "ndjson", "csv"])
+def test_export(benchmark, local_scraper, frame, tmp_path, fmt):
+    def export():
+        path = os.path.join(tmp_path, f"export_{fmt}_{time.perf_counter_ns()}")
+        return local_scraper.export(frame, path, fmt)
+
+    run(benchmark, export)
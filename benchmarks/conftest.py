@@ -0,0 +1,69 @@
+import os
+import statistics
+import sys
+import time
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The modules live at the repository root; the fake Reddit server is shared with the tests
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "tests"))
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    pytest_benchmark = None
+
+# Timed calls per benchmark when pytest-benchmark is not installed
+FALLBACK_ROUNDS = 5
+
+
+class SimpleBenchmark:
+    """
+    Stand-in for pytest-benchmark's ``benchmark`` fixture.
+
+    Calls the function a fixed number of times and keeps the median and
+    minimum duration, so the benchmarks still run and report without the
+    plugin. Saving and comparing baselines needs pytest-benchmark.
+    """
+
+    def __init__(self, name, rounds=FALLBACK_ROUNDS):
+        self.name = name
+        self.rounds = rounds
+        self.extra_info = {}
+        self.stats = None
+
+    def __call__(self, func, *args, **kwargs):
+        durations = []
+        result = None
+        for _ in range(self.rounds):
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            durations.append(time.perf_counter() - start)
+        self.stats = {'median': statistics.median(durations), 'min': min(durations)}
+        return result
+
+
+if pytest_benchmark is None:
+    _results = []
+
+    @pytest.fixture
+    def benchmark(request):
+        bench = SimpleBenchmark(request.node.name)
+        yield bench
+        if bench.stats is not None:
+            _results.append(bench)
+
+    def pytest_terminal_summary(terminalreporter):
+        if not _results:
+            return
+        terminalreporter.section("benchmarks (simple timer; install pytest-benchmark for full stats)")
+        terminalreporter.write_line(f"{'benchmark':<40} {'median s':>10} {'min s':>10} {'items/s':>12}")
+        for bench in _results:
+            items = bench.extra_info.get('items', 0)
+            rate = items / bench.stats['median'] if bench.stats['median'] else 0.0
+            terminalreporter.write_line(
+                f"{bench.name:<40} {bench.stats['median']:>10.4f} {bench.stats['min']:>10.4f} {rate:>12.0f}"
+            )
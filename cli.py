@@ -0,0 +1,368 @@
+"""
+Headless job runner for scheduled bulk scrapes.
+
+    python cli.py job.toml
+    python cli.py job.yaml --workers 16
+    python cli.py job.toml --metrics scrape.prom
+
+A job spec lists what to scrape and where to stream it. String values may
+reference environment variables as ``${NAME}``; without ``credentials`` the
+``REDDIT_CLIENT_ID``/``REDDIT_CLIENT_SECRET`` variables are used.
+
+    [reddit]
+    backend = "json"                  # or "praw"
+    http_cache = "http_cache.db"      # optional
+    credentials = [
+        { client_id = "${APP1_ID}", client_secret = "${APP1_SECRET}" },
+        { client_id = "${APP2_ID}", client_secret = "${APP2_SECRET}" },
+    ]
+
+    [job]
+    subreddits = ["python", "rust"]
+    sorts = ["hot", "top"]
+    limit = 500
+    time_filter = "week"
+    max_workers = 8
+
+    [[sinks]]
+    type = "parquet"                  # parquet, arrow, ndjson, csv or sqlite
+    path = "out/posts"
+
+    [enrich]                          # optional: extract the text of linked articles
+    max_workers = 8                   # into the first sqlite sink's link_content table
+    per_domain = 2
+    domain_interval = 1.0
+    timeout = 10
+
+YAML specs need PyYAML installed.
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+import tomllib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from exporters import EXPORT_FORMATS, open_writer
+from metrics import DISABLED, Metrics, write_prometheus
+from post_store import PostStore
+from reddit_scraper import MAX_LISTING_DEPTH, RedditScraper
+
+SINK_TYPES = EXPORT_FORMATS + ('sqlite',)
+
+
+def _expand(value):
+    """Expand ``${NAME}`` references in every string of a spec."""
+    if isinstance(value, str):
+        return os.path.expandvars(value)
+    if isinstance(value, list):
+        return [_expand(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _expand(item) for key, item in value.items()}
+    return value
+
+
+def load_job(path):
+    """
+    Read and validate a job spec.
+
+    Args:
+        path (str): TOML (.toml) or YAML (.yaml/.yml) file
+
+    Returns:
+        dict: Spec with 'reddit', 'job' and 'sinks' sections and defaults filled in
+    """
+    if path.endswith(('.yaml', '.yml')):
+        try:
+            import yaml
+        except ImportError:
+            raise Exception("YAML job specs need PyYAML: pip install pyyaml")
+        with open(path, 'r', encoding='utf-8') as f:
+            spec = yaml.safe_load(f) or {}
+    else:
+        with open(path, 'rb') as f:
+            spec = tomllib.load(f)
+
+    spec = _expand(spec)
+    reddit = spec.setdefault('reddit', {})
+    job = spec.setdefault('job', {})
+    sinks = spec.setdefault('sinks', [])
+
+    if not job.get('subreddits'):
+        raise Exception(f"{path}: job.subreddits is required")
+    if isinstance(job['subreddits'], str):
+        job['subreddits'] = [name.strip() for name in job['subreddits'].split(',') if name.strip()]
+
+    job.setdefault('sorts', ['hot'])
+    job.setdefault('limit', 100)
+    job.setdefault('time_filter', 'all')
+    job.setdefault('max_workers', 8)
+    job['limit'] = min(int(job['limit']), MAX_LISTING_DEPTH)
+
+    for sort in job['sorts']:
+        if sort not in ('hot', 'new', 'top'):
+            raise Exception(f"{path}: invalid sort '{sort}'")
+
+    if not sinks:
+        raise Exception(f"{path}: at least one [[sinks]] entry is required")
+    for sink in sinks:
+        if sink.get('type') not in SINK_TYPES:
+            raise Exception(f"{path}: sink type must be one of {', '.join(SINK_TYPES)}")
+        if not sink.get('path'):
+            raise Exception(f"{path}: every sink needs a path")
+
+    enrich = spec.get('enrich')
+    if enrich is not None:
+        if not any(sink['type'] == 'sqlite' for sink in sinks):
+            raise Exception(f"{path}: [enrich] needs a sqlite sink to store the extracted content in")
+        unknown = set(enrich) - {'max_workers', 'per_domain', 'domain_interval', 'timeout', 'max_bytes'}
+        if unknown:
+            raise Exception(f"{path}: unknown [enrich] options: {', '.join(sorted(unknown))}")
+
+    reddit.setdefault('backend', 'json')
+    if not reddit.get('credentials') and os.environ.get('REDDIT_CLIENT_ID'):
+        reddit['credentials'] = [{
+            'client_id': os.environ['REDDIT_CLIENT_ID'],
+            'client_secret': os.environ.get('REDDIT_CLIENT_SECRET', '')
+        }]
+
+    return spec
+
+
+class SinkSet:
+    """
+    Fans each batch out to every configured sink.
+
+    Workers call ``write`` concurrently; writes are serialized with a lock
+    because the file writers are not thread-safe. A post listed by more
+    than one sort is only written once.
+    """
+
+    def __init__(self, sinks, dedupe=True, metrics=DISABLED):
+        """
+        Open every sink.
+
+        Args:
+            sinks (list): Sink dicts with 'type', 'path' and optional 'compression'
+            dedupe (bool): Skip posts already written by this job
+            metrics (Metrics): Receives the time spent writing as the 'export' stage
+        """
+        self.writers = []
+        self.stores = []
+        for sink in sinks:
+            if sink['type'] == 'sqlite':
+                self.stores.append(PostStore(sink['path']))
+            else:
+                self.writers.append(open_writer(sink['path'], sink['type'], sink.get('compression')))
+
+        self.dedupe = dedupe
+        self.metrics = metrics
+        self.rows_written = 0
+        self._seen = set()
+        self._lock = threading.Lock()
+
+    def write(self, df):
+        """
+        Write a batch of posts to every sink.
+
+        Returns:
+            int: Number of posts written (after de-duplication)
+        """
+        with self._lock:
+            if self.dedupe:
+                df = df[~df['post_id'].isin(self._seen)]
+                self._seen.update(df['post_id'])
+            if df.empty:
+                return 0
+
+            with self.metrics.time('export'):
+                for writer in self.writers:
+                    writer.write_batch(df)
+                for store in self.stores:
+                    store.upsert_posts(df)
+
+            self.rows_written += len(df)
+            return len(df)
+
+    def close(self):
+        """Flush and close every sink."""
+        for writer in self.writers:
+            writer.close()
+        for store in self.stores:
+            store.close()
+
+
+def build_scraper(reddit_spec, metrics=None):
+    """
+    Create and authenticate a scraper from the 'reddit' section of a spec.
+
+    Args:
+        reddit_spec (dict): The spec's 'reddit' section
+        metrics (Metrics): Instrumentation to record into, disabled if omitted
+
+    Returns:
+        RedditScraper: Connected scraper
+    """
+    cache = None
+    if reddit_spec.get('http_cache'):
+        from response_cache import ResponseCache
+        cache = ResponseCache(reddit_spec['http_cache'])
+
+    scraper = RedditScraper(backend=reddit_spec['backend'], cache=cache, metrics=metrics)
+    if reddit_spec.get('user_agent'):
+        scraper.user_agent = reddit_spec['user_agent']
+
+    if reddit_spec.get('credentials'):
+        if not scraper.setup_reddit_client(credentials=reddit_spec['credentials']):
+            raise Exception("Could not set up any Reddit client from the given credentials")
+    elif reddit_spec['backend'] != 'json':
+        raise Exception("The praw backend needs credentials (reddit.credentials or REDDIT_CLIENT_ID)")
+
+    return scraper
+
+
+def _run_task(scraper, sinks, subreddit, sort, limit, time_filter, enricher=None):
+    """Stream one listing into the sinks page by page; returns (fetched, written)."""
+    fetched = written = 0
+    for df in scraper.iter_frames(subreddit, sort, limit, time_filter):
+        fetched += len(df)
+        written += sinks.write(df)
+        if enricher is not None:
+            enricher.submit(df)
+    return fetched, written
+
+
+def run_job(spec, scraper=None, max_workers=None, log=None):
+    """
+    Run every (subreddit, sort) listing of a job concurrently.
+
+    Args:
+        spec (dict): Job spec as returned by load_job
+        scraper (RedditScraper): Pre-built scraper, built from the spec if omitted
+        max_workers (int): Override of job.max_workers
+        log (callable): Called with one progress line per finished listing
+
+    Returns:
+        dict: Run summary (counts, errors, timings, throughput)
+    """
+    job = spec['job']
+    scraper = scraper or build_scraper(spec['reddit'])
+    log = log or (lambda line: None)
+
+    tasks = [(subreddit, sort) for subreddit in dict.fromkeys(job['subreddits']) for sort in job['sorts']]
+    workers = max(1, min(max_workers or job['max_workers'], len(tasks)))
+    sinks = SinkSet(spec['sinks'], dedupe=job.get('dedupe', True), metrics=scraper.metrics)
+
+    enricher = None
+    if spec.get('enrich') is not None:
+        from link_content import LinkEnricher
+        enricher = LinkEnricher(store=sinks.stores[0], **spec['enrich'])
+
+    fetched = written = 0
+    errors = []
+    start = time.perf_counter()
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    _run_task, scraper, sinks, subreddit, sort, job['limit'], job['time_filter'], enricher
+                ): (subreddit, sort)
+                for subreddit, sort in tasks
+            }
+
+            for future in as_completed(futures):
+                subreddit, sort = futures[future]
+                try:
+                    task_fetched, task_written = future.result()
+                    fetched += task_fetched
+                    written += task_written
+                    log(f"r/{subreddit} {sort}: {task_fetched} posts ({task_written} new)")
+                except Exception as e:
+                    errors.append({'subreddit': subreddit, 'sort': sort, 'error': str(e),
+                                   'error_type': type(e).__name__})
+                    log(f"r/{subreddit} {sort}: FAILED {type(e).__name__}: {e}")
+
+        # Throughput covers the scrape only, not the enrichment tail
+        elapsed = time.perf_counter() - start
+
+        if enricher is not None:
+            log(f"waiting for {enricher.pending()} linked articles")
+            enricher.join()
+    finally:
+        if enricher is not None:
+            enricher.close()
+        sinks.close()
+
+    pool_stats = scraper.pool.stats()
+
+    return {
+        'tasks': len(tasks),
+        'failed': len(errors),
+        'posts_fetched': fetched,
+        'posts_written': written,
+        'elapsed': elapsed,
+        'posts_per_second': fetched / elapsed if elapsed > 0 else 0.0,
+        'requests': sum(client['requests'] for client in pool_stats) if pool_stats else None,
+        'rate_limit_wait': sum(client.rate_limiter.total_wait for client in scraper.pool.clients)
+        if pool_stats else scraper.rate_limiter.total_wait,
+        'retries': scraper.retry_policy.stats()['retries'],
+        'cache': scraper.cache.stats() if scraper.cache is not None else None,
+        'enrich': enricher.stats() if enricher is not None else None,
+        'stages': scraper.metrics.stage_totals() if scraper.metrics.enabled else None,
+        'errors': errors
+    }
+
+
+def format_summary(summary):
+    """Render a run summary as a few human-readable lines."""
+    lines = [
+        f"listings: {summary['tasks'] - summary['failed']}/{summary['tasks']} ok",
+        f"posts:    {summary['posts_fetched']} fetched, {summary['posts_written']} written",
+        f"time:     {summary['elapsed']:.1f}s ({summary['posts_per_second']:.0f} posts/s)",
+        f"waits:    {summary['rate_limit_wait']:.1f}s rate limit, {summary['retries']} retries"
+    ]
+    if summary['requests'] is not None:
+        lines.append(f"requests: {summary['requests']}")
+    if summary['cache'] is not None:
+        lines.append(f"cache:    {summary['cache']['hit_rate']:.0%} hit rate")
+    if summary.get('enrich') is not None:
+        enrich = summary['enrich']
+        lines.append(
+            f"links:    {enrich['extracted']} extracted, {enrich['cached']} cached, {enrich['empty']} without text, "
+            f"{enrich['failed']} failed"
+        )
+    if summary.get('stages'):
+        lines.append("stages:   " + ", ".join(f"{stage} {seconds:.2f}s" for stage, seconds in summary['stages'].items()))
+    for error in summary['errors']:
+        lines.append(f"error:    r/{error['subreddit']} {error['sort']}: {error['error']}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Command-line entry point; exits non-zero if any listing failed."""
+    parser = argparse.ArgumentParser(prog="python cli.py", description="Run a bulk scrape job.")
+    parser.add_argument("job", help="Job spec file (.toml, .yaml or .yml)")
+    parser.add_argument("--workers", type=int, help="Override job.max_workers")
+    parser.add_argument("--quiet", action="store_true", help="Only print the final summary")
+    parser.add_argument("--metrics", metavar="FILE", help="Record metrics and write them to FILE in Prometheus format")
+    args = parser.parse_args(argv)
+
+    try:
+        spec = load_job(args.job)
+        log = None if args.quiet else (lambda line: print(line, file=sys.stderr, flush=True))
+        scraper = build_scraper(spec['reddit'], metrics=Metrics() if args.metrics else None)
+        summary = run_job(spec, scraper=scraper, max_workers=args.workers, log=log)
+        if args.metrics:
+            write_prometheus(args.metrics, scraper.prometheus())
+    except Exception as e:
+        print(f"error: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    print(format_summary(summary))
+    sys.exit(1 if summary['failed'] else 0)
+
+
+if __name__ == "__main__":
+    main()
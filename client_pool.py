@@ -0,0 +1,151 @@
+import threading
+import time
+
+
+class ClientHealth:
+    """
+    Health record of one API client.
+
+    A client that fails ``failure_threshold`` times in a row, or once with a
+    fatal error such as rejected credentials, is benched for ``cooldown``
+    seconds and skipped by the pool in the meantime. Any success resets it.
+    """
+
+    def __init__(self, failure_threshold=3, cooldown=60.0, clock=time.monotonic):
+        """
+        Initialize the health record.
+
+        Args:
+            failure_threshold (int): Consecutive failures before the client is benched
+            cooldown (float): Seconds a benched client is skipped
+            clock (callable): Monotonic clock, overridable for testing
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.requests = 0
+        self.errors = 0
+        self.consecutive_failures = 0
+        self.benched_until = 0.0
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def record_success(self):
+        """Count a successful request."""
+        with self._lock:
+            self.requests += 1
+            self.consecutive_failures = 0
+            self.benched_until = 0.0
+
+    def record_failure(self, fatal=False):
+        """
+        Count a failed request.
+
+        Args:
+            fatal (bool): Bench the client immediately, e.g. on HTTP 401
+        """
+        with self._lock:
+            self.requests += 1
+            self.errors += 1
+            self.consecutive_failures += 1
+            if fatal or self.consecutive_failures >= self.failure_threshold:
+                self.benched_until = self._clock() + self.cooldown
+
+    def record_status(self, status_code):
+        """Record a response by status: 401 and 5xx count as failures."""
+        if status_code == 401:
+            self.record_failure(fatal=True)
+        elif status_code >= 500:
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def healthy(self):
+        """
+        Check whether the client may be scheduled.
+
+        Returns:
+            bool: False while the client is benched
+        """
+        return self._clock() >= self.benched_until
+
+
+class PooledClient:
+    """One set of credentials with its own PRAW client, request budget and health."""
+
+    def __init__(self, client_id, client_secret, reddit, rate_limiter, health):
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.reddit = reddit
+        self.rate_limiter = rate_limiter
+        self.health = health
+        self.json_client = None
+        self.last_used = 0.0
+
+
+class ClientPool:
+    """
+    Schedules work across several OAuth apps.
+
+    Reddit budgets requests per app, so each set of credentials has its own
+    RateLimiter. ``acquire`` hands out the healthy client with the most
+    remaining budget (least recently used on ties), so aggregate throughput
+    grows with the number of credentials. When every client is benched the
+    one that recovers first is used rather than failing outright.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        """
+        Initialize an empty pool.
+
+        Args:
+            clock (callable): Monotonic clock used for tie-breaking, overridable for testing
+        """
+        self.clients = []
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.clients)
+
+    def add(self, client):
+        """Add a PooledClient to the pool."""
+        with self._lock:
+            self.clients.append(client)
+
+    def acquire(self):
+        """
+        Pick the client to send the next unit of work through.
+
+        Returns:
+            PooledClient: Healthy client with the most remaining request budget
+        """
+        with self._lock:
+            if not self.clients:
+                raise Exception("Client pool is empty")
+
+            healthy = [client for client in self.clients if client.health.healthy()]
+            if healthy:
+                client = max(healthy, key=lambda c: (c.rate_limiter.stats()['remaining'], -c.last_used))
+            else:
+                client = min(self.clients, key=lambda c: c.health.benched_until)
+
+            client.last_used = self._clock()
+            return client
+
+    def stats(self):
+        """
+        Get per-client budget and health.
+
+        Returns:
+            list: One dict per client with its ID, remaining budget, request/error counts and health
+        """
+        return [
+            {
+                'client_id': client.client_id,
+                'remaining': client.rate_limiter.stats()['remaining'],
+                'requests': client.health.requests,
+                'errors': client.health.errors,
+                'healthy': client.health.healthy()
+            }
+            for client in self.clients
+        ]
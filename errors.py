@@ -0,0 +1,124 @@
+import prawcore
+import requests
+
+
+class ScraperError(Exception):
+    """Base class for errors raised by the scraper."""
+
+
+class NotFound(ScraperError):
+    """The subreddit, post or endpoint does not exist (or was banned)."""
+
+
+class Private(ScraperError):
+    """The resource exists but this client may not read it (private or quarantined)."""
+
+
+class Unauthorized(ScraperError):
+    """The client's credentials or token were rejected."""
+
+
+class RateLimited(ScraperError):
+    """Reddit rejected the request for exceeding the rate limit."""
+
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class Transient(ScraperError):
+    """A server error or network failure that is likely to succeed on retry."""
+
+
+class CircuitOpen(ScraperError):
+    """Calls for this subreddit are paused after repeated transient failures."""
+
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def error_for_status(status_code):
+    """
+    Map an HTTP status code to an error class.
+
+    Args:
+        status_code (int): HTTP status of the failed response
+
+    Returns:
+        type: ScraperError subclass
+    """
+    if status_code == 401:
+        return Unauthorized
+    if status_code == 404:
+        return NotFound
+    if status_code in (403, 451):
+        return Private
+    if status_code == 429:
+        return RateLimited
+    if status_code >= 500 or status_code == 408:
+        return Transient
+    return ScraperError
+
+
+def classify(exc):
+    """
+    Map an exception raised by PRAW, prawcore or requests to an error class.
+
+    Args:
+        exc (Exception): Exception to classify
+
+    Returns:
+        type: ScraperError subclass
+    """
+    if isinstance(exc, ScraperError):
+        return type(exc)
+    # Reddit answers unknown subreddits with a redirect to the search page
+    if isinstance(exc, (prawcore.NotFound, prawcore.Redirect)):
+        return NotFound
+    if isinstance(exc, (prawcore.Forbidden, prawcore.UnavailableForLegalReasons)):
+        return Private
+    if isinstance(exc, (prawcore.OAuthException, prawcore.InvalidToken)):
+        return Unauthorized
+    if isinstance(exc, prawcore.TooManyRequests):
+        return RateLimited
+    if isinstance(exc, (prawcore.ServerError, prawcore.RequestException)):
+        return Transient
+    if isinstance(exc, prawcore.ResponseException):
+        return error_for_status(exc.response.status_code)
+    if isinstance(exc, requests.HTTPError) and exc.response is not None:
+        return error_for_status(exc.response.status_code)
+    if isinstance(exc, (requests.ConnectionError, requests.Timeout)):
+        return Transient
+    return ScraperError
+
+
+def wrap_error(exc, message, subreddit_name=None):
+    """
+    Build a typed scraper error from any exception.
+
+    Args:
+        exc (Exception): Original exception
+        message (str): Context prefix, e.g. 'Error scraping subreddit'
+        subreddit_name (str): Subreddit involved, used for clearer not-found/private messages
+
+    Returns:
+        ScraperError: Error of the classified type, keeping ``retry_after`` where known
+    """
+    error_class = classify(exc)
+
+    if subreddit_name and error_class is NotFound:
+        detail = f"Subreddit 'r/{subreddit_name}' not found or banned"
+    elif subreddit_name and error_class is Private:
+        detail = f"Subreddit 'r/{subreddit_name}' is private"
+    else:
+        detail = str(exc)
+
+    if error_class in (RateLimited, CircuitOpen):
+        # prawcore keeps the raw Retry-After header string
+        try:
+            retry_after = float(getattr(exc, 'retry_after', None))
+        except (TypeError, ValueError):
+            retry_after = None
+        return error_class(f"{message}: {detail}", retry_after)
+    return error_class(f"{message}: {detail}")
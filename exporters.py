@@ -0,0 +1,364 @@
+import gzip
+import os
+import uuid
+from collections import OrderedDict
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Arrow types for the standard post columns; anything else is inferred
+POST_SCHEMA = pa.schema([
+    ('title', pa.string()),
+    ('author', pa.dictionary(pa.int32(), pa.string())),
+    ('score', pa.int64()),
+    ('upvote_ratio', pa.float32()),
+    ('num_comments', pa.int32()),
+    ('created_utc', pa.float64()),
+    ('created_date', pa.timestamp('ns', tz='UTC')),
+    ('url', pa.string()),
+    ('permalink', pa.string()),
+    ('selftext', pa.string()),
+    ('is_self', pa.bool_()),
+    ('subreddit', pa.dictionary(pa.int32(), pa.string())),
+    ('post_id', pa.string()),
+    ('domain', pa.dictionary(pa.int32(), pa.string())),
+    ('over_18', pa.bool_()),
+    ('spoiler', pa.bool_()),
+    ('stickied', pa.bool_()),
+    ('locked', pa.bool_())
+])
+
+EXPORT_FORMATS = ('parquet', 'arrow', 'ndjson', 'csv')
+
+
+def to_arrow_table(df, schema=None):
+    """
+    Convert a post DataFrame into an Arrow table with stable column types.
+
+    Args:
+        df (pandas.DataFrame): Post data
+        schema (pyarrow.Schema): Schema to cast to, defaults to POST_SCHEMA plus inferred extras
+
+    Returns:
+        pyarrow.Table: Typed table
+    """
+    if schema is None:
+        fields = [POST_SCHEMA.field(name) if name in POST_SCHEMA.names else None for name in df.columns]
+        inferred = pa.Schema.from_pandas(df, preserve_index=False)
+        schema = pa.schema([field or inferred.field(name) for field, name in zip(fields, df.columns)])
+    return pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+
+
+def decode_dictionaries(schema):
+    """
+    Replace dictionary-encoded fields in a schema with their value type.
+
+    Args:
+        schema (pyarrow.Schema): Schema that may contain dictionary fields
+
+    Returns:
+        pyarrow.Schema: Same fields with dictionaries decoded
+    """
+    return pa.schema([
+        field.with_type(field.type.value_type) if pa.types.is_dictionary(field.type) else field
+        for field in schema
+    ])
+
+
+class ParquetDatasetWriter:
+    """
+    Streaming Parquet writer partitioned by subreddit and post date.
+
+    Each batch is split into ``subreddit=<name>/date=<YYYY-MM-DD>`` partitions
+    whose rows are buffered until ``row_group_size`` of them have accumulated
+    and then written as one row group, so a stream of small scrape pages does
+    not produce a file full of tiny row groups. At most ``max_open_files``
+    partition files are kept open; the least recently used one is closed when
+    another is needed and the partition continues in a new part file. Buffered
+    rows are also flushed, largest partition first, once more than
+    ``max_buffered_rows`` are held, which keeps peak memory bounded no matter
+    how many partitions the export touches. As with any Hive-style dataset the
+    partition values live in the directory names, not in the files.
+    """
+
+    def __init__(self, base_dir, compression='zstd', partition_cols=('subreddit', 'date'),
+                 row_group_size=65536, max_open_files=64, max_buffered_rows=500000):
+        """
+        Initialize the writer.
+
+        Args:
+            base_dir (str): Root directory of the dataset
+            compression (str): Parquet codec ('zstd', 'snappy', 'gzip' or None)
+            partition_cols (tuple): Partition keys; 'date' is derived from created_utc
+            row_group_size (int): Rows buffered per partition before a row group is written
+            max_open_files (int): Partition files kept open at the same time
+            max_buffered_rows (int): Rows buffered across all partitions before the largest are flushed
+        """
+        self.base_dir = base_dir
+        self.compression = compression
+        self.partition_cols = tuple(partition_cols)
+        self.row_group_size = row_group_size
+        self.max_open_files = max_open_files
+        self.max_buffered_rows = max_buffered_rows
+        self.rows_written = 0
+        self._file_prefix = f"part-{uuid.uuid4().hex[:12]}"
+        self._writers = OrderedDict()
+        self._buffers = {}
+        self._buffer_sizes = {}
+        self._buffered_rows = 0
+        self._parts = {}
+        self._schema = None
+
+    def write_batch(self, df):
+        """Append a batch of posts to the dataset."""
+        if df.empty:
+            return
+
+        keys = {}
+        if 'subreddit' in self.partition_cols:
+            keys['subreddit'] = df['subreddit'].astype(str)
+        if 'date' in self.partition_cols:
+            keys['date'] = pd.to_datetime(df['created_utc'], unit='s', utc=True).dt.strftime('%Y-%m-%d')
+
+        columns = [name for name in self.partition_cols if name in keys]
+        # Convert the batch once and slice the partitions out of the Arrow table
+        table = to_arrow_table(
+            df.drop(columns=[name for name in columns if name in df.columns]).reset_index(drop=True), self._schema
+        )
+        if self._schema is None:
+            self._schema = table.schema
+
+        groups = df.groupby([keys[name] for name in columns], sort=False).indices
+        for values, rows in groups.items():
+            values = values if isinstance(values, tuple) else (values,)
+            part = table.take(rows)
+
+            key = tuple(zip(columns, values))
+            self._buffers.setdefault(key, []).append(part)
+            self._buffer_sizes[key] = self._buffer_sizes.get(key, 0) + len(part)
+            self._buffered_rows += len(part)
+            self.rows_written += len(part)
+            if self._buffer_sizes[key] >= self.row_group_size:
+                self._flush(key)
+
+        # Keep memory bounded when many partitions each hold a few rows
+        while self._buffered_rows > self.max_buffered_rows:
+            self._flush(max(self._buffer_sizes, key=self._buffer_sizes.get))
+
+    def _flush(self, key):
+        """Write one partition's buffered rows as a row group."""
+        tables = self._buffers.pop(key, None)
+        if not tables:
+            return
+        self._buffered_rows -= self._buffer_sizes.pop(key)
+        table = pa.concat_tables(tables)
+        self._writer(key).write_table(table, row_group_size=max(len(table), 1))
+
+    def _writer(self, key):
+        """Get or open the file writer for one partition, closing the least recently used one if needed."""
+        if key in self._writers:
+            self._writers.move_to_end(key)
+            return self._writers[key]
+
+        while len(self._writers) >= self.max_open_files:
+            _, writer = self._writers.popitem(last=False)
+            writer.close()
+
+        # A partition whose file was closed continues in a new part file
+        part = self._parts.get(key, 0)
+        self._parts[key] = part + 1
+        directory = os.path.join(self.base_dir, *(f"{name}={value}" for name, value in key))
+        os.makedirs(directory, exist_ok=True)
+        self._writers[key] = pq.ParquetWriter(
+            os.path.join(directory, f"{self._file_prefix}-{part:05d}.parquet"), self._schema,
+            compression=self.compression
+        )
+        return self._writers[key]
+
+    def close(self):
+        """Flush the buffered rows and close every open partition file."""
+        for key in list(self._buffers):
+            self._flush(key)
+        for writer in self._writers.values():
+            writer.close()
+        self._writers = OrderedDict()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class ArrowIPCWriter:
+    """
+    Streaming writer for the Arrow IPC file format (Feather v2).
+
+    The file format only allows one dictionary per column for the whole
+    file, while each batch brings its own author/subreddit/domain
+    categories, so dictionary columns are written as plain strings.
+    """
+
+    def __init__(self, path, compression='zstd'):
+        """
+        Initialize the writer.
+
+        Args:
+            path (str): Output file path
+            compression (str): IPC buffer codec ('zstd', 'lz4' or None)
+        """
+        self.path = path
+        self.compression = compression
+        self.rows_written = 0
+        self._writer = None
+        self._schema = None
+
+    def write_batch(self, df):
+        """Append a batch of posts as one record batch."""
+        if df.empty:
+            return
+
+        table = to_arrow_table(df, self._schema)
+        if self._writer is None:
+            self._schema = decode_dictionaries(table.schema)
+            table = table.cast(self._schema)
+            options = pa.ipc.IpcWriteOptions(compression=self.compression)
+            self._writer = pa.ipc.new_file(self.path, self._schema, options=options)
+        self._writer.write_table(table)
+        self.rows_written += len(df)
+
+    def close(self):
+        """Finish the file footer and close it."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class NDJSONWriter:
+    """Streaming newline-delimited JSON writer with optional gzip/zstd compression."""
+
+    def __init__(self, path, compression='gzip'):
+        """
+        Initialize the writer.
+
+        Args:
+            path (str): Output file path
+            compression (str): 'gzip', 'zstd' or None for plain text
+        """
+        self.path = path
+        self.compression = compression
+        self.rows_written = 0
+
+        if compression == 'gzip':
+            self._file = gzip.open(path, 'wb')
+        elif compression == 'zstd':
+            self._file = pa.CompressedOutputStream(path, 'zstd')
+        elif compression is None:
+            self._file = open(path, 'wb')
+        else:
+            raise Exception(f"Unsupported NDJSON compression: {compression}")
+
+    def write_batch(self, df):
+        """Append a batch of posts, one JSON object per line."""
+        if df.empty:
+            return
+
+        lines = df.to_json(orient='records', lines=True, force_ascii=False, date_format='iso')
+        if not lines.endswith('\n'):
+            lines += '\n'
+        self._file.write(lines.encode('utf-8'))
+        self.rows_written += len(df)
+
+    def close(self):
+        """Flush and close the output file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class CSVWriter:
+    """Streaming CSV writer that appends each batch without rebuilding the file."""
+
+    def __init__(self, path):
+        """
+        Initialize the writer.
+
+        Args:
+            path (str): Output file path
+        """
+        self.path = path
+        self.rows_written = 0
+        self._file = open(path, 'w', newline='', encoding='utf-8')
+
+    def write_batch(self, df):
+        """Append a batch of posts, writing the header with the first one."""
+        if df.empty:
+            return
+
+        df.to_csv(self._file, index=False, header=self.rows_written == 0)
+        self.rows_written += len(df)
+
+    def close(self):
+        """Flush and close the output file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def open_writer(path, fmt='parquet', compression=None):
+    """
+    Open a streaming writer for the given export format.
+
+    Args:
+        path (str): Output file, or dataset directory for Parquet
+        fmt (str): One of EXPORT_FORMATS
+        compression (str): Codec override; each format has a sensible default
+
+    Returns:
+        Writer with write_batch(df) and close() methods
+    """
+    if fmt == 'parquet':
+        return ParquetDatasetWriter(path, compression=compression or 'zstd')
+    elif fmt == 'arrow':
+        return ArrowIPCWriter(path, compression=compression or 'zstd')
+    elif fmt == 'ndjson':
+        return NDJSONWriter(path, compression=compression or 'gzip')
+    elif fmt == 'csv':
+        return CSVWriter(path)
+    else:
+        raise Exception(f"Invalid export format: {fmt}")
+
+
+def to_parquet_bytes(df, compression='zstd'):
+    """
+    Serialize a DataFrame to an in-memory Parquet file, e.g. for a download button.
+
+    Args:
+        df (pandas.DataFrame): Post data
+        compression (str): Parquet codec
+
+    Returns:
+        bytes: Parquet file contents
+    """
+    sink = pa.BufferOutputStream()
+    pq.write_table(to_arrow_table(df), sink, compression=compression)
+    return sink.getvalue().to_pybytes()
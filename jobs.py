@@ -0,0 +1,284 @@
+import itertools
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from normalize import concat_frames
+from result_cache import result_key
+
+# Finished jobs are forgotten after this many seconds
+JOB_RETENTION = 3600
+
+
+class Cancelled(Exception):
+    """Raised inside a worker when its job was cancelled mid-listing."""
+
+
+class ScrapeJob:
+    """
+    Progress of one background scrape, safe to read from any thread.
+
+    Workers report every listing page as it arrives, so a UI polling
+    ``snapshot`` sees real progress and can show the posts stored so far.
+    """
+
+    def __init__(self, job_id, subreddits, post_type, limit, time_filter):
+        """
+        Initialize the job state.
+
+        Args:
+            job_id (int): Runner-assigned identifier
+            subreddits (list): Subreddits to scrape
+            post_type (str): Type of posts to get ('hot', 'new', 'top')
+            limit (int): Maximum number of posts per subreddit
+            time_filter (str): Time filter for top posts
+        """
+        self.job_id = job_id
+        self.subreddits = subreddits
+        self.post_type = post_type
+        self.limit = limit
+        self.time_filter = time_filter
+        self.status = "queued"
+        self.fetched = 0
+        self.pages = 0
+        self.found = []
+        # IDs of the posts this job stored, appended page by page; only ever grows
+        self.post_ids = []
+        self.errors = []
+        self.started_at = None
+        self.finished_at = None
+        self._pending = len(subreddits)
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def target(self):
+        """Upper bound on the number of posts this job can fetch."""
+        return self.limit * len(self.subreddits)
+
+    def cancel(self):
+        """Ask the workers to stop after their current page."""
+        self._cancelled.set()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def _start(self):
+        with self._lock:
+            if self.started_at is None:
+                self.started_at = time.time()
+                self.status = "running"
+
+    def _page(self, df):
+        with self._lock:
+            self.pages += 1
+            self.fetched += len(df)
+            self.post_ids.extend(df['post_id'])
+            for name in df['subreddit'].unique():
+                if name not in self.found:
+                    self.found.append(name)
+
+    def _finish_task(self, subreddit_name, error=None):
+        with self._lock:
+            if error is not None:
+                self.errors.append({
+                    'subreddit': subreddit_name,
+                    'error': str(error),
+                    'error_type': type(error).__name__
+                })
+            self._pending -= 1
+            if self._pending == 0:
+                self.finished_at = time.time()
+                if self.cancelled:
+                    self.status = "cancelled"
+                elif self.errors and not self.fetched:
+                    self.status = "error"
+                else:
+                    self.status = "done"
+
+    @property
+    def finished(self):
+        return self.status in ("done", "error", "cancelled")
+
+    def snapshot(self):
+        """
+        Get a consistent copy of the job's progress.
+
+        Returns:
+            dict: Status, counters, progress fraction (0-1), discovered subreddit names and errors
+        """
+        with self._lock:
+            if self.finished:
+                progress = 1.0
+            else:
+                progress = min(self.fetched / self.target, 0.99) if self.target else 0.0
+            end = self.finished_at or time.time()
+            return {
+                'job_id': self.job_id,
+                'status': self.status,
+                'subreddits': list(self.subreddits),
+                'found': list(self.found),
+                'fetched': self.fetched,
+                'pages': self.pages,
+                'target': self.target,
+                'progress': progress,
+                'elapsed': end - self.started_at if self.started_at else 0.0,
+                'errors': list(self.errors)
+            }
+
+
+class JobRunner:
+    """
+    Bounded background executor for scrapes, shared across Streamlit reruns and sessions.
+
+    Each subreddit of a job is its own task. Tasks wait in per-job queues
+    and a free worker takes the next task from the next job in turn, so a
+    large job from one user interleaves with other users' jobs instead of
+    blocking them. Pages are upserted into the scraper's store as they arrive.
+
+    With a ResultCache, a listing another job scraped recently is reused,
+    and identical listings requested at the same time are scraped once:
+    the later jobs wait for the first one's result.
+    """
+
+    def __init__(self, max_workers=8, result_cache=None):
+        """
+        Initialize the runner.
+
+        Args:
+            max_workers (int): Maximum number of listings scraped at once across all jobs
+            result_cache (ResultCache): Optional cache shared with other jobs and sessions
+        """
+        self.result_cache = result_cache
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scrape")
+        self._jobs = {}
+        # job_id -> deque of subreddits not started yet; dict order is the round-robin rotation
+        self._queues = {}
+        self._running = 0
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def submit(self, scraper, subreddits, post_type="hot", limit=25, time_filter="all"):
+        """
+        Start scraping in the background.
+
+        Args:
+            scraper (RedditScraper): Connected scraper; its store receives each page
+            subreddits (list): Subreddits to scrape
+            post_type (str): Type of posts to get ('hot', 'new', 'top')
+            limit (int): Maximum number of posts per subreddit
+            time_filter (str): Time filter for top posts
+
+        Returns:
+            ScrapeJob: Handle to poll for progress
+        """
+        subreddits = list(dict.fromkeys(subreddits))
+        with self._lock:
+            self._prune()
+            job = ScrapeJob(next(self._ids), subreddits, post_type, limit, time_filter)
+            self._jobs[job.job_id] = job
+            if subreddits:
+                self._queues[job.job_id] = (scraper, job, deque(subreddits))
+            self._dispatch()
+        return job
+
+    def get(self, job_id):
+        """Look up a job by ID; None once it has been pruned."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _dispatch(self):
+        """Hand queued subreddits to free workers, one job at a time in turn. Caller holds the lock."""
+        while self._running < self.max_workers and self._queues:
+            job_id = next(iter(self._queues))
+            scraper, job, queue = self._queues.pop(job_id)
+            subreddit_name = queue.popleft()
+            if queue:
+                # Back of the rotation
+                self._queues[job_id] = (scraper, job, queue)
+            self._running += 1
+            self._executor.submit(self._task, scraper, job, subreddit_name)
+
+    def _task(self, scraper, job, subreddit_name):
+        """Run one subreddit and pass the freed worker on to the next queued task."""
+        try:
+            self._run(scraper, job, subreddit_name)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._dispatch()
+
+    def _stream(self, scraper, job, subreddit_name):
+        """
+        Stream one listing into the store, reporting each page.
+
+        Returns:
+            pandas.DataFrame: The whole listing, for the result cache
+        """
+        frames = []
+        for df in scraper.iter_frames(subreddit_name, job.post_type, job.limit, job.time_filter):
+            scraper._persist(df)
+            job._page(df)
+            frames.append(df)
+            if job.cancelled:
+                # A partial listing must not be cached for other jobs
+                raise Cancelled()
+
+        return concat_frames(frames)
+
+    def _run(self, scraper, job, subreddit_name):
+        """Scrape one subreddit of a job, through the result cache when there is one."""
+        job._start()
+
+        try:
+            while not job.cancelled:
+                if self.result_cache is None:
+                    self._stream(scraper, job, subreddit_name)
+                    break
+
+                computed = []
+                key = result_key(subreddit_name, job.post_type, job.time_filter, job.limit)
+                try:
+                    df = self.result_cache.get_or_compute(
+                        key, lambda: computed.append(True) or self._stream(scraper, job, subreddit_name)
+                    )
+                except Cancelled:
+                    # Another job we were waiting on was cancelled; scrape it ourselves
+                    if computed:
+                        raise
+                    continue
+
+                if not computed and not df.empty:
+                    # Reused another job's result; upserting it again is harmless if it shares our store
+                    scraper._persist(df)
+                    job._page(df)
+                break
+        except Cancelled:
+            pass
+        except Exception as e:
+            job._finish_task(subreddit_name, e)
+            return
+
+        job._finish_task(subreddit_name)
+
+    def _prune(self):
+        """Forget jobs that finished long ago. Caller holds the lock."""
+        cutoff = time.time() - JOB_RETENTION
+        for job_id in [job_id for job_id, job in self._jobs.items() if job.finished_at and job.finished_at < cutoff]:
+            del self._jobs[job_id]
+
+    def shutdown(self):
+        """Cancel every job, mark queued subreddits finished and stop the worker threads."""
+        with self._lock:
+            for job in self._jobs.values():
+                job.cancel()
+            queued, self._queues = self._queues, {}
+
+        for _, job, queue in queued.values():
+            for subreddit_name in queue:
+                job._finish_task(subreddit_name)
+        # Running tasks stop after their current page
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,354 @@
+import time
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+
+from errors import NotFound, RateLimited, error_for_status
+from metrics import DISABLED
+from normalize import POST_DTYPES, apply_dtypes
+from rate_limiter import RateLimiter
+from retry import RetryPolicy, parse_retry_after
+
+# Post column -> key in the listing JSON. 'permalink' gets the site prefix.
+LISTING_FIELDS = {
+    'title': 'title',
+    'author': 'author',
+    'score': 'score',
+    'upvote_ratio': 'upvote_ratio',
+    'num_comments': 'num_comments',
+    'created_utc': 'created_utc',
+    'url': 'url',
+    'permalink': 'permalink',
+    'selftext': 'selftext',
+    'is_self': 'is_self',
+    'subreddit': 'subreddit',
+    'post_id': 'id',
+    'domain': 'domain',
+    'over_18': 'over_18',
+    'spoiler': 'spoiler',
+    'stickied': 'stickied',
+    'locked': 'locked'
+}
+
+# Defaults for fields Reddit omits on some posts
+FIELD_DEFAULTS = {
+    'author': '[deleted]',
+    'selftext': '',
+    'domain': '',
+    'upvote_ratio': 0.0
+}
+
+
+def listing_to_frame(children, metrics=DISABLED):
+    """
+    Decode listing children straight into the typed post column layout.
+
+    Args:
+        children (list): ``data.children`` entries of one or more listing pages
+        metrics (Metrics): Receives the normalize/frame timings and the post count
+
+    Returns:
+        pandas.DataFrame: Post data with the same schema as the PRAW path
+    """
+    with metrics.time('normalize'):
+        posts = [child['data'] for child in children if child.get('kind') == 't3']
+        if not posts:
+            return pd.DataFrame()
+
+        columns = {}
+        for column, key in LISTING_FIELDS.items():
+            default = FIELD_DEFAULTS.get(column)
+            columns[column] = [post.get(key, default) for post in posts]
+        columns['permalink'] = [f"https://reddit.com{permalink}" for permalink in columns['permalink']]
+
+    with metrics.time('frame'):
+        df = apply_dtypes(pd.DataFrame(columns), POST_DTYPES)
+    metrics.posts(len(df))
+    return df
+
+
+def listing_records(children):
+    """
+    Decode listing children into raw post records.
+
+    The records have the same fields ``normalize.extract_post`` reads from a
+    PRAW submission, so record consumers work the same on either backend.
+
+    Args:
+        children (list): ``data.children`` entries of a listing page
+
+    Returns:
+        list: Raw post dicts in listing order
+    """
+    records = []
+    for child in children:
+        if child.get('kind') != 't3':
+            continue
+        post = child['data']
+        record = {column: post.get(key, FIELD_DEFAULTS.get(column)) for column, key in LISTING_FIELDS.items()}
+        record['permalink'] = f"https://reddit.com{record['permalink']}"
+        records.append(record)
+    return records
+
+
+class JSONListingClient:
+    """
+    Fast path that reads listing endpoints as raw JSON.
+
+    Skips PRAW's model objects entirely: pages are fetched over a pooled
+    ``requests.Session`` and decoded directly into columns, so there are no
+    lazy attribute fetches. With credentials it uses an app-only OAuth token
+    against ``oauth.reddit.com``; without, the public ``.json`` endpoints.
+    """
+
+    def __init__(self, user_agent, client_id=None, client_secret=None, rate_limiter=None, cache=None,
+                 retry_policy=None, health=None, pool_size=10, timeout=16, oauth_url="https://oauth.reddit.com",
+                 reddit_url="https://www.reddit.com", metrics=DISABLED):
+        """
+        Initialize the client.
+
+        Args:
+            user_agent (str): User agent sent with every request
+            client_id (str): Reddit app client ID, optional
+            client_secret (str): Reddit app client secret, optional
+            rate_limiter (RateLimiter): Budget shared with other clients
+            cache (ResponseCache): Optional HTTP response cache
+            retry_policy (RetryPolicy): Backoff for 429/5xx responses and network errors
+            health (ClientHealth): Optional health record that request outcomes are reported to
+            pool_size (int): Maximum pooled connections per host
+            timeout (float): Per-request timeout in seconds
+            oauth_url (str): Base URL of the authenticated API
+            reddit_url (str): Base URL for tokens and public JSON
+            metrics (Metrics): Receives request counts, latencies and stage timings
+        """
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.cache = cache
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.health = health
+        self.timeout = timeout
+        self.oauth_url = oauth_url
+        self.reddit_url = reddit_url
+        self.metrics = metrics
+        self._token = None
+        self._token_expires_at = 0.0
+
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = user_agent
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def _authorize(self):
+        """Fetch or reuse an app-only OAuth token; returns the auth header."""
+        if not self.client_id or not self.client_secret:
+            return {}
+
+        if self._token is None or time.time() >= self._token_expires_at:
+            response = self.session.post(
+                f"{self.reddit_url}/api/v1/access_token",
+                data={'grant_type': 'client_credentials'},
+                auth=(self.client_id, self.client_secret),
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            token = response.json()
+            self._token = token['access_token']
+            # Refresh a minute early so in-flight requests never use a stale token
+            self._token_expires_at = time.time() + token.get('expires_in', 3600) - 60
+
+        return {'Authorization': f"bearer {self._token}"}
+
+    def get(self, path, params=None):
+        """
+        GET a JSON endpoint under the shared rate limiter.
+
+        Args:
+            path (str): API path, e.g. '/r/python/new'
+            params (dict): Query parameters
+
+        Returns:
+            dict: Decoded JSON body
+        
+        Raises:
+            ScraperError: Typed by status (NotFound, Private, RateLimited, Transient)
+        """
+        with self.metrics.time('fetch'):
+            response = self._fetch(path, params)
+
+        if response.status_code >= 400:
+            error_class = error_for_status(response.status_code)
+            message = f"{response.status_code} {response.reason} for {path}"
+            if error_class is RateLimited:
+                raise RateLimited(message, parse_retry_after(response.headers))
+            raise error_class(message)
+        # Reddit redirects unknown subreddits to the search page, like prawcore's Redirect
+        if 300 <= response.status_code < 400:
+            raise NotFound(f"{response.status_code} {response.reason} for {path}")
+        return response.json()
+
+    def _fetch(self, path, params):
+        """Send a GET through the response cache, if any; returns the raw response."""
+        headers = self._authorize()
+        if headers:
+            url = f"{self.oauth_url}{path}"
+        else:
+            url = f"{self.reddit_url}{path}.json"
+
+        if self.cache is not None:
+            return self.cache.fetch('GET', url, params, headers, lambda headers: self._send(url, params, headers))
+        return self._send(url, params, headers)
+
+    def _attempt(self, url, params, headers):
+        """Issue one GET under the shared rate limiter."""
+        waited = self.rate_limiter.acquire()
+        if waited:
+            self.metrics.observe('rate_limit_wait_seconds', waited)
+
+        start = time.perf_counter()
+        try:
+            response = self.session.get(url, params=params, headers=headers, timeout=self.timeout,
+                                        allow_redirects=False)
+        except requests.RequestException:
+            self.metrics.count('http_requests_total', backend='json', status='error')
+            raise
+        self.metrics.observe('http_request_seconds', time.perf_counter() - start, backend='json')
+        self.metrics.count('http_requests_total', backend='json', status=str(response.status_code))
+
+        self.rate_limiter.update_from_headers(response.headers)
+        return response
+
+    def _send(self, url, params, headers):
+        """Issue a GET, retrying transient failures with backoff."""
+        try:
+            response = self.retry_policy.send(
+                lambda: self._attempt(url, params, headers),
+                (requests.ConnectionError, requests.Timeout)
+            )
+        except (requests.ConnectionError, requests.Timeout):
+            if self.health is not None:
+                self.health.record_failure()
+            raise
+
+        if self.health is not None:
+            self.health.record_status(response.status_code)
+        return response
+
+    def iter_pages(self, path, limit, params=None, after=None):
+        """
+        Walk a listing endpoint page by page.
+
+        Args:
+            path (str): Listing path, e.g. '/r/python/new'
+            limit (int): Maximum number of items to fetch
+            params (dict): Extra query parameters (sort, t, q, ...)
+            after (str): Fullname to start after, for resuming
+
+        Yields:
+            tuple: (children list, after cursor of the next page or None)
+        """
+        fetched = 0
+        while fetched < limit:
+            page_params = dict(params or {}, limit=min(100, limit - fetched), raw_json=1)
+            if after:
+                page_params['after'] = after
+
+            data = self.get(path, page_params)['data']
+            children = data['children'][:limit - fetched]
+            after = data.get('after')
+            fetched += len(children)
+
+            yield children, after
+
+            if not children or not after:
+                break
+
+    def listing_path(self, subreddit_name, post_type):
+        """Build the listing path for a post type."""
+        if post_type not in ("hot", "new", "top"):
+            raise Exception(f"Invalid post type: {post_type}")
+        return f"/r/{subreddit_name}/{post_type}"
+
+    def scrape(self, subreddit_name, post_type="hot", limit=25, time_filter="all"):
+        """
+        Fetch a listing and decode it into a post DataFrame.
+
+        Args:
+            subreddit_name (str): Name of the subreddit
+            post_type (str): Type of posts to get ('hot', 'new', 'top')
+            limit (int): Maximum number of posts
+            time_filter (str): Time filter for top posts
+
+        Returns:
+            pandas.DataFrame: Post data in listing order
+        """
+        params = {'t': time_filter} if post_type == "top" else None
+        children = []
+        for page, _ in self.iter_pages(self.listing_path(subreddit_name, post_type), limit, params):
+            children.extend(page)
+        return listing_to_frame(children, self.metrics)
+
+    def iter_frames(self, subreddit_name, post_type="hot", limit=25, time_filter="all"):
+        """
+        Stream a listing as typed post DataFrames, one per page.
+
+        Args:
+            subreddit_name (str): Name of the subreddit
+            post_type (str): Type of posts to get ('hot', 'new', 'top')
+            limit (int): Maximum number of posts
+            time_filter (str): Time filter for top posts
+
+        Yields:
+            pandas.DataFrame: Posts of one listing page
+        """
+        params = {'t': time_filter} if post_type == "top" else None
+        for page, _ in self.iter_pages(self.listing_path(subreddit_name, post_type), limit, params):
+            df = listing_to_frame(page, self.metrics)
+            if not df.empty:
+                yield df
+
+    def iter_records(self, subreddit_name, post_type="hot", limit=25, time_filter="all", after=None):
+        """
+        Stream a listing as raw post records, one list per page.
+
+        Args:
+            subreddit_name (str): Name of the subreddit
+            post_type (str): Type of posts to get ('hot', 'new', 'top')
+            limit (int): Maximum number of posts
+            time_filter (str): Time filter for top posts
+            after (str): Fullname to start after, for resuming
+
+        Yields:
+            tuple: (list of raw post dicts, after cursor of the next page or None)
+        """
+        params = {'t': time_filter} if post_type == "top" else None
+        for page, next_after in self.iter_pages(self.listing_path(subreddit_name, post_type), limit, params, after):
+            with self.metrics.time('normalize'):
+                records = listing_records(page)
+            yield records, next_after
+
+    def search(self, subreddit_name, query, sort="relevance", time_filter="all", limit=25):
+        """
+        Search a subreddit and decode the results into a post DataFrame.
+
+        Args:
+            subreddit_name (str): Name of the subreddit
+            query (str): Search query
+            sort (str): Sort method ('relevance', 'hot', 'top', 'new', 'comments')
+            time_filter (str): Time filter ('all', 'day', 'week', 'month', 'year')
+            limit (int): Maximum number of posts
+
+        Returns:
+            pandas.DataFrame: Search results
+        """
+        params = {'q': query, 'sort': sort, 't': time_filter, 'restrict_sr': 'on'}
+        children = []
+        for page, _ in self.iter_pages(f"/r/{subreddit_name}/search", limit, params):
+            children.extend(page)
+        return listing_to_frame(children, self.metrics)
+
+    def close(self):
+        """Close the pooled session."""
+        self.session.close()
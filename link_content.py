@@ -0,0 +1,410 @@
+import ipaddress
+import socket
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlsplit
+
+import pandas as pd
+import requests
+import trafilatura
+from requests.adapters import HTTPAdapter
+
+from post_store import LINK_CONTENT_COLUMNS
+
+# Links to Reddit itself and to media hosts have no article to extract
+SKIP_DOMAINS = ('reddit.com', 'redd.it', 'imgur.com', 'gfycat.com', 'redgifs.com', 'youtube.com', 'youtu.be',
+                'streamable.com', 'twitter.com', 'x.com')
+SKIP_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.gifv', '.webp', '.mp4', '.webm', '.mp3', '.pdf', '.zip')
+
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+
+
+def link_domain(url):
+    """Host of a URL, lowercased and without a leading 'www.'."""
+    host = (urlsplit(url).hostname or '').lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+def is_article_url(url):
+    """
+    Check whether a post's URL may point at an article worth extracting.
+
+    Args:
+        url (str): Link of the post
+
+    Returns:
+        bool: False for non-HTTP links, Reddit-hosted content, media hosts and media files
+    """
+    if not isinstance(url, str) or not url.startswith(('http://', 'https://')):
+        return False
+    domain = link_domain(url)
+    if not domain or any(domain == skip or domain.endswith('.' + skip) for skip in SKIP_DOMAINS):
+        return False
+    return not urlsplit(url).path.lower().endswith(SKIP_EXTENSIONS)
+
+
+def check_public_host(url):
+    """
+    Make sure a URL's host only resolves to public internet addresses.
+
+    Post links are user-submitted, so without this check a link could make
+    the server fetch loopback, private-network or link-local addresses.
+
+    Args:
+        url (str): Link to fetch
+
+    Raises:
+        Exception: If the host does not resolve or resolves to a non-global address
+    """
+    parts = urlsplit(url)
+    try:
+        addresses = socket.getaddrinfo(parts.hostname, parts.port or 80, proto=socket.IPPROTO_TCP)
+    except (socket.gaierror, UnicodeError) as e:
+        raise Exception(f"Could not resolve {parts.hostname}: {str(e)}")
+    for *_, sockaddr in addresses:
+        address = ipaddress.ip_address(sockaddr[0].split('%')[0])
+        if not address.is_global:
+            raise Exception(f"{parts.hostname} resolves to non-public address {address}")
+
+
+class LinkEnricher:
+    """
+    Background stage that fetches linked articles and extracts their text.
+
+    ``submit`` only queues the URLs of link posts and returns at once, so
+    scraping never waits for enrichment. A dispatcher thread feeds a pool of
+    workers sharing one keep-alive HTTP session, while holding each domain
+    to ``per_domain`` concurrent requests started at least
+    ``domain_interval`` seconds apart; queued domains are served round-robin
+    so one busy site does not starve the others. Redirects are not followed
+    by the HTTP client: each hop goes back through the dispatcher under its
+    own domain's limits, and every hop's host must resolve to public
+    addresses only. Every URL is fetched at most once: results are kept by
+    URL in the store's link_content table (or in memory without a store),
+    and URLs already queued, in flight or fetched by any subreddit are
+    skipped.
+    """
+
+    def __init__(self, store=None, max_workers=8, per_domain=2, domain_interval=1.0, timeout=10.0,
+                 max_bytes=2 * 1024 * 1024, user_agent="RedditScraper/1.0 (link preview)", max_redirects=5,
+                 allow_private=False, clock=time.monotonic):
+        """
+        Initialize the enricher.
+
+        Args:
+            store (PostStore): Optional store that caches extracted content across runs
+            max_workers (int): Maximum number of pages fetched at once
+            per_domain (int): Maximum number of concurrent requests to one domain
+            domain_interval (float): Minimum seconds between request starts to one domain
+            timeout (float): Seconds allowed for connecting to and downloading one page
+            max_bytes (int): Pages are truncated to this size before extraction
+            user_agent (str): User-Agent header sent to linked sites
+            max_redirects (int): Redirect hops followed per link
+            allow_private (bool): Allow loopback and private-network hosts, e.g. a local test server
+            clock (callable): Monotonic clock, overridable for testing
+        """
+        self.store = store
+        self.max_workers = max_workers
+        self.per_domain = per_domain
+        self.domain_interval = domain_interval
+        self.timeout = timeout
+        self.max_bytes = max_bytes
+        self.max_redirects = max_redirects
+        self.allow_private = allow_private
+        self.submitted = 0
+        self.cached = 0
+        self.extracted = 0
+        self.empty = 0
+        self.failed = 0
+
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = user_agent
+        adapter = HTTPAdapter(pool_connections=max_workers * 4, pool_maxsize=per_domain)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="enrich")
+        self._dispatcher = None
+        self._closed = False
+        # URLs seen by this process: queued, in flight or done
+        self._known = set()
+        # URLs submitted but not yet checked against the store
+        self._inbox = []
+        self._checking = 0
+        # domain -> deque of (url, post url, redirect hops) waiting for a worker, served round-robin
+        self._queues = {}
+        # domain -> requests in flight / earliest start of the next request
+        self._active = {}
+        self._ready_at = {}
+        self._in_flight = 0
+        # url -> record, used when there is no store
+        self._content = {}
+
+    def submit(self, posts):
+        """
+        Queue the link posts of a batch for enrichment.
+
+        Args:
+            posts (pandas.DataFrame or list): Post data as a DataFrame or list of dicts
+
+        Returns:
+            int: Number of URLs newly queued
+        """
+        if isinstance(posts, pd.DataFrame):
+            if posts.empty:
+                return 0
+            posts = posts[['url', 'is_self']].to_dict('records')
+
+        urls = [post['url'] for post in posts if not post.get('is_self') and is_article_url(post.get('url'))]
+
+        with self._cond:
+            if self._closed:
+                return 0
+            new = [url for url in dict.fromkeys(urls) if url not in self._known]
+            if not new:
+                return 0
+            self._known.update(new)
+            self._inbox.extend(new)
+            self.submitted += len(new)
+            if self._dispatcher is None:
+                self._dispatcher = threading.Thread(target=self._dispatch, name="enrich-dispatch", daemon=True)
+                self._dispatcher.start()
+            self._cond.notify_all()
+        return len(new)
+
+    def _dispatch(self):
+        """Hand queued URLs to workers as domain limits allow, until closed."""
+        while True:
+            with self._cond:
+                task, wait = self._next()
+                while task is None and not self._inbox and not self._closed:
+                    self._cond.wait(wait)
+                    task, wait = self._next()
+                if self._closed:
+                    return
+                inbox, self._inbox = self._inbox, []
+                self._checking = len(inbox)
+
+            if inbox:
+                self._enqueue(self._uncached(inbox))
+            if task is not None:
+                try:
+                    self._executor.submit(self._fetch, *task)
+                except RuntimeError:
+                    # Closed while we were dispatching
+                    return
+
+    def _next(self):
+        """
+        Claim the next page a worker may fetch now. Caller holds the lock.
+
+        Returns:
+            tuple: ((url, post url, hops), None), or (None, seconds until a domain frees up or None to wait
+                for new work)
+        """
+        if self._in_flight >= self.max_workers:
+            return None, None
+
+        now = self._clock()
+        wait = None
+        for domain, queue in self._queues.items():
+            if self._active.get(domain, 0) >= self.per_domain:
+                continue
+            ready_at = self._ready_at.get(domain, 0.0)
+            if ready_at > now:
+                wait = ready_at - now if wait is None else min(wait, ready_at - now)
+                continue
+
+            task = queue.popleft()
+            # Rotate the domain to the back of the line
+            del self._queues[domain]
+            if queue:
+                self._queues[domain] = queue
+            self._active[domain] = self._active.get(domain, 0) + 1
+            self._ready_at[domain] = now + self.domain_interval
+            self._in_flight += 1
+            return task, None
+
+        return None, wait
+
+    def _uncached(self, urls):
+        """Drop URLs whose content an earlier run already stored."""
+        if self.store is None:
+            return urls
+        try:
+            stored = set(self.store.query_link_content(urls)['url'])
+        except Exception as e:
+            print(f"Error checking the link content cache: {str(e)}")
+            return urls
+        with self._cond:
+            self.cached += len(stored)
+        return [url for url in urls if url not in stored]
+
+    def _enqueue(self, urls):
+        with self._cond:
+            for url in urls:
+                self._queues.setdefault(link_domain(url), deque()).append((url, url, 0))
+            self._checking = 0
+            self._cond.notify_all()
+
+    def _download(self, url):
+        """
+        Fetch a page within the timeout and size limits, without following redirects.
+
+        Returns:
+            tuple: (body of the page, possibly truncated, None), or (None, redirect target)
+        """
+        if not self.allow_private:
+            check_public_host(url)
+
+        deadline = self._clock() + self.timeout
+        with self.session.get(url, timeout=self.timeout, stream=True, allow_redirects=False) as response:
+            if response.status_code in REDIRECT_STATUSES:
+                location = response.headers.get('location')
+                if not location:
+                    raise Exception(f"HTTP {response.status_code} without a Location")
+                return None, urljoin(url, location)
+            if response.status_code >= 400:
+                raise Exception(f"HTTP {response.status_code}")
+            content_type = response.headers.get('content-type', '')
+            if 'html' not in content_type:
+                raise Exception(f"Not an HTML page ({content_type or 'no content type'})")
+
+            body = bytearray()
+            for chunk in response.iter_content(64 * 1024):
+                body.extend(chunk)
+                if len(body) >= self.max_bytes:
+                    break
+                if self._clock() > deadline:
+                    raise Exception(f"Download took longer than {self.timeout:g}s")
+            return bytes(body[:self.max_bytes]), None
+
+    def _redirect(self, url, target, source, hops):
+        """Queue a redirect target behind its own domain's limits, releasing this hop's slot."""
+        with self._cond:
+            self._queues.setdefault(link_domain(target), deque()).append((target, source, hops + 1))
+            self._active[link_domain(url)] -= 1
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def _fetch(self, url, source, hops):
+        """
+        Download and extract one page, then record the outcome under the post's URL.
+
+        Args:
+            url (str): Page to fetch, the post's link or a redirect target
+            source (str): Link of the post the content belongs to
+            hops (int): Redirects followed so far
+        """
+        record = {'url': source, 'domain': link_domain(source), 'title': None, 'text': None, 'error': None}
+        try:
+            body, target = self._download(url)
+            if target is not None:
+                if hops >= self.max_redirects:
+                    raise Exception(f"More than {self.max_redirects} redirects")
+                if not target.startswith(('http://', 'https://')):
+                    raise Exception(f"Redirect to a non-HTTP URL: {target}")
+                self._redirect(url, target, source, hops)
+                return
+
+            document = trafilatura.bare_extraction(body, url=url, with_metadata=True)
+            if document is not None and document.text:
+                record.update(status='ok', title=document.title, text=document.text)
+            else:
+                record.update(status='empty')
+        except Exception as e:
+            record.update(status='error', error=str(e))
+        record['fetched_utc'] = time.time()
+
+        try:
+            if self.store is not None:
+                self.store.upsert_link_content([record])
+            else:
+                with self._cond:
+                    self._content[source] = record
+        except Exception as e:
+            print(f"Error saving content of {source}: {str(e)}")
+        finally:
+            with self._cond:
+                if record['status'] == 'ok':
+                    self.extracted += 1
+                elif record['status'] == 'empty':
+                    self.empty += 1
+                else:
+                    self.failed += 1
+                self._active[link_domain(url)] -= 1
+                self._in_flight -= 1
+                self._cond.notify_all()
+
+    def pending(self):
+        """Number of submitted URLs not fetched yet."""
+        with self._cond:
+            return self._pending()
+
+    def _pending(self):
+        """Count URLs waiting or in flight. Caller holds the lock."""
+        return len(self._inbox) + self._checking + sum(len(queue) for queue in self._queues.values()) + self._in_flight
+
+    def join(self, timeout=None):
+        """
+        Wait until every submitted URL has been fetched.
+
+        Args:
+            timeout (float): Maximum seconds to wait, None for no limit
+
+        Returns:
+            bool: True if nothing is left pending
+        """
+        deadline = None if timeout is None else self._clock() + timeout
+        with self._cond:
+            while self._pending() and not self._closed:
+                remaining = None if deadline is None else deadline - self._clock()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def content(self, urls):
+        """
+        Look up extracted content.
+
+        Args:
+            urls (list): Page URLs
+
+        Returns:
+            pandas.DataFrame: One row per URL fetched so far (see LINK_CONTENT_COLUMNS)
+        """
+        if self.store is not None:
+            return self.store.query_link_content(urls)
+        with self._cond:
+            records = [self._content[url] for url in urls if url in self._content]
+        return pd.DataFrame(records, columns=LINK_CONTENT_COLUMNS)
+
+    def stats(self):
+        """
+        Get enrichment counters.
+
+        Returns:
+            dict: URLs submitted, already cached, extracted, without text, failed and still pending
+        """
+        with self._cond:
+            return {
+                'submitted': self.submitted,
+                'cached': self.cached,
+                'extracted': self.extracted,
+                'empty': self.empty,
+                'failed': self.failed,
+                'pending': self._pending()
+            }
+
+    def close(self):
+        """Stop dispatching; queued URLs are dropped and running fetches finish in the background."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
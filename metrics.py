@@ -0,0 +1,341 @@
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from contextlib import nullcontext
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Upper bounds (seconds) of the latency buckets, as in Prometheus client defaults
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Window over which posts/sec is measured
+RATE_WINDOW = 60.0
+
+# Prefix of every exported metric name
+PROMETHEUS_PREFIX = "reddit_scraper_"
+
+# Shared do-nothing timer handed out while metrics are off
+_NULL_TIMER = nullcontext()
+
+
+class Histogram:
+    """Cumulative latency histogram with fixed bucket bounds."""
+
+    def __init__(self, bounds=LATENCY_BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q):
+        """
+        Estimate a quantile by interpolating inside its bucket, capped at the largest observation.
+
+        Args:
+            q (float): Quantile between 0 and 1
+
+        Returns:
+            float: Estimated value, None without observations
+        """
+        if not self.count:
+            return None
+
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = self.bounds[index - 1] if index > 0 else 0.0
+                # The overflow bucket has no upper bound; report its lower edge
+                upper = self.bounds[index] if index < len(self.bounds) else lower
+                return min(lower + (upper - lower) * (rank - seen) / count, self.max)
+            seen += count
+        return self.max
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'mean': self.sum / self.count if self.count else None,
+            'max': self.max,
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'p99': self.quantile(0.99)
+        }
+
+
+class Metrics:
+    """
+    In-process counters and latency histograms for the scraping hot path.
+
+    Clients, the scraper and the exporters call ``count``, ``observe`` and
+    ``time`` unconditionally; while ``enabled`` is False each call returns
+    after one attribute check, so instrumentation costs next to nothing when
+    off. It can be switched on and off at runtime. Metrics are keyed by name
+    plus keyword labels, e.g. ``count('http_requests_total', backend='json',
+    status='200')``. One instance is safe to share between threads.
+    """
+
+    def __init__(self, enabled=True, clock=time.monotonic):
+        """
+        Initialize empty metrics.
+
+        Args:
+            enabled (bool): Record anything at all
+            clock (callable): Monotonic clock, overridable for testing
+        """
+        self.enabled = enabled
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._started = clock()
+        # (name, labels) -> value / Histogram; labels is a sorted tuple of (key, value) pairs
+        self._counters = {}
+        self._histograms = {}
+        # (time, posts) pairs of the last RATE_WINDOW seconds
+        self._recent_posts = deque()
+
+    def count(self, name, value=1, **labels):
+        """Add ``value`` to a counter."""
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name, seconds, **labels):
+        """Record one duration in a histogram."""
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(seconds)
+
+    def time(self, stage):
+        """
+        Time a block of work as a pipeline stage.
+
+            with metrics.time('sort'):
+                df = df.sort_values('score')
+
+        Args:
+            stage (str): Stage name, e.g. 'fetch', 'normalize', 'frame', 'sort', 'export'
+
+        Returns:
+            context manager: Records ``stage_seconds{stage=...}`` on exit
+        """
+        if not self.enabled:
+            return _NULL_TIMER
+        return _StageTimer(self, stage)
+
+    def posts(self, n):
+        """Count scraped posts, for the running total and posts/sec."""
+        if not self.enabled or not n:
+            return
+        now = self._clock()
+        with self._lock:
+            key = ('posts_scraped_total', ())
+            self._counters[key] = self._counters.get(key, 0) + n
+            self._recent_posts.append((now, n))
+            self._trim(now)
+
+    def _trim(self, now):
+        """Drop post counts older than the rate window. Caller holds the lock."""
+        while self._recent_posts and self._recent_posts[0][0] < now - RATE_WINDOW:
+            self._recent_posts.popleft()
+
+    def reset(self):
+        """Forget everything recorded so far."""
+        with self._lock:
+            self._started = self._clock()
+            self._counters.clear()
+            self._histograms.clear()
+            self._recent_posts.clear()
+
+    def snapshot(self):
+        """
+        Get a consistent copy of everything recorded.
+
+        Returns:
+            dict: 'enabled', 'uptime', 'posts_per_second' (over the last minute),
+                'counters' as {name: {labels: value}}, 'histograms' as
+                {name: {labels: summary}} with labels rendered as 'key=value,...',
+                and 'stages' as {stage: summary}
+        """
+        now = self._clock()
+        with self._lock:
+            self._trim(now)
+            window = min(RATE_WINDOW, now - self._started)
+            recent = sum(n for _, n in self._recent_posts)
+
+            counters = {}
+            for (name, labels), value in sorted(self._counters.items()):
+                counters.setdefault(name, {})[_label_text(labels)] = value
+            histograms = {}
+            stages = {}
+            for (name, labels), histogram in sorted(self._histograms.items(), key=lambda item: item[0]):
+                histograms.setdefault(name, {})[_label_text(labels)] = histogram.summary()
+                if name == 'stage_seconds':
+                    stages[dict(labels)['stage']] = histogram.summary()
+
+        return {
+            'enabled': self.enabled,
+            'uptime': now - self._started,
+            'posts_per_second': recent / window if window > 0 else 0.0,
+            'counters': counters,
+            'histograms': histograms,
+            'stages': stages
+        }
+
+    def stage_totals(self):
+        """
+        Get the total time spent in each stage.
+
+        Returns:
+            dict: Stage name -> seconds, largest first
+        """
+        with self._lock:
+            totals = {
+                dict(labels)['stage']: histogram.sum
+                for (name, labels), histogram in self._histograms.items() if name == 'stage_seconds'
+            }
+        return dict(sorted(totals.items(), key=lambda item: -item[1]))
+
+    def to_prometheus(self, gauges=None):
+        """
+        Render the metrics in the Prometheus text exposition format.
+
+        Args:
+            gauges (dict): Extra point-in-time values, name -> number (e.g. cache hit rates)
+
+        Returns:
+            str: Exposition text
+        """
+        lines = []
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = [
+                (key, list(histogram.counts), histogram.count, histogram.sum, histogram.bounds)
+                for key, histogram in sorted(self._histograms.items(), key=lambda item: item[0])
+            ]
+
+        typed = set()
+        for (name, labels), value in counters:
+            metric = PROMETHEUS_PREFIX + name
+            if metric not in typed:
+                typed.add(metric)
+                lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric}{_prometheus_labels(labels)} {value}")
+
+        for (name, labels), counts, count, total, bounds in histograms:
+            metric = PROMETHEUS_PREFIX + name
+            if metric not in typed:
+                typed.add(metric)
+                lines.append(f"# TYPE {metric} histogram")
+            cumulative = 0
+            for bound, bucket_count in zip(bounds + (float('inf'),), counts):
+                cumulative += bucket_count
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f"{metric}_bucket{_prometheus_labels(labels + (('le', le),))} {cumulative}")
+            lines.append(f"{metric}_sum{_prometheus_labels(labels)} {total}")
+            lines.append(f"{metric}_count{_prometheus_labels(labels)} {count}")
+
+        for name, value in sorted((gauges or {}).items()):
+            if value is None:
+                continue
+            metric = PROMETHEUS_PREFIX + name
+            lines.append(f"# TYPE {metric} gauge")
+            lines.append(f"{metric} {float(value)}")
+
+        return "\n".join(lines) + "\n"
+
+
+# Default for components built without metrics; never enable it
+DISABLED = Metrics(enabled=False)
+
+
+class _StageTimer:
+    """Context manager recording the duration of one stage."""
+
+    __slots__ = ('metrics', 'stage', 'start')
+
+    def __init__(self, metrics, stage):
+        self.metrics = metrics
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.metrics.observe('stage_seconds', time.perf_counter() - self.start, stage=self.stage)
+        return False
+
+
+def _label_text(labels):
+    return ",".join(f"{key}={value}" for key, value in labels)
+
+
+def _prometheus_labels(labels):
+    if not labels:
+        return ""
+    escaped = (
+        (key, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for key, value in labels
+    )
+    return "{" + ",".join(f'{key}="{value}"' for key, value in escaped) + "}"
+
+
+def write_prometheus(path, text):
+    """
+    Atomically write exposition text, e.g. for node_exporter's textfile collector.
+
+    Args:
+        path (str): Destination .prom file
+        text (str): Output of Metrics.to_prometheus
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def serve_prometheus(render, port=9108, host="127.0.0.1"):
+    """
+    Serve exposition text at ``/metrics`` from a background thread.
+
+    Args:
+        render (callable): Returns the current exposition text
+        port (int): Port to listen on
+        host (str): Interface to bind
+
+    Returns:
+        ThreadingHTTPServer: Running server; call ``shutdown()`` to stop it
+    """
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            if self.path.split('?')[0] != '/metrics':
+                self.send_error(404)
+                return
+            body = render().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
@@ -0,0 +1,273 @@
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+# Column order and compact dtypes of a post DataFrame. 'created_date' is
+# derived from 'created_utc' in one vectorized pass rather than per post.
+POST_DTYPES = {
+    'title': 'string[pyarrow]',
+    'author': 'category',
+    'score': 'int64',
+    'upvote_ratio': 'float32',
+    'num_comments': 'int32',
+    'created_utc': 'float64',
+    'created_date': 'datetime64[ns, UTC]',
+    'url': 'string[pyarrow]',
+    'permalink': 'string[pyarrow]',
+    'selftext': 'string[pyarrow]',
+    'is_self': 'bool',
+    'subreddit': 'category',
+    'post_id': 'string[pyarrow]',
+    'domain': 'category',
+    'over_18': 'bool',
+    'spoiler': 'bool',
+    'stickied': 'bool',
+    'locked': 'bool'
+}
+
+COMMENT_DTYPES = {
+    'comment_id': 'string[pyarrow]',
+    'post_id': 'category',
+    'parent_id': 'string[pyarrow]',
+    'depth': 'int16',
+    'author': 'category',
+    'body': 'string[pyarrow]',
+    'score': 'int64',
+    'created_utc': 'float64',
+    'created_date': 'datetime64[ns, UTC]',
+    'is_submitter': 'bool',
+    'stickied': 'bool',
+    'permalink': 'string[pyarrow]',
+    'subreddit': 'category'
+}
+
+# How scrape results can be ordered: best score first, or as the API listed them
+POST_ORDERS = ('score', 'listing')
+
+
+def extract_post(post):
+    """
+    Pull the raw fields of a PRAW submission into a flat record.
+
+    Only plain attribute reads happen here; formatting and typing are left
+    to ``posts_to_frame`` so they run once per column instead of per post.
+
+    Args:
+        post (praw.models.Submission): Submission to extract
+
+    Returns:
+        dict: Raw post fields
+    """
+    author = post.author
+    return {
+        'title': post.title,
+        'author': author.name if author else '[deleted]',
+        'score': post.score,
+        'upvote_ratio': post.upvote_ratio,
+        'num_comments': post.num_comments,
+        'created_utc': post.created_utc,
+        'url': post.url,
+        'permalink': f"https://reddit.com{post.permalink}",
+        'selftext': getattr(post, 'selftext', ''),
+        'is_self': post.is_self,
+        'subreddit': post.subreddit.display_name,
+        'post_id': post.id,
+        'domain': getattr(post, 'domain', ''),
+        'over_18': post.over_18,
+        'spoiler': post.spoiler,
+        'stickied': post.stickied,
+        'locked': post.locked
+    }
+
+
+def extract_comment(comment, post_id, depth):
+    """
+    Pull the raw fields of a PRAW comment into a flat, parent-linked record.
+
+    Args:
+        comment (praw.models.Comment): Comment to extract
+        post_id (str): ID of the submission the comment belongs to
+        depth (int): Depth in the tree, 0 for top-level comments
+
+    Returns:
+        dict: Raw comment fields
+    """
+    author = comment.author
+    return {
+        'comment_id': comment.id,
+        'post_id': post_id,
+        'parent_id': comment.parent_id,
+        'depth': depth,
+        'author': author.name if author else '[deleted]',
+        'body': comment.body,
+        'score': comment.score,
+        'created_utc': comment.created_utc,
+        'is_submitter': comment.is_submitter,
+        'stickied': comment.stickied,
+        'permalink': f"https://reddit.com{comment.permalink}",
+        'subreddit': comment.subreddit.display_name
+    }
+
+
+def _records_to_frame(records, dtypes):
+    """Collect records into typed column arrays and build the DataFrame once."""
+    if not records:
+        return pd.DataFrame()
+
+    columns = {}
+    for name, dtype in dtypes.items():
+        if name == 'created_date':
+            continue
+        if name not in records[0]:
+            continue
+        columns[name] = pd.Series([record[name] for record in records], dtype=dtype)
+
+    return apply_dtypes(pd.DataFrame(columns), dtypes)
+
+
+def apply_dtypes(df, dtypes):
+    """
+    Cast a DataFrame to the compact schema and derive ``created_date``.
+
+    Also used to re-type frames that lost their dtypes, e.g. after a concat
+    of categoricals with different categories or a round trip through SQL.
+
+    Args:
+        df (pandas.DataFrame): Frame with (a subset of) the schema's columns
+        dtypes (dict): Column name to dtype mapping, e.g. POST_DTYPES
+
+    Returns:
+        pandas.DataFrame: Typed frame in schema column order, extra columns last
+    """
+    if df.empty:
+        return df
+
+    df = df.copy()
+    if 'created_utc' in df:
+        df['created_date'] = pd.to_datetime(df['created_utc'], unit='s', utc=True)
+
+    for name, dtype in dtypes.items():
+        if name in df and str(df[name].dtype) != dtype:
+            df[name] = df[name].astype(dtype)
+
+    ordered = [name for name in dtypes if name in df]
+    return df[ordered + [name for name in df.columns if name not in dtypes]]
+
+
+def posts_to_frame(records):
+    """
+    Build a compact, typed post DataFrame from raw post records.
+
+    Args:
+        records (list): Dicts as returned by extract_post
+
+    Returns:
+        pandas.DataFrame: Post data
+    """
+    return _records_to_frame(records, POST_DTYPES)
+
+
+def comments_to_frame(records):
+    """
+    Build a compact, typed comment DataFrame from raw comment records.
+
+    Args:
+        records (list): Dicts as returned by extract_comment
+
+    Returns:
+        pandas.DataFrame: Comment data
+    """
+    return _records_to_frame(records, COMMENT_DTYPES)
+
+
+def order_posts(df, order="score", top=None):
+    """
+    Order one listing's posts.
+
+    ``top`` selects the best posts with a partial sort (``nlargest``), so
+    only the kept rows are sorted and copied. Ties keep their listing order.
+
+    Args:
+        df (pandas.DataFrame): Posts in listing order
+        order (str): 'score' (highest first) or 'listing' (as returned by the API, no sort at all)
+        top (int): Keep only the ``top`` highest-scoring posts, highest first; overrides ``order``
+
+    Returns:
+        pandas.DataFrame: Ordered posts (``df`` itself when nothing needs to move)
+    """
+    if order not in POST_ORDERS:
+        raise Exception(f"Invalid order: {order}")
+    if df.empty:
+        return df
+
+    if top is not None and top < len(df):
+        return df.nlargest(top, 'score', keep='first').reset_index(drop=True)
+    if order == "listing" and top is None:
+        return df
+    return df.sort_values('score', ascending=False, kind='stable').reset_index(drop=True)
+
+
+def concat_frames(frames, dtypes=POST_DTYPES):
+    """
+    Concatenate typed frames without losing their dtypes.
+
+    A plain concat turns categoricals with different categories into
+    object columns, which then have to be re-typed in a second full pass.
+    Categoricals are combined with ``union_categoricals`` instead, which
+    only merges the categories and remaps the integer codes.
+
+    Args:
+        frames (list): Frames with the schema's dtypes
+        dtypes (dict): Column name to dtype mapping, e.g. POST_DTYPES
+
+    Returns:
+        pandas.DataFrame: All rows, typed
+    """
+    frames = [df for df in frames if not df.empty]
+    if not frames:
+        return pd.DataFrame()
+    if len(frames) == 1:
+        return frames[0].reset_index(drop=True)
+
+    categoricals = [
+        name for name, dtype in dtypes.items()
+        if dtype == 'category' and all(name in df and isinstance(df[name].dtype, pd.CategoricalDtype) for df in frames)
+    ]
+    combined = {name: union_categoricals([df[name] for df in frames]) for name in categoricals}
+    df = pd.concat([frame.drop(columns=categoricals) for frame in frames], ignore_index=True)
+    df = df.assign(**combined)[list(frames[0].columns) + [name for name in df.columns if name not in frames[0]]]
+
+    if any(name in df and df[name].dtype != dtype for name, dtype in dtypes.items()):
+        return apply_dtypes(df, dtypes)
+    return df
+
+
+def merge_sorted(frames, top=None):
+    """
+    Merge listings that are each already sorted by score, highest first.
+
+    Rather than re-sorting the combined rows from scratch, the runs are
+    merged: a stable sort of the concatenated scores finds the k presorted
+    runs and merges them in O(n log k), and the rows are then copied once
+    into their final order. With ``top``, each run is cut to its first
+    ``top`` rows before anything is combined, so the merge and the copy
+    only touch k * top rows no matter how long the listings are.
+
+    Args:
+        frames (list): Post DataFrames, each sorted by descending score
+        top (int): Keep only the ``top`` highest-scoring posts overall
+
+    Returns:
+        pandas.DataFrame: Posts of all frames, highest score first
+    """
+    if top is not None:
+        frames = [df.head(top) for df in frames]
+    frames = [df for df in frames if not df.empty]
+    if len(frames) < 2:
+        return concat_frames(frames)
+
+    positions = np.argsort(-np.concatenate([df['score'].to_numpy() for df in frames]), kind='stable')
+    if top is not None:
+        positions = positions[:top]
+
+    return concat_frames(frames).take(positions).reset_index(drop=True)
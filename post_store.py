@@ -0,0 +1,790 @@
+import json
+import math
+import sqlite3
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from normalize import COMMENT_DTYPES, POST_DTYPES, apply_dtypes
+
+POST_COLUMNS = [
+    'post_id', 'title', 'author', 'score', 'upvote_ratio', 'num_comments', 'created_utc', 'created_date',
+    'url', 'permalink', 'selftext', 'is_self', 'subreddit', 'domain', 'over_18', 'spoiler', 'stickied', 'locked'
+]
+
+COMMENT_COLUMNS = [
+    'comment_id', 'post_id', 'parent_id', 'depth', 'author', 'body', 'score', 'created_utc', 'created_date',
+    'is_submitter', 'stickied', 'permalink', 'subreddit'
+]
+
+# Columns the results view may sort on, mapped to their SQL ordering
+SORT_COLUMNS = {
+    'score': 'score DESC',
+    'num_comments': 'num_comments DESC',
+    'created_utc': 'created_utc DESC',
+    'upvote_ratio': 'upvote_ratio DESC'
+}
+
+LINK_CONTENT_COLUMNS = ['url', 'domain', 'status', 'title', 'text', 'error', 'fetched_utc']
+
+# Bucket sizes (seconds) and groupings the activity rollups are kept at
+ROLLUP_WINDOWS = (3600, 86400)
+ROLLUP_DIMENSIONS = ('subreddit', 'author')
+
+# Per bucket: posts created in it with their current score and comment total
+# (by created_utc), and score and comments gained while it was the current
+# bucket (by observation time, from re-scrapes and metric snapshots)
+ROLLUP_COLUMNS = ['posts', 'score', 'comments', 'score_gained', 'comments_gained']
+
+ROLLUP_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS rollups (
+        dimension TEXT NOT NULL,
+        key TEXT NOT NULL,
+        window_seconds INTEGER NOT NULL,
+        bucket_utc REAL NOT NULL,
+        posts INTEGER NOT NULL DEFAULT 0,
+        score INTEGER NOT NULL DEFAULT 0,
+        comments INTEGER NOT NULL DEFAULT 0,
+        score_gained INTEGER NOT NULL DEFAULT 0,
+        comments_gained INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (dimension, key, window_seconds, bucket_utc)
+    ) WITHOUT ROWID;
+"""
+
+# Full-text index over titles and selftext, kept in sync with 'posts' by
+# triggers so every upsert indexes incrementally. Title matches weigh more.
+FTS_SCHEMA = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5(
+        title, selftext, content='posts', content_rowid='rowid', tokenize='porter unicode61 remove_diacritics 2'
+    );
+    CREATE TRIGGER IF NOT EXISTS posts_fts_insert AFTER INSERT ON posts BEGIN
+        INSERT INTO posts_fts (rowid, title, selftext) VALUES (new.rowid, new.title, new.selftext);
+    END;
+    CREATE TRIGGER IF NOT EXISTS posts_fts_delete AFTER DELETE ON posts BEGIN
+        INSERT INTO posts_fts (posts_fts, rowid, title, selftext) VALUES ('delete', old.rowid, old.title, old.selftext);
+    END;
+    CREATE TRIGGER IF NOT EXISTS posts_fts_update AFTER UPDATE OF title, selftext ON posts
+    WHEN old.title IS NOT new.title OR old.selftext IS NOT new.selftext BEGIN
+        INSERT INTO posts_fts (posts_fts, rowid, title, selftext) VALUES ('delete', old.rowid, old.title, old.selftext);
+        INSERT INTO posts_fts (rowid, title, selftext) VALUES (new.rowid, new.title, new.selftext);
+    END;
+"""
+
+FTS_TITLE_WEIGHT = 4.0
+
+# Reddit search sorts mapped to index orderings; 'relevance' and 'hot' use the blended rank
+SEARCH_ORDER = {
+    'relevance': 'rank',
+    'hot': 'rank',
+    'top': 'p.score DESC',
+    'new': 'p.created_utc DESC',
+    'comments': 'p.num_comments DESC'
+}
+
+
+class PostStore:
+    """
+    Local SQLite storage for scraped posts.
+
+    Posts are upserted on ``post_id`` so re-scraping refreshes score and
+    comment counts instead of duplicating rows. Filtering, counting and
+    pagination run as indexed SQL queries, so callers never need to hold the
+    whole history in memory. One instance can be shared between threads.
+    """
+
+    def __init__(self, path="reddit_posts.db"):
+        """
+        Open or create the store.
+
+        Args:
+            path (str): SQLite database file (':memory:' for a throwaway store)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript("""
+            PRAGMA journal_mode = WAL;
+            CREATE TABLE IF NOT EXISTS posts (
+                post_id TEXT PRIMARY KEY,
+                title TEXT,
+                author TEXT,
+                score INTEGER,
+                upvote_ratio REAL,
+                num_comments INTEGER,
+                created_utc REAL,
+                created_date TEXT,
+                url TEXT,
+                permalink TEXT,
+                selftext TEXT,
+                is_self INTEGER,
+                subreddit TEXT,
+                domain TEXT,
+                over_18 INTEGER,
+                spoiler INTEGER,
+                stickied INTEGER,
+                locked INTEGER,
+                first_seen_utc REAL,
+                last_updated_utc REAL
+            );
+            CREATE INDEX IF NOT EXISTS idx_posts_subreddit ON posts (subreddit COLLATE NOCASE);
+            CREATE INDEX IF NOT EXISTS idx_posts_created_utc ON posts (created_utc);
+            CREATE INDEX IF NOT EXISTS idx_posts_score ON posts (score);
+            CREATE TABLE IF NOT EXISTS comments (
+                comment_id TEXT PRIMARY KEY,
+                post_id TEXT NOT NULL,
+                parent_id TEXT,
+                depth INTEGER,
+                author TEXT,
+                body TEXT,
+                score INTEGER,
+                created_utc REAL,
+                created_date TEXT,
+                is_submitter INTEGER,
+                stickied INTEGER,
+                permalink TEXT,
+                subreddit TEXT,
+                last_updated_utc REAL
+            );
+            CREATE INDEX IF NOT EXISTS idx_comments_post_id ON comments (post_id);
+            CREATE TABLE IF NOT EXISTS post_metrics (
+                post_id TEXT NOT NULL,
+                snapshot_utc REAL NOT NULL,
+                score INTEGER,
+                upvote_ratio REAL,
+                num_comments INTEGER,
+                PRIMARY KEY (post_id, snapshot_utc)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS link_content (
+                url TEXT PRIMARY KEY,
+                domain TEXT,
+                status TEXT,
+                title TEXT,
+                text TEXT,
+                error TEXT,
+                fetched_utc REAL
+            );
+        """)
+        self._conn.commit()
+        self.fts = self._init_fts()
+        self._init_rollups()
+
+    def _init_fts(self):
+        """
+        Create the full-text index, backfilling it for databases that predate it.
+
+        Returns:
+            bool: False if this SQLite build lacks FTS5, in which case search is unavailable
+        """
+        try:
+            exists = self._conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'posts_fts'"
+            ).fetchone()
+            self._conn.executescript(FTS_SCHEMA)
+            if not exists:
+                self._conn.execute("INSERT INTO posts_fts (posts_fts) VALUES ('rebuild')")
+            self._conn.commit()
+        except sqlite3.OperationalError:
+            return False
+
+        # ln() is only built in when SQLite has math functions compiled in
+        try:
+            self._conn.execute("SELECT ln(1)")
+        except sqlite3.OperationalError:
+            self._conn.create_function("ln", 1, math.log, deterministic=True)
+        return True
+
+    def _init_rollups(self):
+        """Create the rollup table, backfilling it from posts stored before it existed."""
+        exists = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'rollups'"
+        ).fetchone()
+        with self._conn:
+            self._conn.executescript(ROLLUP_SCHEMA)
+            if exists:
+                return
+            for dimension in ROLLUP_DIMENSIONS:
+                for window in ROLLUP_WINDOWS:
+                    self._conn.execute(
+                        f"""
+                        INSERT INTO rollups (dimension, key, window_seconds, bucket_utc, posts, score, comments)
+                        SELECT ?, {dimension}, ?, CAST(created_utc / ? AS INTEGER) * ?, COUNT(*),
+                               COALESCE(SUM(score), 0), COALESCE(SUM(num_comments), 0)
+                        FROM posts WHERE {dimension} IS NOT NULL AND created_utc IS NOT NULL
+                        GROUP BY {dimension}, CAST(created_utc / ? AS INTEGER)
+                        """,
+                        (dimension, window, window, window, window)
+                    )
+
+    def _stored_rows(self, post_ids, columns):
+        """Fetch some columns of stored posts as post_id -> tuple. Caller holds the lock."""
+        rows = {}
+        for start in range(0, len(post_ids), 500):
+            chunk = post_ids[start:start + 500]
+            rows.update(
+                (row[0], row[1:]) for row in self._conn.execute(
+                    f"SELECT post_id, {', '.join(columns)} FROM posts WHERE post_id IN ({', '.join('?' * len(chunk))})",
+                    chunk
+                )
+            )
+        return rows
+
+    def _roll_up(self, observations, newer_only=False):
+        """
+        Fold a batch of post observations into the rollups, before the posts table is updated.
+
+        Each observation is diffed against the previous one of the same post
+        (earlier in the batch, else the stored row), so only the change is
+        added to the buckets and the full history is never re-aggregated.
+        A post seen for the first time adds a post and its score and
+        comments to its creation bucket; it has no earlier value, so it adds
+        nothing to the gained columns. Caller holds the lock inside a
+        transaction.
+
+        Args:
+            observations (pandas.DataFrame): post_id, observed_utc, score, num_comments, and
+                subreddit, author and created_utc where known (looked up in the store otherwise)
+            newer_only (bool): Skip observations older than the stored row, as metric snapshots do
+        """
+        df = observations.sort_values(['post_id', 'observed_utc'], kind='stable')
+        post_ids = df['post_id'].astype(object).to_numpy()
+        attributes = [column for column in ('subreddit', 'author', 'created_utc') if column not in df]
+        stored = self._stored_rows(
+            list(dict.fromkeys(post_ids)), ['score', 'num_comments', 'last_updated_utc'] + attributes
+        )
+        missing = (None,) * (3 + len(attributes))
+        stored = list(zip(*(stored.get(post_id, missing) for post_id in post_ids)))
+        values = {
+            column: np.array(stored[index], dtype=float if index < 3 or column == 'created_utc' else object)
+            for index, column in enumerate(['score_stored', 'comments_stored', 'last_updated_utc'] + attributes)
+        }
+        for column in ('subreddit', 'author', 'created_utc'):
+            if column not in values:
+                values[column] = df[column].to_numpy(dtype=float if column == 'created_utc' else object)
+
+        score = df['score'].to_numpy(dtype=float)
+        comments = df['num_comments'].to_numpy(dtype=float)
+        observed = df['observed_utc'].to_numpy(dtype=float)
+
+        # Snapshots of unknown posts, or older than the stored values, change nothing
+        keep = ~np.isnan(values['created_utc'])
+        if newer_only:
+            keep &= ~(observed < values['last_updated_utc'])
+        if not keep.any():
+            return
+
+        # Rows are sorted by post, so the previous observation is the row above when it is the same post
+        repeat = np.zeros(len(post_ids), dtype=bool)
+        repeat[1:] = post_ids[1:] == post_ids[:-1]
+        previous_score = values['score_stored'].copy()
+        previous_comments = values['comments_stored'].copy()
+        previous_score[1:][repeat[1:]] = score[:-1][repeat[1:]]
+        previous_comments[1:][repeat[1:]] = comments[:-1][repeat[1:]]
+
+        is_new = np.isnan(previous_score)[keep]
+        score_delta = np.nan_to_num(score - previous_score)[keep]
+        comments_delta = np.nan_to_num(comments - previous_comments)[keep]
+
+        changes = {
+            'posts': is_new.astype(np.int64),
+            'score': np.where(is_new, np.nan_to_num(score[keep]), score_delta).astype(np.int64),
+            'comments': np.where(is_new, np.nan_to_num(comments[keep]), comments_delta).astype(np.int64),
+            'score_gained': np.where(is_new, 0, score_delta).astype(np.int64),
+            'comments_gained': np.where(is_new, 0, comments_delta).astype(np.int64)
+        }
+
+        # Creation-time totals and observation-time growth of every dimension and window are
+        # stacked into one long frame, so all buckets come out of a single groupby
+        created = values['created_utc'][keep]
+        observed = observed[keep]
+        gained = (changes['score_gained'] != 0) | (changes['comments_gained'] != 0)
+        sources = (
+            (slice(None), created, ('posts', 'score', 'comments')),
+            (gained, observed, ('score_gained', 'comments_gained'))
+        )
+        stacked = {column: [] for column in ['dimension', 'key', 'window_seconds', 'bucket_utc'] + ROLLUP_COLUMNS}
+        for dimension in ROLLUP_DIMENSIONS:
+            keys = values[dimension][keep]
+            for window in ROLLUP_WINDOWS:
+                for mask, times, columns in sources:
+                    count = len(times[mask])
+                    stacked['dimension'].append(np.full(count, dimension, dtype=object))
+                    stacked['key'].append(keys[mask])
+                    stacked['window_seconds'].append(np.full(count, window))
+                    stacked['bucket_utc'].append(times[mask] // window * window)
+                    for column in ROLLUP_COLUMNS:
+                        stacked[column].append(
+                            changes[column][mask] if column in columns else np.zeros(count, dtype=np.int64)
+                        )
+        long = pd.DataFrame({column: np.concatenate(arrays) for column, arrays in stacked.items()})
+        sums = long.groupby(['dimension', 'key', 'window_seconds', 'bucket_utc'])[ROLLUP_COLUMNS].sum()
+
+        # Buckets whose totals did not change (e.g. a re-scrape with no new votes) need no write
+        rows = [
+            bucket + tuple(totals)
+            for bucket, totals in zip(sums.index.tolist(), sums.to_numpy().tolist()) if any(totals)
+        ]
+
+        self._conn.executemany(
+            f"""
+            INSERT INTO rollups (dimension, key, window_seconds, bucket_utc, {", ".join(ROLLUP_COLUMNS)})
+            VALUES (?, ?, ?, ?, {", ".join("?" * len(ROLLUP_COLUMNS))})
+            ON CONFLICT (dimension, key, window_seconds, bucket_utc) DO UPDATE SET
+            {", ".join(f"{column} = {column} + excluded.{column}" for column in ROLLUP_COLUMNS)}
+            """,
+            rows
+        )
+
+    def upsert_posts(self, posts):
+        """
+        Insert new posts and refresh the metrics of known ones.
+
+        Args:
+            posts (pandas.DataFrame or list): Post data as a DataFrame or list of dicts
+
+        Returns:
+            int: Number of posts written
+        """
+        frame = posts if isinstance(posts, pd.DataFrame) else pd.DataFrame(posts)
+        if frame.empty:
+            return 0
+        posts = frame.to_dict('records')
+
+        now = time.time()
+        rows = [
+            tuple(_to_sql(post.get(column)) for column in POST_COLUMNS) + (now, now)
+            for post in posts
+        ]
+        observations = frame.reindex(
+            columns=['post_id', 'subreddit', 'author', 'created_utc', 'score', 'num_comments']
+        ).assign(observed_utc=now)
+        columns = POST_COLUMNS + ['first_seen_utc', 'last_updated_utc']
+        updates = ", ".join(
+            f"{column} = excluded.{column}" for column in columns if column not in ('post_id', 'first_seen_utc')
+        )
+
+        with self._lock, self._conn:
+            self._roll_up(observations)
+            self._conn.executemany(
+                f"""
+                INSERT INTO posts ({", ".join(columns)}) VALUES ({", ".join("?" * len(columns))})
+                ON CONFLICT (post_id) DO UPDATE SET {updates}
+                """,
+                rows
+            )
+        return len(rows)
+
+    def upsert_comments(self, comments):
+        """
+        Insert new comments and refresh the score/body of known ones.
+
+        Args:
+            comments (pandas.DataFrame or list): Comment data as a DataFrame or list of dicts
+
+        Returns:
+            int: Number of comments written
+        """
+        if isinstance(comments, pd.DataFrame):
+            comments = comments.to_dict('records')
+        if not comments:
+            return 0
+
+        now = time.time()
+        rows = [tuple(_to_sql(comment.get(column)) for column in COMMENT_COLUMNS) + (now,) for comment in comments]
+        columns = COMMENT_COLUMNS + ['last_updated_utc']
+        updates = ", ".join(f"{column} = excluded.{column}" for column in columns if column != 'comment_id')
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"""
+                INSERT INTO comments ({", ".join(columns)}) VALUES ({", ".join("?" * len(columns))})
+                ON CONFLICT (comment_id) DO UPDATE SET {updates}
+                """,
+                rows
+            )
+        return len(rows)
+
+    def query_comments(self, post_id):
+        """
+        Fetch the stored comments of a submission in tree order by depth.
+
+        Args:
+            post_id (str): ID of the submission
+
+        Returns:
+            pandas.DataFrame: Comments, top-level first
+        """
+        with self._lock:
+            df = pd.read_sql_query(
+                f"SELECT {', '.join(COMMENT_COLUMNS)} FROM comments WHERE post_id = ? ORDER BY depth, score DESC",
+                self._conn,
+                params=[post_id]
+            )
+
+        return apply_dtypes(df, COMMENT_DTYPES)
+
+    def add_metric_snapshots(self, snapshots):
+        """
+        Record metric snapshots and refresh the matching posts.
+
+        Args:
+            snapshots (pandas.DataFrame): Rows with post_id, snapshot_utc, score, upvote_ratio and num_comments
+
+        Returns:
+            int: Number of snapshots written
+        """
+        if snapshots.empty:
+            return 0
+
+        rows = [
+            tuple(_to_sql(value) for value in row)
+            for row in snapshots[['post_id', 'snapshot_utc', 'score', 'upvote_ratio', 'num_comments']].itertuples(
+                index=False
+            )
+        ]
+
+        with self._lock, self._conn:
+            self._roll_up(
+                snapshots[['post_id', 'snapshot_utc', 'score', 'num_comments']].rename(
+                    columns={'snapshot_utc': 'observed_utc'}
+                ),
+                newer_only=True
+            )
+            self._conn.executemany(
+                """
+                INSERT OR REPLACE INTO post_metrics (post_id, snapshot_utc, score, upvote_ratio, num_comments)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                rows
+            )
+            self._conn.executemany(
+                """
+                UPDATE posts SET score = ?, upvote_ratio = ?, num_comments = ?, last_updated_utc = ?
+                WHERE post_id = ? AND (last_updated_utc IS NULL OR last_updated_utc <= ?)
+                """,
+                [(score, ratio, comments, utc, post_id, utc) for post_id, utc, score, ratio, comments in rows]
+            )
+        return len(rows)
+
+    def query_metric_history(self, post_ids):
+        """
+        Fetch the metric snapshots recorded for some posts.
+
+        Args:
+            post_ids (list): Post IDs
+
+        Returns:
+            pandas.DataFrame: Snapshots ordered by post and time
+        """
+        with self._lock:
+            return pd.read_sql_query(
+                f"""
+                SELECT post_id, snapshot_utc, score, upvote_ratio, num_comments FROM post_metrics
+                WHERE post_id IN ({', '.join('?' * len(post_ids))})
+                ORDER BY post_id, snapshot_utc
+                """,
+                self._conn,
+                params=list(post_ids)
+            )
+
+    def upsert_link_content(self, records):
+        """
+        Store the extracted content of linked pages, keyed by URL.
+
+        Args:
+            records (list): Dicts with the LINK_CONTENT_COLUMNS fields
+
+        Returns:
+            int: Number of records written
+        """
+        if not records:
+            return 0
+
+        rows = [tuple(_to_sql(record.get(column)) for column in LINK_CONTENT_COLUMNS) for record in records]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"""
+                INSERT OR REPLACE INTO link_content ({", ".join(LINK_CONTENT_COLUMNS)})
+                VALUES ({", ".join("?" * len(LINK_CONTENT_COLUMNS))})
+                """,
+                rows
+            )
+        return len(rows)
+
+    def query_link_content(self, urls):
+        """
+        Fetch stored link content for some URLs.
+
+        Args:
+            urls (list): Page URLs as they appear in the posts' ``url`` column
+
+        Returns:
+            pandas.DataFrame: One row per URL that has been fetched, successfully or not
+        """
+        urls = list(urls)
+        frames = []
+        with self._lock:
+            # Stay below SQLite's bound-parameter limit
+            for start in range(0, len(urls), 500):
+                chunk = urls[start:start + 500]
+                frames.append(pd.read_sql_query(
+                    f"SELECT {', '.join(LINK_CONTENT_COLUMNS)} FROM link_content WHERE url IN ({', '.join('?' * len(chunk))})",
+                    self._conn,
+                    params=chunk
+                ))
+
+        if not frames:
+            return pd.DataFrame(columns=LINK_CONTENT_COLUMNS)
+        return pd.concat(frames, ignore_index=True)
+
+    def _where(self, subreddits=None, min_score=None, min_comments=None, post_ids=None):
+        """Build the WHERE clause and parameters shared by the query helpers."""
+        clauses = []
+        params = []
+
+        if post_ids is not None:
+            # One JSON parameter instead of one per ID, so a large scrape stays under SQLite's variable limit
+            clauses.append("post_id IN (SELECT value FROM json_each(?))")
+            params.append(json.dumps(list(post_ids)))
+        if subreddits:
+            clauses.append(f"subreddit COLLATE NOCASE IN ({', '.join('?' * len(subreddits))})")
+            params.extend(subreddits)
+        if min_score is not None:
+            clauses.append("score >= ?")
+            params.append(min_score)
+        if min_comments is not None:
+            clauses.append("num_comments >= ?")
+            params.append(min_comments)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    def query_posts(self, subreddits=None, min_score=None, min_comments=None, order_by="score", limit=None,
+                    offset=0, post_ids=None):
+        """
+        Fetch stored posts matching the given filters.
+
+        Args:
+            subreddits (list): Restrict to these subreddits (case-insensitive)
+            min_score (int): Minimum post score
+            min_comments (int): Minimum number of comments
+            order_by (str): Column to sort on, descending (see SORT_COLUMNS)
+            limit (int): Maximum number of posts to return, None for all
+            offset (int): Number of matching posts to skip, for pagination
+            post_ids (list): Restrict to these posts, e.g. the ones one scrape stored; None for no restriction
+
+        Returns:
+            pandas.DataFrame: Matching posts
+        """
+        if order_by not in SORT_COLUMNS:
+            raise Exception(f"Invalid sort column: {order_by}")
+
+        where, params = self._where(subreddits, min_score, min_comments, post_ids)
+        sql = f"SELECT {', '.join(POST_COLUMNS)} FROM posts {where} ORDER BY {SORT_COLUMNS[order_by]}"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += [limit, offset]
+
+        with self._lock:
+            df = pd.read_sql_query(sql, self._conn, params=params)
+
+        return apply_dtypes(df, POST_DTYPES)
+
+    def version(self):
+        """
+        Get a counter that changes whenever this store is written to.
+
+        Lets views memoize query results until new posts or snapshots arrive,
+        whether written through this connection or by another one (e.g. a
+        CLI job sharing the database file).
+
+        Returns:
+            tuple: (SQLite data_version, rows changed through this connection)
+        """
+        with self._lock:
+            return self._conn.execute("PRAGMA data_version").fetchone()[0], self._conn.total_changes
+
+    def count_posts(self, subreddits=None, min_score=None, min_comments=None, post_ids=None):
+        """
+        Count stored posts matching the given filters.
+
+        Returns:
+            int: Number of matching posts
+        """
+        where, params = self._where(subreddits, min_score, min_comments, post_ids)
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM posts {where}", params).fetchone()[0]
+
+    def summary(self, subreddits=None, post_ids=None):
+        """
+        Compute the dashboard summary metrics in SQL.
+
+        Args:
+            subreddits (list): Restrict to these subreddits (case-insensitive)
+            post_ids (list): Restrict to these posts; None for no restriction
+
+        Returns:
+            dict: Post count, average score, total comments and average upvote ratio
+        """
+        where, params = self._where(subreddits, post_ids=post_ids)
+        with self._lock:
+            row = self._conn.execute(
+                f"""
+                SELECT COUNT(*), AVG(score), COALESCE(SUM(num_comments), 0), AVG(upvote_ratio)
+                FROM posts {where}
+                """,
+                params
+            ).fetchone()
+
+        return {
+            'total_posts': row[0],
+            'avg_score': row[1] or 0.0,
+            'total_comments': row[2],
+            'avg_upvote_ratio': row[3] or 0.0
+        }
+
+    def query_rollups(self, dimension="subreddit", window=3600, keys=None, since_utc=None, span=None):
+        """
+        Fetch activity rollups as a time series per subreddit or author.
+
+        Rates are per hour: ``posts_per_hour`` counts posts by creation time,
+        ``score_velocity`` and ``comment_growth`` are the score and comments
+        gained between scrapes (so they need a post to be seen at least twice).
+
+        Args:
+            dimension (str): 'subreddit' or 'author' (see ROLLUP_DIMENSIONS)
+            window (int): Bucket size in seconds (see ROLLUP_WINDOWS)
+            keys (list): Restrict to these subreddits or authors (case-insensitive)
+            since_utc (float): Only buckets starting at or after this Unix time
+            span (float): Turn each bucket into a trailing sum over this many seconds, e.g. 86400 for
+                24-hour rolling totals of hourly buckets; rates are then per hour of the span
+
+        Returns:
+            pandas.DataFrame: key, bucket_utc, bucket_date, the ROLLUP_COLUMNS totals and the rates,
+                ordered by key and time
+        """
+        if dimension not in ROLLUP_DIMENSIONS:
+            raise Exception(f"Invalid rollup dimension: {dimension}")
+        if window not in ROLLUP_WINDOWS:
+            raise Exception(f"Invalid rollup window: {window}")
+
+        clauses = ["dimension = ?", "window_seconds = ?"]
+        params = [dimension, window]
+        if keys:
+            clauses.append(f"key COLLATE NOCASE IN ({', '.join('?' * len(keys))})")
+            params.extend(keys)
+        if since_utc is not None:
+            # Earlier buckets are still needed to fill the first rolling spans
+            clauses.append("bucket_utc >= ?")
+            params.append(since_utc - (span or 0))
+
+        with self._lock:
+            df = pd.read_sql_query(
+                f"""
+                SELECT key, bucket_utc, {", ".join(ROLLUP_COLUMNS)} FROM rollups
+                WHERE {' AND '.join(clauses)}
+                ORDER BY key, bucket_utc
+                """,
+                self._conn,
+                params=params
+            )
+
+        df['bucket_date'] = pd.to_datetime(df['bucket_utc'], unit='s', utc=True)
+        if span and not df.empty:
+            df = (
+                df.set_index('bucket_date')
+                .groupby('key', sort=False)[ROLLUP_COLUMNS]
+                .rolling(f"{int(span)}s")
+                .sum()
+                .reset_index()
+            )
+            df.insert(1, 'bucket_utc', (df['bucket_date'] - pd.Timestamp(0, tz='UTC')).dt.total_seconds())
+            if since_utc is not None:
+                df = df[df['bucket_utc'] >= since_utc].reset_index(drop=True)
+
+        hours = (span or window) / 3600
+        df['posts_per_hour'] = df['posts'] / hours
+        df['score_velocity'] = df['score_gained'] / hours
+        df['comment_growth'] = df['comments_gained'] / hours
+        return df[['key', 'bucket_utc', 'bucket_date'] + ROLLUP_COLUMNS
+                  + ['posts_per_hour', 'score_velocity', 'comment_growth']]
+
+    def subreddits(self):
+        """
+        List the subreddits present in the store.
+
+        Returns:
+            list: Subreddit names, alphabetically
+        """
+        with self._lock:
+            rows = self._conn.execute("SELECT DISTINCT subreddit FROM posts ORDER BY subreddit COLLATE NOCASE")
+            return [row[0] for row in rows]
+
+    def search(self, query, subreddits=None, sort="relevance", since_utc=None, limit=25, score_weight=0.25):
+        """
+        Full-text search over stored titles and selftext.
+
+        ``query`` uses FTS5 syntax: words are ANDed, and ``OR``, ``NOT``,
+        ``"exact phrases"``, ``prefix*`` and parentheses are supported.
+        Relevance blends BM25 (title matches weigh more) with the post's score,
+        so among similarly relevant posts the popular ones come first.
+
+        Args:
+            query (str): Search query
+            subreddits (list): Restrict to these subreddits (case-insensitive)
+            sort (str): 'relevance', 'hot', 'top', 'new' or 'comments'
+            since_utc (float): Only posts created at or after this Unix time
+            limit (int): Maximum number of posts to return
+            score_weight (float): How strongly the post score boosts relevance, 0 for pure BM25
+
+        Returns:
+            pandas.DataFrame: Matching posts, best first
+        """
+        if not self.fts:
+            raise Exception("Full-text search needs an SQLite build with FTS5")
+        if sort not in SEARCH_ORDER:
+            raise Exception(f"Invalid search sort: {sort}")
+
+        where, params = self._where(subreddits)
+        clauses = ["posts_fts MATCH ?"] + ([where[len("WHERE "):]] if where else [])
+        params = [query] + params
+        if since_utc is not None:
+            clauses.append("p.created_utc >= ?")
+            params.append(since_utc)
+
+        # bm25() is negative (lower is better), so a score boost multiplies it
+        sql = f"""
+            SELECT {', '.join(f'p.{column}' for column in POST_COLUMNS)},
+                   bm25(posts_fts, ?, 1.0) * (1 + ? * ln(1 + max(p.score, 0))) AS rank
+            FROM posts_fts JOIN posts p ON p.rowid = posts_fts.rowid
+            WHERE {' AND '.join(clauses)}
+            ORDER BY {SEARCH_ORDER[sort]}
+            LIMIT ?
+        """
+        params = [FTS_TITLE_WEIGHT, score_weight] + params + [limit]
+
+        try:
+            with self._lock:
+                df = pd.read_sql_query(sql, self._conn, params=params)
+        except pd.errors.DatabaseError as e:
+            raise Exception(f"Invalid search query '{query}': {e.__cause__ or e}")
+
+        return apply_dtypes(df.drop(columns='rank'), POST_DTYPES)
+
+    def close(self):
+        """Close the underlying database connection."""
+        self._conn.close()
+
+
+def _to_sql(value):
+    """Convert pandas/numpy scalars into types sqlite3 can bind."""
+    if value is None or value is pd.NaT:
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+    if hasattr(value, 'item'):
+        value = value.item()
+    if isinstance(value, float) and value != value:
+        return None
+    return value
@@ -0,0 +1,137 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Token bucket that tracks Reddit's request budget.
+
+    The bucket starts from a conservative local estimate and is re-synced from
+    Reddit's ``X-Ratelimit-Remaining`` / ``X-Ratelimit-Reset`` headers after
+    every response, so callers only block when the next HTTP request would
+    actually go over the quota. A single instance is safe to share between
+    threads.
+    """
+
+    def __init__(self, capacity=100, window=600, clock=time.monotonic, sleep=time.sleep):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            capacity (int): Requests allowed per window until Reddit reports otherwise
+            window (float): Length of the rate-limit window in seconds
+            clock (callable): Monotonic clock, overridable for testing
+            sleep (callable): Sleep function, overridable for testing
+        """
+        self.capacity = capacity
+        self.window = window
+        self.tokens = float(capacity)
+        self.reset_at = None
+        self.total_wait = 0.0
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._last_refill = clock()
+
+    def _refill(self, now):
+        """Top up the bucket. Caller must hold the lock."""
+        if self.reset_at is not None:
+            # Reddit uses fixed windows: the budget comes back all at once
+            if now >= self.reset_at:
+                self.tokens = float(self.capacity)
+                self.reset_at = None
+        else:
+            # No server feedback yet - refill smoothly at the nominal rate
+            elapsed = now - self._last_refill
+            self.tokens = min(float(self.capacity), self.tokens + elapsed * self.capacity / self.window)
+        self._last_refill = now
+
+    def acquire(self):
+        """
+        Take one request token, blocking only if the budget is exhausted.
+
+        Returns:
+            float: Seconds spent waiting for the token
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    self.total_wait += waited
+                    return waited
+                if self.reset_at is not None:
+                    delay = max(self.reset_at - now, 0.01)
+                else:
+                    delay = (1 - self.tokens) * self.window / self.capacity
+            self._sleep(delay)
+            waited += delay
+
+    def update(self, remaining, reset_seconds, used=None):
+        """
+        Sync the bucket with the budget reported by Reddit.
+
+        Args:
+            remaining (float): Requests left in the current window
+            reset_seconds (float): Seconds until the window resets
+            used (int): Requests already used in the current window
+        """
+        with self._lock:
+            now = self._clock()
+            if used is not None:
+                self.capacity = max(int(remaining + used), 1)
+            self.tokens = float(remaining)
+            self.reset_at = now + max(float(reset_seconds), 0.0)
+            self._last_refill = now
+
+    def update_from_headers(self, headers):
+        """
+        Sync the bucket from HTTP response headers.
+
+        Responses without rate-limit headers (e.g. the OAuth token endpoint)
+        leave the bucket unchanged.
+
+        Args:
+            headers (Mapping): Response headers, looked up case-insensitively
+        """
+        headers = {key.lower(): value for key, value in headers.items()}
+        if "x-ratelimit-remaining" not in headers or "x-ratelimit-reset" not in headers:
+            return
+        try:
+            remaining = float(headers["x-ratelimit-remaining"])
+            reset_seconds = float(headers["x-ratelimit-reset"])
+            used = int(float(headers["x-ratelimit-used"])) if "x-ratelimit-used" in headers else None
+        except ValueError:
+            return
+        self.update(remaining, reset_seconds, used)
+
+    def update_from_limits(self, limits):
+        """
+        Sync the bucket from PRAW's ``reddit.auth.limits`` dictionary.
+
+        Args:
+            limits (dict): Mapping with 'remaining', 'reset_timestamp' and 'used'
+        """
+        if not limits or limits.get("remaining") is None or limits.get("reset_timestamp") is None:
+            return
+        reset_seconds = limits["reset_timestamp"] - time.time()
+        self.update(limits["remaining"], reset_seconds, limits.get("used"))
+
+    def stats(self):
+        """
+        Get a snapshot of the current budget.
+
+        Returns:
+            dict: Remaining tokens, capacity, seconds to reset and total wait time
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            return {
+                'remaining': self.tokens,
+                'capacity': self.capacity,
+                'reset_in': max(self.reset_at - now, 0.0) if self.reset_at is not None else None,
+                'total_wait': self.total_wait
+            }
@@ -1,65 +1,470 @@
 import praw
 import pandas as pd
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 import os
-import requests
+import json
+from prawcore import Requestor
+from prawcore.exceptions import RequestException
+from prawcore.sessions import RetryStrategy
+
+from client_pool import ClientHealth, ClientPool, PooledClient
+from errors import CircuitOpen, RateLimited, ScraperError, Transient, Unauthorized, wrap_error
+from json_listing import JSONListingClient
+from metrics import DISABLED, Metrics
+from normalize import (POST_ORDERS, comments_to_frame, concat_frames, extract_comment, extract_post, merge_sorted,
+                       order_posts, posts_to_frame)
+from rate_limiter import RateLimiter
+from result_cache import result_key
+from retry import CircuitBreaker, RetryPolicy
+
+# Reddit returns at most 100 items per listing page and ~1000 per sort
+LISTING_PAGE_SIZE = 100
+MAX_LISTING_DEPTH = 1000
+
+# /api/info accepts up to 100 fullnames per request
+INFO_BATCH_SIZE = 100
+
+# Search time filters as look-back windows in seconds ('all' has none)
+TIME_FILTER_SECONDS = {
+    'hour': 3600,
+    'day': 86400,
+    'week': 7 * 86400,
+    'month': 30 * 86400,
+    'year': 365 * 86400
+}
+
+
+class SingleAttempt(RetryStrategy):
+    """prawcore retry strategy that never retries, leaving retries to RateLimitedRequestor."""
+
+    def _sleep_seconds(self):
+        return None
+
+    def consume_available_retry(self):
+        return self
+
+    def should_retry_on_failure(self):
+        return False
+
+
+def disable_session_retries(reddit):
+    """
+    Make a client's RateLimitedRequestor the only retry layer.
+    
+    prawcore's Session retries 408/5xx and connection errors on its own, on
+    top of the requestor's RetryPolicy, so the two layers would multiply the
+    attempts per request. PRAW offers no option for this, hence the private
+    attributes.
+    
+    Args:
+        reddit (praw.Reddit): Client created with ``requestor_class=RateLimitedRequestor``
+    """
+    for session in (reddit._authorized_core, reddit._read_only_core):
+        if session is not None:
+            session._retry_strategy_class = SingleAttempt
+
+
+class RateLimitedRequestor(Requestor):
+    """
+    prawcore requestor that sends every HTTP call through a shared RateLimiter.
+    
+    With a response cache attached, fresh cached GETs are answered locally
+    without spending any request budget. 429/5xx responses and network
+    errors are retried under the shared RetryPolicy before prawcore sees them;
+    call ``disable_session_retries`` on the client so prawcore does not retry
+    them again.
+    Outcomes are reported to ``health`` so a client pool can bench a failing
+    client.
+    """
+
+    def __init__(self, *args, rate_limiter=None, cache=None, retry_policy=None, health=None, metrics=DISABLED,
+                 **kwargs):
+        super().__init__(*args, **kwargs)
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.cache = cache
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.health = health
+        self.metrics = metrics
+
+    def _attempt(self, method, url, **kwargs):
+        """Wait for budget, issue the request and re-sync from its headers."""
+        waited = self.rate_limiter.acquire()
+        if waited:
+            self.metrics.observe('rate_limit_wait_seconds', waited)
+        
+        start = time.perf_counter()
+        try:
+            response = super().request(method, url, **kwargs)
+        except RequestException:
+            self.metrics.count('http_requests_total', backend='praw', status='error')
+            raise
+        self.metrics.observe('http_request_seconds', time.perf_counter() - start, backend='praw')
+        self.metrics.count('http_requests_total', backend='praw', status=str(response.status_code))
+        
+        self.rate_limiter.update_from_headers(response.headers)
+        return response
+
+    def _send(self, method, url, **kwargs):
+        """Issue the request, retrying transient failures with backoff."""
+        try:
+            response = self.retry_policy.send(lambda: self._attempt(method, url, **kwargs), (RequestException,))
+        except RequestException:
+            if self.health is not None:
+                self.health.record_failure()
+            raise
+        
+        if self.health is not None:
+            self.health.record_status(response.status_code)
+        return response
+
+    def request(self, method, url, **kwargs):
+        """Serve the request from the cache when possible, else send it."""
+        with self.metrics.time('fetch'):
+            if self.cache is None:
+                return self._send(method, url, **kwargs)
+            
+            return self.cache.fetch(
+                method,
+                url,
+                kwargs.get('params'),
+                kwargs.get('headers'),
+                lambda headers: self._send(method, url, **dict(kwargs, headers=headers))
+            )
+
 
 class RedditScraper:
-    def __init__(self):
-        """Initialize Reddit scraper."""
+    def __init__(self, store=None, backend="praw", cache=None, result_cache=None, metrics=None):
+        """
+        Initialize Reddit scraper.
+        
+        Args:
+            store (PostStore): Optional storage backend that scraped posts are upserted into
+            backend (str): 'praw', or 'json' to read listings and searches as raw JSON
+            cache (ResponseCache): Optional HTTP response cache shared by both backends
+            result_cache (ResultCache): Optional process-wide cache of scrape_subreddit results
+            metrics (Metrics): Instrumentation shared with the HTTP clients; a disabled one by default
+        
+        Set ``enricher`` to a LinkEnricher to extract the articles of link
+        posts in the background as they are scraped.
+        """
         self.reddit = None
         self.client_id = None
         self.client_secret = None
+        self.credentials = []
+        self.pool = ClientPool()
         self.user_agent = "RedditScraper/1.0 by YourUsername"
+        self.rate_limiter = RateLimiter()
+        self.retry_policy = RetryPolicy()
+        self.circuit_breaker = CircuitBreaker()
+        self.store = store
+        self.backend = backend
+        self.cache = cache
+        self.result_cache = result_cache
+        self.enricher = None
+        self.metrics = metrics if metrics is not None else Metrics(enabled=False)
+        self._json_client = None
+        self.health_ttl = 300
+        self._api_status = None
+        self._api_status_checked_at = 0.0
     
-    def setup_reddit_client(self, client_id=None, client_secret=None):
-        """Setup Reddit client with provided credentials."""
-        try:
-            # Use provided credentials or stored ones
-            if client_id and client_secret:
-                self.client_id = client_id
-                self.client_secret = client_secret
-            
-            # Check if credentials are available
-            if not self.client_id or not self.client_secret:
-                self.reddit = None
-                return False
-            
-            # Initialize Reddit client
-            self.reddit = praw.Reddit(
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-                user_agent=self.user_agent
-            )
-            
-            # Test the connection
-            self.reddit.auth.limits
-            return True
-            
-        except Exception as e:
-            print(f"Error setting up Reddit client: {str(e)}")
+    def setup_reddit_client(self, client_id=None, client_secret=None, credentials=None):
+        """
+        Setup Reddit clients with provided credentials.
+        
+        Several OAuth apps can be given as ``credentials``; each gets its own
+        client and request budget in ``self.pool`` and work is spread across
+        them. ``self.reddit`` stays the first client.
+        
+        Args:
+            client_id (str): Reddit app client ID
+            client_secret (str): Reddit app client secret
+            credentials (list): (client_id, client_secret) pairs or dicts with those keys, for a pool
+        
+        Returns:
+            bool: True if at least one client was set up
+        """
+        self.invalidate_api_status()
+        self._json_client = None
+        self.pool = ClientPool()
+        
+        # Use provided credentials or stored ones
+        if credentials:
+            self.credentials = [
+                (cred['client_id'], cred['client_secret']) if isinstance(cred, dict) else tuple(cred)
+                for cred in credentials
+            ]
+        elif client_id and client_secret:
+            self.credentials = [(client_id, client_secret)]
+        
+        # Check if credentials are available
+        if not self.credentials:
+            self.reddit = None
+            return False
+        
+        self.client_id, self.client_secret = self.credentials[0]
+        
+        for index, (app_id, app_secret) in enumerate(self.credentials):
+            try:
+                # The first app keeps the scraper's own limiter so existing references stay valid
+                rate_limiter = self.rate_limiter if index == 0 else RateLimiter()
+                health = ClientHealth()
+                
+                # Initialize Reddit client
+                reddit = praw.Reddit(
+                    client_id=app_id,
+                    client_secret=app_secret,
+                    user_agent=self.user_agent,
+                    requestor_class=RateLimitedRequestor,
+                    requestor_kwargs={
+                        'rate_limiter': rate_limiter,
+                        'cache': self.cache,
+                        'retry_policy': self.retry_policy,
+                        'health': health,
+                        'metrics': self.metrics
+                    }
+                )
+                disable_session_retries(reddit)
+                
+                # Test the connection and seed the request budget
+                rate_limiter.update_from_limits(reddit.auth.limits)
+                self.pool.add(PooledClient(app_id, app_secret, reddit, rate_limiter, health))
+                
+            except Exception as e:
+                print(f"Error setting up Reddit client {app_id}: {str(e)}")
+        
+        if not len(self.pool):
             self.reddit = None
             return False
+        
+        self.reddit = self.pool.clients[0].reddit
+        return True
     
-    def check_api_status(self):
-        """Check if Reddit API is accessible."""
+    def check_api_status(self, force=False):
+        """
+        Check if Reddit API is accessible.
+        
+        The result is cached for ``health_ttl`` seconds so Streamlit reruns do
+        not each spend a live request. The cache is dropped when the client is
+        reconfigured or a real request fails.
+        
+        Args:
+            force (bool): Ignore the cached state and probe the API again
+        
+        Returns:
+            bool: True if the API is reachable
+        """
+        if self.reddit is None:
+            return False
+        
+        now = time.monotonic()
+        if not force and self._api_status is not None and now - self._api_status_checked_at < self.health_ttl:
+            return self._api_status
+        
         try:
-            if self.reddit is None:
-                return False
-            
             # Try to access a public subreddit to test connection
             test_subreddit = self.reddit.subreddit("python")
-            list(test_subreddit.hot(limit=1))
-            return True
+            if self.cache is not None:
+                # A cached listing would not prove the API is reachable
+                with self.cache.bypass():
+                    list(test_subreddit.hot(limit=1))
+            else:
+                list(test_subreddit.hot(limit=1))
+            self._set_api_status(True)
             
         except Exception as e:
             print(f"API status check failed: {str(e)}")
-            return False
+            self._set_api_status(False)
+        
+        return self._api_status
     
-    def scrape_subreddit(self, subreddit_name, post_type="hot", limit=25, time_filter="all"):
+    def _set_api_status(self, status):
+        """Record the API health state and when it was observed."""
+        self._api_status = status
+        self._api_status_checked_at = time.monotonic()
+    
+    def invalidate_api_status(self):
+        """Forget the cached API health so the next check probes again."""
+        self._api_status = None
+        self._api_status_checked_at = 0.0
+    
+    def _client(self):
         """
-        Scrape posts from a specific subreddit.
+        Pick the PRAW client for the next unit of work.
+        
+        Returns:
+            praw.Reddit: Pooled client with the most remaining budget, or the single client
+        """
+        if len(self.pool):
+            return self.pool.acquire().reddit
+        return self.reddit
+    
+    def json_client(self):
+        """
+        Get the raw JSON listing client, creating it on first use.
+        
+        It shares this scraper's credentials, rate limiter and retry policy with the PRAW client.
+        With a client pool, the JSON client of the app with the most remaining budget is returned.
+        
+        Returns:
+            JSONListingClient: Pooled JSON client
+        """
+        if len(self.pool):
+            member = self.pool.acquire()
+            if member.json_client is None:
+                member.json_client = JSONListingClient(
+                    self.user_agent,
+                    member.client_id,
+                    member.client_secret,
+                    rate_limiter=member.rate_limiter,
+                    cache=self.cache,
+                    retry_policy=self.retry_policy,
+                    health=member.health,
+                    metrics=self.metrics
+                )
+            return member.json_client
+        
+        if self._json_client is None:
+            self._json_client = JSONListingClient(
+                self.user_agent,
+                self.client_id,
+                self.client_secret,
+                rate_limiter=self.rate_limiter,
+                cache=self.cache,
+                retry_policy=self.retry_policy,
+                metrics=self.metrics
+            )
+        return self._json_client
+    
+    def _api_error(self, e, message, subreddit_name=None):
+        """
+        Turn a failed API call into a typed error and feed the circuit breaker.
+        
+        Transient failures and rate limiting count towards opening the
+        subreddit's circuit; any definitive answer (e.g. not found) closes it.
+        Only failures that say something about the API itself (transient,
+        rate limited, rejected credentials) drop the cached health check.
+        
+        Args:
+            e (Exception): Exception raised by the call
+            message (str): Context prefix for the error message
+            subreddit_name (str): Subreddit the call was for, if any
+        
+        Returns:
+            ScraperError: Error to raise
+        """
+        error = wrap_error(e, message, subreddit_name)
+        if isinstance(error, (Transient, RateLimited, Unauthorized)):
+            self.invalidate_api_status()
+        
+        if subreddit_name and not isinstance(error, CircuitOpen):
+            if isinstance(error, (Transient, RateLimited)):
+                self.circuit_breaker.record_failure(subreddit_name)
+            else:
+                self.circuit_breaker.record_success(subreddit_name)
+        
+        return error
+    
+    def _api_ok(self, subreddit_name=None):
+        """Record a successful API call."""
+        self._set_api_status(True)
+        if subreddit_name:
+            self.circuit_breaker.record_success(subreddit_name)
+    
+    def stats(self):
+        """
+        Collect instrumentation, cache and budget statistics in one structure.
+        
+        Returns:
+            dict: 'metrics' (Metrics.snapshot), 'http_cache', 'result_cache' and 'enrich'
+                stats (None when not attached), 'retries', per-client 'rate_limit' budgets
+                and 'hit_rates' of both caches
+        """
+        http_cache = self.cache.stats() if self.cache is not None else None
+        result_cache = self.result_cache.stats() if self.result_cache is not None else None
+        limiters = [client.rate_limiter for client in self.pool.clients] or [self.rate_limiter]
+        
+        return {
+            'metrics': self.metrics.snapshot(),
+            'http_cache': http_cache,
+            'result_cache': result_cache,
+            'enrich': self.enricher.stats() if self.enricher is not None else None,
+            'retries': self.retry_policy.stats(),
+            'rate_limit': [limiter.stats() for limiter in limiters],
+            'hit_rates': {
+                'http_cache': http_cache['hit_rate'] if http_cache else None,
+                'result_cache': result_cache['hit_rate'] if result_cache else None
+            }
+        }
+    
+    def prometheus(self):
+        """
+        Render metrics plus cache, retry and budget gauges as Prometheus text.
+        
+        Returns:
+            str: Exposition text, e.g. for metrics.write_prometheus or serve_prometheus
+        """
+        stats = self.stats()
+        gauges = {
+            'retries': stats['retries']['retries'],
+            'retry_sleep_seconds': stats['retries']['total_sleep'],
+            'rate_limit_remaining': sum(budget['remaining'] for budget in stats['rate_limit']),
+            'rate_limit_wait_seconds_total': sum(budget['total_wait'] for budget in stats['rate_limit']),
+            'posts_per_second': stats['metrics']['posts_per_second']
+        }
+        for name in ('http_cache', 'result_cache'):
+            if stats[name] is not None:
+                gauges[f"{name}_hits"] = stats[name]['hits']
+                gauges[f"{name}_misses"] = stats[name]['misses']
+                gauges[f"{name}_hit_rate"] = stats[name]['hit_rate']
+                gauges[f"{name}_bytes"] = stats[name]['bytes']
+        if stats['enrich'] is not None:
+            for key, value in stats['enrich'].items():
+                gauges[f"enrich_{key}"] = value
+        return self.metrics.to_prometheus(gauges)
+    
+    def _persist(self, df):
+        """Upsert scraped posts into the attached store and queue their links for enrichment."""
+        if df.empty:
+            return
+        if self.store is not None:
+            with self.metrics.time('store'):
+                self.store.upsert_posts(df)
+        if self.enricher is not None:
+            self.enricher.submit(df)
+    
+    def _listing(self, subreddit, post_type, limit, time_filter="all", params=None):
+        """
+        Build the PRAW listing generator for a post type.
+        
+        Args:
+            subreddit (praw.models.Subreddit): Subreddit to list
+            post_type (str): Type of posts to get ('hot', 'new', 'top')
+            limit (int): Maximum number of posts to list
+            time_filter (str): Time filter for top posts
+            params (dict): Extra query parameters, e.g. an 'after' cursor
+        
+        Returns:
+            praw.models.ListingGenerator: Lazy listing of submissions
+        """
+        # PRAW fills in its own params dict (e.g. 't' for top), so never pass None
+        params = dict(params or {})
+        if post_type == "hot":
+            return subreddit.hot(limit=limit, params=params)
+        elif post_type == "new":
+            return subreddit.new(limit=limit, params=params)
+        elif post_type == "top":
+            return subreddit.top(time_filter=time_filter, limit=limit, params=params)
+        else:
+            raise Exception(f"Invalid post type: {post_type}")
+    
+    def iter_posts(self, subreddit_name, post_type="hot", limit=25, time_filter="all"):
+        """
+        Stream posts from a specific subreddit as listing pages arrive.
+        
+        With ``backend='json'`` the pages are read by the raw JSON client;
+        the records have the same fields either way.
         
         Args:
             subreddit_name (str): Name of the subreddit to scrape
@@ -67,85 +472,643 @@ class RedditScraper:
             limit (int): Maximum number of posts to scrape
             time_filter (str): Time filter for top posts ('day', 'week', 'month', 'year', 'all')
         
-        Returns:
-            pandas.DataFrame: Scraped post data
+        Yields:
+            dict: Raw post fields (see normalize.extract_post)
+        
+        Raises:
+            ScraperError: NotFound/Private for missing or private subreddits,
+                RateLimited/Transient when retries are exhausted, CircuitOpen
+                while the subreddit is paused after repeated failures
         """
         try:
             if self.reddit is None:
-                raise Exception("Reddit client not initialized")
+                raise ScraperError("Reddit client not initialized")
             
-            # Get the subreddit
-            subreddit = self.reddit.subreddit(subreddit_name)
+            self.circuit_breaker.before_call(subreddit_name)
             
-            # Check if subreddit exists and is accessible
-            try:
-                subreddit_info = subreddit.display_name
-            except Exception as e:
-                if "404" in str(e) or "Forbidden" in str(e):
-                    raise Exception(f"Subreddit 'r/{subreddit_name}' not found or is private")
-                else:
-                    raise Exception(f"Error accessing subreddit: {str(e)}")
+            if self.backend == "json":
+                for records, _ in self.json_client().iter_records(subreddit_name, post_type, limit, time_filter):
+                    yield from records
+                self._api_ok(subreddit_name)
+                return
+            
+            # Get the subreddit; a missing or private one fails on the first page
+            subreddit = self._client().subreddit(subreddit_name)
             
             # Get posts based on type
-            posts = []
-            
-            if post_type == "hot":
-                posts_iterator = subreddit.hot(limit=limit)
-            elif post_type == "new":
-                posts_iterator = subreddit.new(limit=limit)
-            elif post_type == "top":
-                posts_iterator = subreddit.top(time_filter=time_filter, limit=limit)
-            else:
-                raise Exception(f"Invalid post type: {post_type}")
+            posts_iterator = self._listing(subreddit, post_type, limit, time_filter)
             
             # Extract post data
-            scraped_posts = []
-            
             for post in posts_iterator:
                 try:
-                    # Rate limiting - small delay between requests
-                    time.sleep(0.1)
-                    
-                    post_data = {
-                        'title': post.title,
-                        'author': str(post.author) if post.author else '[deleted]',
-                        'score': post.score,
-                        'upvote_ratio': post.upvote_ratio,
-                        'num_comments': post.num_comments,
-                        'created_utc': post.created_utc,
-                        'created_date': datetime.fromtimestamp(post.created_utc).strftime('%Y-%m-%d %H:%M:%S'),
-                        'url': post.url,
-                        'permalink': f"https://reddit.com{post.permalink}",
-                        'selftext': post.selftext if hasattr(post, 'selftext') else '',
-                        'is_self': post.is_self,
-                        'subreddit': str(post.subreddit),
-                        'post_id': post.id,
-                        'domain': post.domain if hasattr(post, 'domain') else '',
-                        'over_18': post.over_18,
-                        'spoiler': post.spoiler,
-                        'stickied': post.stickied,
-                        'locked': post.locked
-                    }
-                    
-                    scraped_posts.append(post_data)
-                    
+                    with self.metrics.time('normalize'):
+                        post_data = extract_post(post)
                 except Exception as e:
                     print(f"Error processing post: {str(e)}")
                     continue
+                
+                yield post_data
             
-            if not scraped_posts:
-                return pd.DataFrame()
-            
-            # Create DataFrame
-            df = pd.DataFrame(scraped_posts)
+            # A completed listing proves the API is reachable
+            self._api_ok(subreddit_name)
             
-            # Sort by score descending
-            df = df.sort_values('score', ascending=False).reset_index(drop=True)
+        except GeneratorExit:
+            # The consumer stopped early; nothing failed
+            self.circuit_breaker.record_success(subreddit_name)
+            raise
+        except Exception as e:
+            raise self._api_error(e, "Error scraping subreddit", subreddit_name) from e
+    
+    def iter_batches(self, records, batch_size=100):
+        """
+        Group a stream of post records into small typed DataFrames.
+        
+        Args:
+            records (iterable): Post dicts, e.g. from iter_posts or iter_search
+            batch_size (int): Maximum number of posts per batch
+        
+        Yields:
+            pandas.DataFrame: Batch of post data
+        """
+        batch = []
+        for record in records:
+            batch.append(record)
+            if len(batch) >= batch_size:
+                yield self._to_frame(batch)
+                batch = []
+        
+        if batch:
+            yield self._to_frame(batch)
+    
+    def _to_frame(self, records):
+        """Build a typed post DataFrame from raw records, counting them as scraped."""
+        with self.metrics.time('frame'):
+            df = posts_to_frame(records)
+        self.metrics.posts(len(records))
+        return df
+    
+    def iter_frames(self, subreddit_name, post_type="hot", limit=25, time_filter="all"):
+        """
+        Stream a listing as typed DataFrames, one per listing page, on either backend.
+        
+        Args:
+            subreddit_name (str): Name of the subreddit to scrape
+            post_type (str): Type of posts to get ('hot', 'new', 'top')
+            limit (int): Maximum number of posts to scrape
+            time_filter (str): Time filter for top posts ('day', 'week', 'month', 'year', 'all')
+        
+        Yields:
+            pandas.DataFrame: Posts of one page, in listing order
+        """
+        if self.backend != "json":
+            yield from self.iter_batches(self.iter_posts(subreddit_name, post_type, limit, time_filter), LISTING_PAGE_SIZE)
+            return
+        
+        try:
+            self.circuit_breaker.before_call(subreddit_name)
+            yield from self.json_client().iter_frames(subreddit_name, post_type, limit, time_filter)
+            self._api_ok(subreddit_name)
             
+        except GeneratorExit:
+            self.circuit_breaker.record_success(subreddit_name)
+            raise
+        except Exception as e:
+            raise self._api_error(e, "Error scraping subreddit", subreddit_name) from e
+    
+    def scrape_subreddit(self, subreddit_name, post_type="hot", limit=25, time_filter="all", order="score", top=None):
+        """
+        Scrape posts from a specific subreddit.
+        
+        Args:
+            subreddit_name (str): Name of the subreddit to scrape
+            post_type (str): Type of posts to get ('hot', 'new', 'top')
+            limit (int): Maximum number of posts to scrape
+            time_filter (str): Time filter for top posts ('day', 'week', 'month', 'year', 'all')
+            order (str): 'score' (highest first) or 'listing' (the API's own order, e.g. newest first for 'new')
+            top (int): Keep only the ``top`` highest-scoring posts, highest first
+        
+        Returns:
+            pandas.DataFrame: Scraped post data
+        """
+        if self.result_cache is None:
+            df = self._scrape_listing(subreddit_name, post_type, limit, time_filter)
+        else:
+            # Identical scrapes from other sessions are served from, or wait for, the shared result
+            df = self.result_cache.get_or_compute(
+                result_key(subreddit_name, post_type, time_filter, limit),
+                lambda: self._scrape_listing(subreddit_name, post_type, limit, time_filter)
+            ).copy(deep=False)
+        
+        with self.metrics.time('sort'):
+            return order_posts(df, order, top)
+    
+    def _scrape_listing(self, subreddit_name, post_type, limit, time_filter):
+        """Fetch and persist one listing in API order (the uncached part of scrape_subreddit)."""
+        if self.backend == "json":
+            try:
+                self.circuit_breaker.before_call(subreddit_name)
+                df = self.json_client().scrape(subreddit_name, post_type, limit, time_filter)
+                self._api_ok(subreddit_name)
+            except Exception as e:
+                raise self._api_error(e, "Error scraping subreddit", subreddit_name) from e
+        else:
+            df = self._to_frame(list(self.iter_posts(subreddit_name, post_type, limit, time_filter)))
+        
+        if df.empty:
             return df
+        
+        self._persist(df)
+        
+        return df
+    
+    def _load_checkpoint(self, checkpoint_path, key):
+        """
+        Load a crawl checkpoint if one exists for the same listing.
+        
+        Args:
+            checkpoint_path (str): Path of the checkpoint file
+            key (dict): Subreddit, post type and time filter of the crawl
+        
+        Returns:
+            dict: Checkpoint state, or None to start from the first page
+        """
+        if not checkpoint_path or not os.path.exists(checkpoint_path):
+            return None
+        
+        with open(checkpoint_path, 'r', encoding='utf-8') as f:
+            checkpoint = json.load(f)
+        
+        if any(checkpoint.get(field) != value for field, value in key.items()):
+            raise Exception(f"Checkpoint {checkpoint_path} belongs to a different crawl")
+        
+        # A finished crawl starts over from the top of the listing
+        if checkpoint.get('complete'):
+            return None
+        
+        return checkpoint
+    
+    def _save_checkpoint(self, checkpoint_path, checkpoint):
+        """Atomically write crawl state so an interrupt never leaves a partial file."""
+        directory = os.path.dirname(checkpoint_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        tmp_path = f"{checkpoint_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(checkpoint, f)
+        os.replace(tmp_path, checkpoint_path)
+    
+    def _crawl_pages(self, subreddit_name, post_type, time_filter, max_posts, checkpoint_path):
+        """
+        Walk a listing page by page from its checkpoint, without saving it.
+        
+        Each page comes with the checkpoint that resumes after it; the caller
+        saves that only once the page is handled, so an interrupted crawl
+        never skips a page it did not keep. The last item is an empty page
+        with the crawl marked complete.
+        
+        Yields:
+            tuple: (list of raw post dicts, checkpoint dict)
+        """
+        try:
+            if self.reddit is None:
+                raise ScraperError("Reddit client not initialized")
+            
+            self.circuit_breaker.before_call(subreddit_name)
+            
+            key = {'subreddit': subreddit_name, 'post_type': post_type, 'time_filter': time_filter}
+            checkpoint = self._load_checkpoint(checkpoint_path, key) or dict(
+                key, after=None, last_created_utc=None, count=0, complete=False
+            )
+            
+            max_posts = min(max_posts, MAX_LISTING_DEPTH)
+            
+            while checkpoint['count'] < max_posts:
+                page_size = min(LISTING_PAGE_SIZE, max_posts - checkpoint['count'])
+                records, page_length, last = self._crawl_page(subreddit_name, post_type, page_size, time_filter,
+                                                              checkpoint['after'])
+                
+                if page_length:
+                    checkpoint['after'], checkpoint['last_created_utc'] = last
+                    checkpoint['count'] += page_length
+                
+                # A short page means the listing is exhausted
+                if page_length < page_size:
+                    checkpoint['complete'] = True
+                
+                yield records, dict(checkpoint)
+                
+                if checkpoint['complete']:
+                    break
             
+            checkpoint['complete'] = True
+            yield [], dict(checkpoint)
+            
+            self._api_ok(subreddit_name)
+            
+        except GeneratorExit:
+            self.circuit_breaker.record_success(subreddit_name)
+            raise
         except Exception as e:
-            raise Exception(f"Error scraping subreddit: {str(e)}")
+            raise self._api_error(e, "Error crawling subreddit", subreddit_name) from e
+    
+    def _crawl_page(self, subreddit_name, post_type, page_size, time_filter, after):
+        """
+        Fetch one listing page after a cursor on the configured backend.
+        
+        Returns:
+            tuple: (list of raw post dicts, number of posts the page listed,
+                (fullname, created_utc) of its last post or None)
+        """
+        if self.backend == "json":
+            pages = self.json_client().iter_records(subreddit_name, post_type, page_size, time_filter, after)
+            records, _ = next(pages, ([], None))
+            pages.close()
+            last = (f"t3_{records[-1]['post_id']}", records[-1]['created_utc']) if records else None
+            return records, len(records), last
+        
+        params = {'after': after} if after else None
+        subreddit = self._client().subreddit(subreddit_name)
+        page = list(self._listing(subreddit, post_type, page_size, time_filter, params))
+        
+        records = []
+        for post in page:
+            try:
+                records.append(extract_post(post))
+            except Exception as e:
+                print(f"Error processing post: {str(e)}")
+        last = (page[-1].fullname, page[-1].created_utc) if page else None
+        return records, len(page), last
+    
+    def iter_crawl(self, subreddit_name, post_type="new", time_filter="all", max_posts=MAX_LISTING_DEPTH,
+                   checkpoint_path=None):
+        """
+        Walk a listing page by page, checkpointing the ``after`` cursor.
+        
+        The listing cursor and the last ``created_utc`` are saved to
+        ``checkpoint_path`` once the posts of a page have all been consumed,
+        i.e. when the next post is requested. Store what you received before
+        asking for more; re-running an interrupted crawl with the same
+        checkpoint then resumes from the next page instead of downloading
+        everything again.
+        
+        Args:
+            subreddit_name (str): Name of the subreddit to crawl
+            post_type (str): Type of posts to get ('hot', 'new', 'top')
+            time_filter (str): Time filter for top posts ('day', 'week', 'month', 'year', 'all')
+            max_posts (int): Maximum number of posts to crawl, up to Reddit's listing depth
+            checkpoint_path (str): Optional JSON file used to resume the crawl
+        
+        Yields:
+            dict: Raw post fields (see normalize.extract_post)
+        """
+        for records, checkpoint in self._crawl_pages(subreddit_name, post_type, time_filter, max_posts,
+                                                     checkpoint_path):
+            yield from records
+            if checkpoint_path:
+                self._save_checkpoint(checkpoint_path, checkpoint)
+    
+    def crawl_subreddit(self, subreddit_name, post_type="new", time_filter="all", max_posts=MAX_LISTING_DEPTH,
+                        checkpoint_path=None):
+        """
+        Crawl a listing up to Reddit's depth limit with resumable checkpoints.
+        
+        Every page is stored before the checkpoint moves past it, so posts of
+        an interrupted crawl are kept and resuming picks up right after them.
+        
+        Args:
+            subreddit_name (str): Name of the subreddit to crawl
+            post_type (str): Type of posts to get ('hot', 'new', 'top')
+            time_filter (str): Time filter for top posts ('day', 'week', 'month', 'year', 'all')
+            max_posts (int): Maximum number of posts to crawl, up to Reddit's listing depth
+            checkpoint_path (str): Optional JSON file used to resume the crawl
+        
+        Returns:
+            pandas.DataFrame: Posts crawled in this run, in listing order
+        """
+        frames = []
+        for records, checkpoint in self._crawl_pages(subreddit_name, post_type, time_filter, max_posts,
+                                                     checkpoint_path):
+            if records:
+                df = self._to_frame(records)
+                self._persist(df)
+                frames.append(df)
+            if checkpoint_path:
+                self._save_checkpoint(checkpoint_path, checkpoint)
+        
+        if not frames:
+            return pd.DataFrame()
+        
+        return concat_frames(frames)
+    
+    def iter_new_since(self, subreddit_name, seen_index, limit=MAX_LISTING_DEPTH):
+        """
+        Stream only posts from the ``new`` listing that were not ingested before.
+        
+        Paging stops at the first post already in ``seen_index`` (or older than
+        what the index still remembers), so a run costs only the API calls for
+        truly new posts. The index is updated once the run completes, so an
+        interrupted run is simply retried in full next time.
+        
+        Args:
+            subreddit_name (str): Name of the subreddit to scrape
+            seen_index (SeenIndex): Persistent index of ingested posts
+            limit (int): Maximum number of new posts to scrape
+        
+        Yields:
+            dict: Raw post fields (see normalize.extract_post), newest first
+        """
+        high_water = seen_index.high_water_mark(subreddit_name)
+        cutoff = high_water - seen_index.retention if high_water is not None else None
+        new_posts = []
+        
+        for post_data in self.iter_posts(subreddit_name, "new", limit):
+            if seen_index.is_seen(subreddit_name, post_data['post_id']):
+                break
+            if cutoff is not None and post_data['created_utc'] < cutoff:
+                break
+            
+            new_posts.append((post_data['post_id'], post_data['created_utc']))
+            yield post_data
+        
+        seen_index.mark_seen(subreddit_name, new_posts)
+    
+    def scrape_new_since(self, subreddit_name, seen_index, limit=MAX_LISTING_DEPTH):
+        """
+        Incrementally scrape the ``new`` listing since the last run.
+        
+        Args:
+            subreddit_name (str): Name of the subreddit to scrape
+            seen_index (SeenIndex): Persistent index of ingested posts
+            limit (int): Maximum number of new posts to scrape
+        
+        Returns:
+            pandas.DataFrame: Posts not seen in previous runs, newest first
+        """
+        new_posts = list(self.iter_new_since(subreddit_name, seen_index, limit))
+        
+        if not new_posts:
+            return pd.DataFrame()
+        
+        df = self._to_frame(new_posts)
+        self._persist(df)
+        
+        return df
+    
+    def scrape_many(self, subreddits, post_type="hot", limit=25, time_filter="all", max_workers=8, order="score",
+                    top=None):
+        """
+        Scrape several subreddits concurrently.
+        
+        Work is spread over a bounded thread pool. All workers share this
+        scraper's authenticated client and rate limiter, so total run time is
+        bounded by the API quota rather than by serial network latency.
+        
+        Args:
+            subreddits (list): Names of the subreddits to scrape
+            post_type (str): Type of posts to get ('hot', 'new', 'top')
+            limit (int): Maximum number of posts to scrape per subreddit
+            time_filter (str): Time filter for top posts ('day', 'week', 'month', 'year', 'all')
+            max_workers (int): Maximum number of concurrent workers
+            order (str): 'score' merges the per-subreddit results, each already sorted, into one
+                highest-first list; 'listing' keeps each subreddit's API order, subreddits in the given order
+            top (int): Keep only the ``top`` highest-scoring posts overall, highest first
+        
+        Returns:
+            tuple: (pandas.DataFrame of all posts, list of per-subreddit error dicts)
+        """
+        if self.reddit is None:
+            raise ScraperError("Reddit client not initialized")
+        
+        # Drop duplicates while keeping the caller's order
+        subreddits = list(dict.fromkeys(subreddits))
+        
+        if order not in POST_ORDERS:
+            raise ScraperError(f"Invalid order: {order}")
+        
+        results = {}
+        errors = []
+        
+        if not subreddits:
+            return pd.DataFrame(), errors
+        
+        # Each subreddit comes back sorted (or cut to its own top posts), ready to be merged
+        per_subreddit = "listing" if order == "listing" and top is None else "score"
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(subreddits)))) as executor:
+            futures = {
+                executor.submit(self.scrape_subreddit, name, post_type, limit, time_filter, per_subreddit, top): name
+                for name in subreddits
+            }
+            
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    df = future.result()
+                    if not df.empty:
+                        results[name] = df
+                except Exception as e:
+                    errors.append({
+                        'subreddit': name,
+                        'error': str(e),
+                        'error_type': type(e).__name__,
+                        'time': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                    })
+        
+        if not results:
+            return pd.DataFrame(), errors
+        
+        # Combine in the caller's subreddit order, not completion order, so results are reproducible
+        frames = [results[name] for name in subreddits if name in results]
+        
+        if per_subreddit == "listing":
+            with self.metrics.time('frame'):
+                df = concat_frames(frames)
+        else:
+            with self.metrics.time('sort'):
+                df = merge_sorted(frames, top)
+        
+        return df, errors
+    
+    def iter_comments(self, post_id, depth=None, max_more=0):
+        """
+        Stream the comment tree of a submission, breadth first.
+        
+        Expanding ``MoreComments`` placeholders costs one request each, so
+        ``max_more`` caps how many are replaced; the rest are dropped.
+        
+        Args:
+            post_id (str): ID of the submission
+            depth (int): Maximum comment depth to keep (0 = top-level only), None for all
+            max_more (int): Maximum number of MoreComments to expand, None for all
+        
+        Yields:
+            dict: Raw comment fields (see normalize.extract_comment)
+        """
+        try:
+            if self.reddit is None:
+                raise ScraperError("Reddit client not initialized")
+            
+            submission = self._client().submission(id=post_id)
+            submission.comments.replace_more(limit=max_more)
+            
+            level = 0
+            comments = list(submission.comments)
+            while comments and (depth is None or level <= depth):
+                replies = []
+                for comment in comments:
+                    try:
+                        comment_data = extract_comment(comment, post_id, level)
+                    except Exception as e:
+                        print(f"Error processing comment: {str(e)}")
+                        continue
+                    
+                    yield comment_data
+                    replies.extend(comment.replies)
+                
+                comments = replies
+                level += 1
+            
+        except Exception as e:
+            raise self._api_error(e, "Error scraping comments") from e
+    
+    def scrape_comments(self, post_ids, depth=None, max_more=0, max_workers=8):
+        """
+        Scrape the comment trees of several submissions concurrently.
+        
+        Submissions are fetched on a bounded thread pool that shares this
+        scraper's client and rate limiter.
+        
+        Args:
+            post_ids (list): IDs of the submissions
+            depth (int): Maximum comment depth to keep (0 = top-level only), None for all
+            max_more (int): Maximum number of MoreComments to expand per submission, None for all
+            max_workers (int): Maximum number of concurrent workers
+        
+        Returns:
+            tuple: (pandas.DataFrame of comments, list of per-post error dicts)
+        """
+        if self.reddit is None:
+            raise ScraperError("Reddit client not initialized")
+        
+        post_ids = list(dict.fromkeys(post_ids))
+        
+        scraped_comments = []
+        errors = []
+        
+        if not post_ids:
+            return pd.DataFrame(), errors
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(post_ids)))) as executor:
+            futures = {
+                executor.submit(lambda post_id: list(self.iter_comments(post_id, depth, max_more)), post_id): post_id
+                for post_id in post_ids
+            }
+            
+            for future in as_completed(futures):
+                post_id = futures[future]
+                try:
+                    scraped_comments.extend(future.result())
+                except Exception as e:
+                    errors.append({
+                        'post_id': post_id,
+                        'error': str(e),
+                        'error_type': type(e).__name__,
+                        'time': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                    })
+        
+        if not scraped_comments:
+            return pd.DataFrame(), errors
+        
+        df = comments_to_frame(scraped_comments)
+        
+        if self.store is not None:
+            self.store.upsert_comments(df)
+        
+        return df, errors
+    
+    def _refresh_batch(self, post_ids):
+        """
+        Fetch current metrics for up to INFO_BATCH_SIZE posts in one request.
+        
+        Args:
+            post_ids (list): Post IDs without the 't3_' prefix
+        
+        Returns:
+            list: Metric snapshot dicts
+        """
+        snapshot_utc = time.time()
+        fullnames = [f"t3_{post_id}" for post_id in post_ids]
+        
+        snapshots = []
+        for post in self._client().info(fullnames=fullnames):
+            snapshots.append({
+                'post_id': post.id,
+                'snapshot_utc': snapshot_utc,
+                'score': post.score,
+                'upvote_ratio': post.upvote_ratio,
+                'num_comments': post.num_comments,
+                'locked': post.locked,
+                'stickied': post.stickied
+            })
+        
+        return snapshots
+    
+    def refresh_posts(self, post_ids, max_workers=4):
+        """
+        Take time-stamped metric snapshots of known posts via ``/api/info``.
+        
+        Posts are looked up by fullname in batches of 100, i.e. one request
+        per 100 posts instead of one per post, with batches fetched
+        concurrently under the shared rate limiter. Deleted or removed posts
+        are simply missing from the result.
+        
+        Args:
+            post_ids (list): Post IDs, with or without the 't3_' prefix
+            max_workers (int): Maximum number of concurrent batch requests
+        
+        Returns:
+            tuple: (pandas.DataFrame of snapshots keyed by post_id, list of per-batch error dicts)
+        """
+        if self.reddit is None:
+            raise ScraperError("Reddit client not initialized")
+        
+        post_ids = list(dict.fromkeys(
+            post_id[3:] if post_id.startswith('t3_') else post_id for post_id in post_ids
+        ))
+        batches = [post_ids[i:i + INFO_BATCH_SIZE] for i in range(0, len(post_ids), INFO_BATCH_SIZE)]
+        
+        snapshots = []
+        errors = []
+        
+        if not batches:
+            return pd.DataFrame(), errors
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(batches)))) as executor:
+            futures = {executor.submit(self._refresh_batch, batch): batch for batch in batches}
+            
+            for future in as_completed(futures):
+                batch = futures[future]
+                try:
+                    snapshots.extend(future.result())
+                except Exception as e:
+                    error = self._api_error(e, "Error refreshing posts")
+                    errors.append({
+                        'post_ids': batch,
+                        'error': str(error),
+                        'error_type': type(error).__name__,
+                        'time': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                    })
+        
+        if not snapshots:
+            return pd.DataFrame(), errors
+        
+        df = pd.DataFrame(snapshots)
+        
+        if self.store is not None:
+            self.store.add_metric_snapshots(df)
+        
+        return df, errors
     
     def get_subreddit_info(self, subreddit_name):
         """
@@ -159,9 +1122,10 @@ class RedditScraper:
         """
         try:
             if self.reddit is None:
-                raise Exception("Reddit client not initialized")
+                raise ScraperError("Reddit client not initialized")
             
-            subreddit = self.reddit.subreddit(subreddit_name)
+            self.circuit_breaker.before_call(subreddit_name)
+            subreddit = self._client().subreddit(subreddit_name)
             
             info = {
                 'name': subreddit.display_name,
@@ -174,14 +1138,15 @@ class RedditScraper:
                 'url': f"https://reddit.com/r/{subreddit.display_name}"
             }
             
+            self._api_ok(subreddit_name)
             return info
             
         except Exception as e:
-            raise Exception(f"Error getting subreddit info: {str(e)}")
+            raise self._api_error(e, "Error getting subreddit info", subreddit_name) from e
     
-    def search_posts(self, subreddit_name, query, sort="relevance", time_filter="all", limit=25):
+    def iter_search(self, subreddit_name, query, sort="relevance", time_filter="all", limit=25):
         """
-        Search for posts within a subreddit.
+        Stream search results within a subreddit as result pages arrive.
         
         Args:
             subreddit_name (str): Name of the subreddit to search
@@ -190,14 +1155,15 @@ class RedditScraper:
             time_filter (str): Time filter ('all', 'day', 'week', 'month', 'year')
             limit (int): Maximum number of posts to return
         
-        Returns:
-            pandas.DataFrame: Search results
+        Yields:
+            dict: Raw post fields (see normalize.extract_post)
         """
         try:
             if self.reddit is None:
-                raise Exception("Reddit client not initialized")
+                raise ScraperError("Reddit client not initialized")
             
-            subreddit = self.reddit.subreddit(subreddit_name)
+            self.circuit_breaker.before_call(subreddit_name)
+            subreddit = self._client().subreddit(subreddit_name)
             
             # Perform search
             search_results = subreddit.search(
@@ -208,138 +1174,171 @@ class RedditScraper:
             )
             
             # Extract post data
-            scraped_posts = []
-            
             for post in search_results:
                 try:
-                    # Rate limiting
-                    time.sleep(0.1)
-                    
-                    post_data = {
-                        'title': post.title,
-                        'author': str(post.author) if post.author else '[deleted]',
-                        'score': post.score,
-                        'upvote_ratio': post.upvote_ratio,
-                        'num_comments': post.num_comments,
-                        'created_utc': post.created_utc,
-                        'created_date': datetime.fromtimestamp(post.created_utc).strftime('%Y-%m-%d %H:%M:%S'),
-                        'url': post.url,
-                        'permalink': f"https://reddit.com{post.permalink}",
-                        'selftext': post.selftext if hasattr(post, 'selftext') else '',
-                        'is_self': post.is_self,
-                        'subreddit': str(post.subreddit),
-                        'post_id': post.id,
-                        'domain': post.domain if hasattr(post, 'domain') else '',
-                        'over_18': post.over_18,
-                        'spoiler': post.spoiler,
-                        'stickied': post.stickied,
-                        'locked': post.locked
-                    }
-                    
-                    scraped_posts.append(post_data)
-                    
+                    with self.metrics.time('normalize'):
+                        post_data = extract_post(post)
                 except Exception as e:
                     print(f"Error processing search result: {str(e)}")
                     continue
+                
+                yield post_data
             
-            if not scraped_posts:
-                return pd.DataFrame()
-            
-            # Create DataFrame
-            df = pd.DataFrame(scraped_posts)
-            
-            return df
+            self._api_ok(subreddit_name)
             
+        except GeneratorExit:
+            self.circuit_breaker.record_success(subreddit_name)
+            raise
         except Exception as e:
-            raise Exception(f"Error searching posts: {str(e)}")
+            raise self._api_error(e, "Error searching posts", subreddit_name) from e
     
-    def get_demo_data(self, subreddit_name="demo", post_type="hot", limit=25):
+    def search_local(self, subreddit_name, query, sort="relevance", time_filter="all", limit=25):
+        """
+        Search already-scraped posts in the store's full-text index.
+        
+        Args:
+            subreddit_name (str): Name of the subreddit to search, None for all stored posts
+            query (str): Search query (words, OR/NOT, "phrases", prefix*, title:word)
+            sort (str): Sort method ('relevance', 'hot', 'top', 'new', 'comments')
+            time_filter (str): Time filter ('all', 'hour', 'day', 'week', 'month', 'year')
+            limit (int): Maximum number of posts to return
+        
+        Returns:
+            pandas.DataFrame: Matching stored posts
+        """
+        if self.store is None:
+            raise ScraperError("No post store attached")
+        
+        window = TIME_FILTER_SECONDS.get(time_filter)
+        return self.store.search(
+            query,
+            [subreddit_name] if subreddit_name else None,
+            sort,
+            time.time() - window if window else None,
+            limit
+        )
+    
+    def search_posts(self, subreddit_name, query, sort="relevance", time_filter="all", limit=25, source="auto"):
+        """
+        Search for posts within a subreddit.
+        
+        With a store attached, the local full-text index is consulted first:
+        in 'auto' mode a query with at least ``limit`` local matches is
+        answered without any API request, otherwise Reddit's search is used
+        and its results are stored (and indexed) for next time.
+        
+        Args:
+            subreddit_name (str): Name of the subreddit to search
+            query (str): Search query
+            sort (str): Sort method ('relevance', 'hot', 'top', 'new', 'comments')
+            time_filter (str): Time filter ('all', 'day', 'week', 'month', 'year')
+            limit (int): Maximum number of posts to return
+            source (str): 'auto' (index first), 'local' (index only) or 'reddit' (API only)
+        
+        Returns:
+            pandas.DataFrame: Search results
+        """
+        if source != "reddit" and self.store is not None and getattr(self.store, 'fts', False):
+            try:
+                df = self.search_local(subreddit_name, query, sort, time_filter, limit)
+            except Exception:
+                # Reddit-only syntax such as author:name is left to the API
+                if source == "local":
+                    raise
+                df = None
+            
+            if df is not None and (source == "local" or len(df) >= limit):
+                return df
+        elif source == "local":
+            raise ScraperError("Local search needs a post store with full-text indexing")
+        
+        if self.backend == "json":
+            try:
+                self.circuit_breaker.before_call(subreddit_name)
+                df = self.json_client().search(subreddit_name, query, sort, time_filter, limit)
+                self._api_ok(subreddit_name)
+            except Exception as e:
+                raise self._api_error(e, "Error searching posts", subreddit_name) from e
+        else:
+            df = self._to_frame(list(self.iter_search(subreddit_name, query, sort, time_filter, limit)))
+        
+        self._persist(df)
+        
+        return df
+    
+    def get_demo_data(self, subreddit_name="demo", post_type="hot", limit=25, seed=0, order="score"):
         """
         Generate demo data for testing purposes.
         
+        Posts come from the seeded synthetic generator, so any number of them
+        can be produced and the same seed always gives the same posts.
+        
         Args:
             subreddit_name (str): Name for the demo subreddit
             post_type (str): Type of posts (for demo labeling)
             limit (int): Number of demo posts to generate
+            seed (int): Random seed
+            order (str): 'score' (highest first) or 'listing' (generation order)
         
         Returns:
             pandas.DataFrame: Demo post data
         """
-        import random
-        
-        demo_titles = [
-            "How to get started with Python programming",
-            "Best practices for web development in 2024",
-            "Amazing sunset photo from my backyard",
-            "Just finished my first machine learning project!",
-            "Tips for debugging code efficiently",
-            "New breakthrough in renewable energy technology",
-            "Cozy reading nook setup - what do you think?",
-            "Free online courses that changed my career",
-            "My homemade pizza turned out better than expected",
-            "Quick tutorial: Setting up a development environment",
-            "Interesting documentary recommendation",
-            "Local coffee shop with incredible atmosphere",
-            "Weekend project: Building a simple web app",
-            "Nature photography from my recent hiking trip",
-            "Book recommendation for aspiring entrepreneurs"
-        ]
-        
-        demo_authors = ["user123", "coder_pro", "nature_lover", "tech_enthusiast", "student_dev", 
-                       "photo_guru", "learning_always", "code_newbie", "adventure_seeker", "book_worm"]
-        
-        demo_posts = []
-        current_time = time.time()
-        
-        for i in range(min(limit, len(demo_titles))):
-            post_data = {
-                'title': demo_titles[i],
-                'author': random.choice(demo_authors),
-                'score': random.randint(5, 500),
-                'upvote_ratio': round(random.uniform(0.7, 0.98), 2),
-                'num_comments': random.randint(0, 100),
-                'created_utc': current_time - random.randint(3600, 86400 * 7),  # Last week
-                'created_date': datetime.fromtimestamp(current_time - random.randint(3600, 86400 * 7)).strftime('%Y-%m-%d %H:%M:%S'),
-                'url': f"https://reddit.com/r/{subreddit_name}/post_{i}",
-                'permalink': f"https://reddit.com/r/{subreddit_name}/comments/demo_{i}",
-                'selftext': "This is demo content for testing the Reddit scraper interface." if random.choice([True, False]) else "",
-                'is_self': random.choice([True, False]),
-                'subreddit': subreddit_name,
-                'post_id': f"demo_{i}",
-                'domain': "self.reddit" if random.choice([True, False]) else "example.com",
-                'over_18': False,
-                'spoiler': False,
-                'stickied': False,
-                'locked': False
-            }
-            demo_posts.append(post_data)
+        from synthetic import synthetic_posts
         
-        # Create DataFrame and sort by score
-        df = pd.DataFrame(demo_posts)
-        df = df.sort_values('score', ascending=False).reset_index(drop=True)
+        # Recent posts relative to now, like a live listing
+        df = synthetic_posts(limit, [subreddit_name], seed=seed, now_utc=time.time())
         
-        return df
+        return order_posts(df, order)
 
     def export_to_csv(self, df, filename=None):
         """
-        Export DataFrame to CSV file.
+        Export DataFrame to CSV.
         
         Args:
             df (pandas.DataFrame): Data to export
-            filename (str): Optional filename, if not provided will use timestamp
+            filename (str): Optional file to stream the CSV into instead of returning it
         
         Returns:
-            str: CSV data as string
+            str: CSV data as string, or the filename when one is given
         """
         try:
             if filename is None:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"reddit_scrape_{timestamp}.csv"
-            
-            # Convert to CSV string
-            csv_data = df.to_csv(index=False)
+                # Convert to CSV string
+                return df.to_csv(index=False)
             
-            return csv_data
+            self.export(df, filename, fmt="csv")
+            return filename
             
         except Exception as e:
             raise Exception(f"Error exporting to CSV: {str(e)}")
+    
+    def export(self, data, path, fmt="parquet", compression=None):
+        """
+        Stream posts into a columnar or line-delimited export.
+        
+        ``data`` may be a single DataFrame or an iterable of DataFrame batches
+        (e.g. ``iter_batches(iter_crawl(...))``); batches are written as they
+        arrive, so peak memory does not grow with the size of the export.
+        
+        Args:
+            data (pandas.DataFrame or iterable): Posts to export
+            path (str): Output file, or dataset directory for Parquet
+            fmt (str): 'parquet' (partitioned by subreddit/date), 'arrow', 'ndjson' or 'csv'
+            compression (str): Optional codec override, e.g. 'zstd' or 'gzip'
+        
+        Returns:
+            int: Number of rows written
+        """
+        from exporters import open_writer
+        
+        batches = [data] if isinstance(data, pd.DataFrame) else data
+        
+        try:
+            with open_writer(path, fmt, compression) as writer:
+                for batch in batches:
+                    with self.metrics.time('export'):
+                        writer.write_batch(batch)
+                return writer.rows_written
+        
+        except Exception as e:
+            raise Exception(f"Error exporting to {fmt}: {str(e)}")
@@ -0,0 +1,250 @@
+import json
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlencode, urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# Freshness per endpoint, matched against the URL path in order. Anything
+# unmatched (e.g. /api/info, which must always be live) is never cached.
+DEFAULT_TTLS = [
+    (r"/about(\.json)?/?$", 6 * 3600),
+    (r"/new(\.json)?/?$", 30),
+    (r"/(hot|rising)(\.json)?/?$", 120),
+    (r"/(top|controversial)(\.json)?/?$", 900),
+    (r"/search(\.json)?/?$", 300),
+    (r"^/comments/", 60)
+]
+
+# Headers that describe the live request budget and must not be replayed
+SKIP_HEADERS = {'x-ratelimit-remaining', 'x-ratelimit-used', 'x-ratelimit-reset', 'set-cookie', 'content-encoding',
+                'transfer-encoding', 'content-length'}
+
+
+class ResponseCache:
+    """
+    SQLite-backed HTTP response cache for GET requests.
+
+    Entries are fresh for a per-endpoint TTL and then revalidated with
+    ``If-None-Match`` when the server sent an ETag. The total body size is
+    bounded and least-recently-used entries are evicted first. Because the
+    cache lives in a file, separate Streamlit sessions and cron jobs share
+    it; the total size is kept in the database by triggers, so every
+    process evicts against the same number. Any object with the same
+    ``fetch``/``bypass``/``stats`` methods can be plugged into the scraper
+    instead.
+    """
+
+    def __init__(self, path="http_cache.db", max_bytes=256 * 1024 * 1024, ttls=None):
+        """
+        Open or create the cache.
+
+        Args:
+            path (str): SQLite database file (':memory:' for a per-process cache)
+            max_bytes (int): Maximum total size of cached bodies
+            ttls (list): (path regex, seconds) pairs, defaults to DEFAULT_TTLS
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttls = [(re.compile(pattern), ttl) for pattern, ttl in (ttls or DEFAULT_TTLS)]
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.executescript("""
+            BEGIN IMMEDIATE;
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                etag TEXT,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                size INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses (last_access);
+
+            -- Total body size shared by every process using the file
+            CREATE TABLE IF NOT EXISTS cache_size (
+                id INTEGER PRIMARY KEY CHECK (id = 0),
+                bytes INTEGER NOT NULL
+            );
+            INSERT OR IGNORE INTO cache_size (id, bytes) SELECT 0, COALESCE(SUM(size), 0) FROM responses;
+            CREATE TRIGGER IF NOT EXISTS responses_size_insert AFTER INSERT ON responses BEGIN
+                UPDATE cache_size SET bytes = bytes + NEW.size;
+            END;
+            CREATE TRIGGER IF NOT EXISTS responses_size_update AFTER UPDATE OF size ON responses BEGIN
+                UPDATE cache_size SET bytes = bytes + NEW.size - OLD.size;
+            END;
+            CREATE TRIGGER IF NOT EXISTS responses_size_delete AFTER DELETE ON responses BEGIN
+                UPDATE cache_size SET bytes = bytes - OLD.size;
+            END;
+            COMMIT;
+        """)
+
+    def ttl_for(self, url):
+        """
+        Get the freshness lifetime for a URL.
+
+        Returns:
+            int: Seconds to keep the response, 0 for uncacheable endpoints
+        """
+        path = urlsplit(url).path
+        for pattern, ttl in self.ttls:
+            if pattern.search(path):
+                return ttl
+        return 0
+
+    @staticmethod
+    def make_key(url, params=None):
+        """Build a cache key from the URL and sorted query parameters."""
+        if not params:
+            return url
+        items = params.items() if isinstance(params, dict) else params
+        return f"{url}?{urlencode(sorted((str(k), str(v)) for k, v in items))}"
+
+    @contextmanager
+    def bypass(self):
+        """Send requests made by this thread inside the block straight to the network."""
+        self._local.bypass = True
+        try:
+            yield
+        finally:
+            self._local.bypass = False
+
+    def fetch(self, method, url, params, headers, send):
+        """
+        Serve a request from the cache or forward it with ``send``.
+
+        Args:
+            method (str): HTTP method; only GET is cached
+            url (str): Request URL without the query string
+            params (dict): Query parameters
+            headers (dict): Request headers passed on to ``send``
+            send (callable): Called with the (possibly conditional) headers to do the real request
+
+        Returns:
+            requests.Response: Cached or live response
+        """
+        ttl = self.ttl_for(url) if method.upper() == 'GET' else 0
+        if ttl <= 0 or getattr(self._local, 'bypass', False):
+            return send(headers)
+
+        key = self.make_key(url, params)
+        now = time.time()
+
+        with self._lock:
+            entry = self._conn.execute(
+                "SELECT status, headers, body, etag, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if entry is not None and entry[4] > now:
+                self.hits += 1
+                self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+                self._conn.commit()
+                return self._to_response(url, entry)
+            self.misses += 1
+
+        if entry is not None and entry[3]:
+            headers = dict(headers or {}, **{'If-None-Match': entry[3]})
+
+        response = send(headers)
+
+        with self._lock:
+            if response.status_code == 304 and entry is not None:
+                self.revalidated += 1
+                self._conn.execute(
+                    "UPDATE responses SET expires_at = ?, last_access = ? WHERE key = ?", (now + ttl, now, key)
+                )
+                self._conn.commit()
+                return self._to_response(url, entry)
+
+            if response.status_code == 200:
+                self._store(key, url, response, now, ttl)
+
+        return response
+
+    def _store(self, key, url, response, now, ttl):
+        """
+        Insert a response and evict LRU entries over the size bound. Caller holds the lock.
+
+        The insert, the size check and the evictions share one write
+        transaction, so other processes see the bound hold.
+        """
+        body = response.content
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in SKIP_HEADERS}
+
+        with self._conn:
+            # An upsert rather than INSERT OR REPLACE, whose implicit delete would skip the size trigger
+            self._conn.execute(
+                """
+                INSERT INTO responses (key, url, status, headers, body, etag, expires_at, last_access, size)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (key) DO UPDATE SET
+                    url = excluded.url, status = excluded.status, headers = excluded.headers,
+                    body = excluded.body, etag = excluded.etag, expires_at = excluded.expires_at,
+                    last_access = excluded.last_access, size = excluded.size
+                """,
+                (key, url, response.status_code, json.dumps(headers), body, response.headers.get('ETag'),
+                 now + ttl, now, len(body))
+            )
+
+            while self._total_size() > self.max_bytes:
+                victim = self._conn.execute("SELECT key FROM responses ORDER BY last_access LIMIT 1").fetchone()
+                if victim is None:
+                    break
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (victim[0],))
+                self.evictions += 1
+
+    def _total_size(self):
+        """Total size of the cached bodies across all processes."""
+        return self._conn.execute("SELECT bytes FROM cache_size").fetchone()[0]
+
+    @staticmethod
+    def _to_response(url, entry):
+        """Rebuild a requests.Response from a cache row."""
+        response = requests.Response()
+        response.status_code = entry[0]
+        response.headers = CaseInsensitiveDict(json.loads(entry[1]))
+        response.headers['X-Cache'] = 'HIT'
+        response._content = entry[2]
+        response.url = url
+        response.encoding = 'utf-8'
+        return response
+
+    def stats(self):
+        """
+        Get cache counters.
+
+        Returns:
+            dict: Hits, misses, revalidations, evictions, hit rate and stored bytes
+        """
+        lookups = self.hits + self.misses
+        with self._lock:
+            size = self._total_size()
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'revalidated': self.revalidated,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'bytes': size
+        }
+
+    def clear(self):
+        """Drop every cached response."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self):
+        """Close the underlying database connection."""
+        self._conn.close()
@@ -0,0 +1,183 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+def frame_size(df):
+    """Approximate in-memory size of a DataFrame in bytes."""
+    return int(df.memory_usage(deep=True).sum())
+
+
+def result_key(subreddit_name, post_type, time_filter, limit):
+    """
+    Build the cache key of a listing scrape.
+
+    The time filter only changes 'top' listings and subreddit names are
+    case-insensitive, so equivalent requests share one key.
+    """
+    return (subreddit_name.lower(), post_type, time_filter if post_type == "top" else "all", int(limit))
+
+
+class _InFlight:
+    """A computation other callers can wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class ResultCache:
+    """
+    Process-wide cache of scrape results with request coalescing.
+
+    Entries expire after ``ttl`` seconds and the least recently used ones
+    are evicted once their total size exceeds ``max_bytes``. When several
+    threads ask for the same missing key at once, only the first computes
+    it; the others wait for and share its result (or its exception). Cached
+    DataFrames are shared, so callers must treat them as read-only.
+    """
+
+    def __init__(self, ttl=300.0, max_bytes=256 * 1024 * 1024, sizeof=frame_size, clock=time.monotonic):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl (float): Seconds an entry stays fresh
+            max_bytes (int): Upper bound on the total size of cached values
+            sizeof (callable): Returns the size of a value in bytes
+            clock (callable): Monotonic clock, overridable for testing
+        """
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self._sizeof = sizeof
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> (value, size, expires_at), least recently used first
+        self._entries = OrderedDict()
+        self._in_flight = {}
+        self._size = 0
+
+    def get(self, key):
+        """
+        Look up a fresh entry.
+
+        Returns:
+            object: Cached value, or None when missing or expired
+        """
+        with self._lock:
+            return self._lookup(key)
+
+    def _lookup(self, key):
+        """Return a fresh value and mark it recently used. Caller holds the lock."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[2] <= self._clock():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def get_or_compute(self, key, compute):
+        """
+        Return the cached value for ``key``, computing it at most once across threads.
+
+        Args:
+            key (hashable): Cache key, e.g. from result_key
+            compute (callable): Produces the value on a miss
+
+        Returns:
+            object: Cached, shared or freshly computed value
+        """
+        with self._lock:
+            value = self._lookup(key)
+            if value is not None:
+                self.hits += 1
+                return value
+
+            flight = self._in_flight.get(key)
+            if flight is None:
+                flight = self._in_flight[key] = _InFlight()
+                leader = True
+                self.misses += 1
+            else:
+                leader = False
+                self.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = compute()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+                if flight.error is None:
+                    self._store(key, flight.value)
+            flight.done.set()
+
+        return flight.value
+
+    def _store(self, key, value):
+        """Insert a value and evict LRU entries over the size bound. Caller holds the lock."""
+        if value is None:
+            return
+
+        size = self._sizeof(value)
+        if size > self.max_bytes:
+            return
+
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (value, size, self._clock() + self.ttl)
+        self._size += size
+
+        while self._size > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key):
+        """Drop an entry. Caller holds the lock."""
+        _, size, _ = self._entries.pop(key)
+        self._size -= size
+
+    def invalidate(self, key=None):
+        """Drop one entry, or every entry when ``key`` is None."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                self._size = 0
+            elif key in self._entries:
+                self._remove(key)
+
+    def stats(self):
+        """
+        Get cache counters.
+
+        Returns:
+            dict: Hits, misses, coalesced waits, evictions, hit rate, entries and bytes held
+        """
+        with self._lock:
+            lookups = self.hits + self.misses + self.coalesced
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'coalesced': self.coalesced,
+                'evictions': self.evictions,
+                # A coalesced wait shares another caller's result, so it counts as a hit
+                'hit_rate': (self.hits + self.coalesced) / lookups if lookups else 0.0,
+                'entries': len(self._entries),
+                'bytes': self._size
+            }
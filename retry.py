@@ -0,0 +1,223 @@
+import math
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from errors import CircuitOpen
+
+# Statuses worth another attempt: rate limiting, gateway hiccups and 5xx
+RETRY_STATUSES = {408, 429, 500, 502, 503, 504, 520, 522}
+
+
+def parse_retry_after(headers):
+    """
+    Read how long the server asked us to wait.
+
+    Args:
+        headers (dict): Response headers
+
+    Returns:
+        float: Seconds to wait, or None if the response did not say
+    """
+    value = headers.get('retry-after')
+    if value:
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            # HTTP-date form
+            return max((parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds(), 0.0)
+        except (TypeError, ValueError):
+            pass
+
+    # Reddit rarely sends Retry-After but always reports when its window resets
+    reset = headers.get('x-ratelimit-reset')
+    if reset is not None and headers.get('x-ratelimit-remaining') is not None:
+        try:
+            if float(headers['x-ratelimit-remaining']) < 1:
+                return float(reset)
+        except ValueError:
+            pass
+    return None
+
+
+class RetryPolicy:
+    """
+    Retries HTTP requests on transient failures with exponential backoff.
+
+    Delays use "full jitter" (a random wait between zero and the capped
+    exponential bound) so concurrent workers that failed together do not
+    retry together. A server-supplied ``Retry-After`` always takes
+    precedence as the minimum wait. A single instance is safe to share
+    between threads.
+    """
+
+    def __init__(self, max_attempts=4, base_delay=0.5, max_delay=30.0, max_retry_after=120.0, sleep=time.sleep,
+                 rng=random.random):
+        """
+        Initialize the retry policy.
+
+        Args:
+            max_attempts (int): Total attempts per request, including the first
+            base_delay (float): Backoff bound of the first retry in seconds
+            max_delay (float): Upper bound of the exponential backoff
+            max_retry_after (float): Longest Retry-After to honour; longer waits fail fast instead
+            sleep (callable): Sleep function, overridable for testing
+            rng (callable): Returns a float in [0, 1), overridable for testing
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.retries = 0
+        self.total_sleep = 0.0
+        self._sleep = sleep
+        self._rng = rng
+        self._lock = threading.Lock()
+
+    def backoff(self, attempt, retry_after=None):
+        """
+        Compute the wait before the next attempt.
+
+        Args:
+            attempt (int): Number of attempts made so far (1 after the first failure)
+            retry_after (float): Server-requested wait in seconds, if any
+
+        Returns:
+            float: Seconds to sleep
+        """
+        bound = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        delay = bound * self._rng()
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    def _wait(self, delay):
+        with self._lock:
+            self.retries += 1
+            self.total_sleep += delay
+        self._sleep(delay)
+
+    def send(self, send, retry_exceptions=()):
+        """
+        Call ``send`` until it returns a non-retryable response or attempts run out.
+
+        The last response is returned as-is when attempts are exhausted, so the
+        caller's usual status handling turns it into an error.
+
+        Args:
+            send (callable): Issues the request and returns a requests.Response
+            retry_exceptions (tuple): Exception types (network errors) that also warrant a retry
+
+        Returns:
+            requests.Response: Final response
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = send()
+            except retry_exceptions:
+                if attempt >= self.max_attempts:
+                    raise
+                self._wait(self.backoff(attempt))
+                continue
+
+            if response.status_code not in RETRY_STATUSES or attempt >= self.max_attempts:
+                return response
+
+            retry_after = parse_retry_after(response.headers)
+            if retry_after is not None and retry_after > self.max_retry_after:
+                return response
+            self._wait(self.backoff(attempt, retry_after))
+
+    def stats(self):
+        """
+        Get retry counters.
+
+        Returns:
+            dict: Number of retries and total seconds slept between attempts
+        """
+        return {'retries': self.retries, 'total_sleep': self.total_sleep}
+
+
+class CircuitBreaker:
+    """
+    Per-key circuit breaker, keyed by subreddit.
+
+    After ``failure_threshold`` consecutive transient failures the circuit
+    for that subreddit opens and calls fail immediately with ``CircuitOpen``
+    for ``reset_timeout`` seconds. Then a single trial call is let through
+    (half-open): success closes the circuit, failure opens it again. Other
+    subreddits are unaffected.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=60.0, clock=time.monotonic):
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            failure_threshold (int): Consecutive failures that open a circuit
+            reset_timeout (float): Seconds a circuit stays open before a trial call
+            clock (callable): Monotonic clock, overridable for testing
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> {'failures': int, 'opened_at': float or None, 'trial': bool}
+        self._circuits = {}
+
+    def before_call(self, key):
+        """
+        Check that a call for ``key`` may proceed.
+
+        Raises:
+            CircuitOpen: If the circuit is open or a half-open trial is already running
+        """
+        key = key.lower()
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None or circuit['opened_at'] is None:
+                return
+
+            remaining = circuit['opened_at'] + self.reset_timeout - self._clock()
+            if remaining > 0 or circuit['trial']:
+                raise CircuitOpen(
+                    f"Too many failures for r/{key}; paused for {math.ceil(max(remaining, 0))}s",
+                    max(remaining, 0.0)
+                )
+            circuit['trial'] = True
+
+    def record_success(self, key):
+        """Close the circuit for ``key``."""
+        with self._lock:
+            self._circuits.pop(key.lower(), None)
+
+    def record_failure(self, key):
+        """Count a transient failure for ``key`` and open its circuit at the threshold."""
+        key = key.lower()
+        with self._lock:
+            circuit = self._circuits.setdefault(key, {'failures': 0, 'opened_at': None, 'trial': False})
+            circuit['failures'] += 1
+            if circuit['trial'] or circuit['failures'] >= self.failure_threshold:
+                circuit['opened_at'] = self._clock()
+                circuit['trial'] = False
+
+    def state(self, key):
+        """
+        Get the state of a circuit.
+
+        Returns:
+            str: 'closed', 'open' or 'half-open'
+        """
+        with self._lock:
+            circuit = self._circuits.get(key.lower())
+            if circuit is None or circuit['opened_at'] is None:
+                return 'closed'
+            if circuit['trial'] or self._clock() >= circuit['opened_at'] + self.reset_timeout:
+                return 'half-open'
+            return 'open'
@@ -0,0 +1,109 @@
+import sqlite3
+import threading
+
+
+class SeenIndex:
+    """
+    On-disk index of post IDs that have already been ingested.
+
+    Keeps a per-subreddit high-water mark (newest ``created_utc`` seen) and a
+    compact set of recent post IDs in SQLite, so incremental scrapes of the
+    ``new`` listing can stop paging as soon as they reach known posts.
+    """
+
+    def __init__(self, path="seen_posts.db", retention=7 * 86400):
+        """
+        Open or create the index.
+
+        Args:
+            path (str): SQLite database file (':memory:' for a throwaway index)
+            retention (int): Seconds of post IDs to keep below the high-water mark
+        """
+        self.path = path
+        self.retention = retention
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS seen_posts (
+                subreddit TEXT NOT NULL,
+                post_id TEXT NOT NULL,
+                created_utc REAL NOT NULL,
+                PRIMARY KEY (subreddit, post_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_seen_posts_created
+                ON seen_posts (subreddit, created_utc);
+            CREATE TABLE IF NOT EXISTS high_water (
+                subreddit TEXT PRIMARY KEY,
+                created_utc REAL NOT NULL,
+                post_id TEXT NOT NULL
+            );
+        """)
+        self._conn.commit()
+
+    def high_water_mark(self, subreddit):
+        """
+        Get the newest ingested post for a subreddit.
+
+        Args:
+            subreddit (str): Subreddit name
+
+        Returns:
+            float: created_utc of the newest ingested post, or None if never scraped
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT created_utc FROM high_water WHERE subreddit = ?", (subreddit.lower(),)
+            ).fetchone()
+        return row[0] if row else None
+
+    def is_seen(self, subreddit, post_id):
+        """Check whether a post has already been ingested."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM seen_posts WHERE subreddit = ? AND post_id = ?", (subreddit.lower(), post_id)
+            ).fetchone()
+        return row is not None
+
+    def mark_seen(self, subreddit, posts):
+        """
+        Record ingested posts and advance the high-water mark.
+
+        IDs older than ``retention`` seconds below the new mark are pruned so
+        the index stays small however long the cron has been running.
+
+        Args:
+            subreddit (str): Subreddit name
+            posts (list): (post_id, created_utc) pairs
+        """
+        if not posts:
+            return
+
+        subreddit = subreddit.lower()
+        newest_id, newest_utc = max(posts, key=lambda post: post[1])
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO seen_posts (subreddit, post_id, created_utc) VALUES (?, ?, ?)",
+                [(subreddit, post_id, created_utc) for post_id, created_utc in posts]
+            )
+            self._conn.execute(
+                """
+                INSERT INTO high_water (subreddit, created_utc, post_id) VALUES (?, ?, ?)
+                ON CONFLICT (subreddit) DO UPDATE SET
+                    created_utc = excluded.created_utc,
+                    post_id = excluded.post_id
+                WHERE excluded.created_utc > high_water.created_utc
+                """,
+                (subreddit, newest_utc, newest_id)
+            )
+            self._conn.execute(
+                """
+                DELETE FROM seen_posts WHERE subreddit = ? AND created_utc <
+                    (SELECT created_utc FROM high_water WHERE subreddit = ?) - ?
+                """,
+                (subreddit, subreddit, self.retention)
+            )
+
+    def close(self):
+        """Close the underlying database connection."""
+        self._conn.close()
@@ -0,0 +1,301 @@
+"""
+Deterministic synthetic Reddit data for demos, load tests and benchmarks.
+
+The same seed always yields the same posts and comment trees, in batches
+of any size up to millions of rows. Columns and dtypes match what the
+scrapers produce, so synthetic frames can go through the store, the
+exporters and the UI unchanged.
+"""
+import numpy as np
+import pandas as pd
+
+from normalize import COMMENT_DTYPES, POST_DTYPES, apply_dtypes
+
+# Fixed reference time so runs are reproducible; pass now_utc to override
+EPOCH_UTC = 1_700_000_000.0
+
+TITLE_TEMPLATES = [
+    "How to get started with {}",
+    "Best practices for {} in 2024",
+    "Just finished my first {} project!",
+    "Tips for debugging {} efficiently",
+    "New breakthrough in {}",
+    "Free online courses on {} that changed my career",
+    "Quick tutorial: setting up {}",
+    "Weekend project: building something with {}",
+    "Why does everyone recommend {}?",
+    "Unpopular opinion: {} is overrated",
+    "What I learned after a year of {}",
+    "Is {} still worth learning?",
+    "Help! {} keeps breaking and I don't know why",
+    "Book recommendation for people into {}",
+    "Show and tell: my {} setup"
+]
+
+TOPICS = [
+    "Python", "web development", "machine learning", "renewable energy", "home cooking", "photography",
+    "hiking", "Rust", "data science", "woodworking", "gardening", "personal finance", "mechanical keyboards",
+    "3D printing", "home automation", "sourdough", "running", "chess", "board games", "astronomy"
+]
+
+SENTENCES = [
+    "I've been working on this for a few weeks now.",
+    "Any feedback is appreciated.",
+    "Here is what I tried so far.",
+    "The documentation wasn't much help.",
+    "It finally works, but I'm not sure it's the right approach.",
+    "Curious what everyone else thinks.",
+    "Edit: thanks for all the replies!",
+    "This is my first post here, be gentle.",
+    "Links in the comments.",
+    "Happy to answer questions."
+]
+
+COMMENT_BODIES = [
+    "Great post, thanks for sharing!",
+    "This is exactly what I needed.",
+    "I disagree, but interesting take.",
+    "Have you tried reading the docs?",
+    "Same thing happened to me last week.",
+    "Source?",
+    "Saving this for later.",
+    "Underrated comment.",
+    "Can you explain that a bit more?",
+    "This should be higher up."
+]
+
+LINK_DOMAINS = ["example.com", "github.com", "medium.com", "nytimes.com", "arstechnica.com", "i.redd.it",
+                "youtube.com", "en.wikipedia.org"]
+
+# Posts generated per batch when no batch size is given
+DEFAULT_BATCH_SIZE = 100_000
+
+
+def _base36(values):
+    """Render non-negative integers as Reddit-style base-36 IDs of equal width."""
+    values = np.asarray(values, dtype=np.int64)
+    if not len(values):
+        return []
+    width = len(np.base_repr(int(values.max()), 36))
+    digits = np.empty((len(values), width), dtype=np.uint8)
+    rest = values
+    for position in range(width - 1, -1, -1):
+        rest, digits[:, position] = np.divmod(rest, 36)
+    alphabet = np.frombuffer(b"0123456789abcdefghijklmnopqrstuvwxyz", dtype=np.uint8)
+    return alphabet[digits].view(f"S{width}").ravel().astype(str).tolist()
+
+
+def _authors(count, seed):
+    """Deterministic pool of usernames."""
+    rng = np.random.default_rng([seed, 0xA17])
+    first = ["code", "nature", "tech", "photo", "book", "coffee", "night", "pixel", "quiet", "lucky"]
+    second = ["lover", "guru", "wizard", "fan", "nerd", "seeker", "builder", "owl", "panda", "dev"]
+    return [
+        f"{first[a]}_{second[b]}{n}"
+        for a, b, n in zip(rng.integers(0, 10, count), rng.integers(0, 10, count), rng.integers(1, 9999, count))
+    ]
+
+
+def _pick(options, index):
+    """Look up ``options[index]`` for an array of indices, as a pyarrow-backed string Series."""
+    return pd.Series(np.asarray(options, dtype=object)[index], dtype='string[pyarrow]')
+
+
+def _post_batch(rng, start, size, subreddits, authors, now_utc, span):
+    """Generate one typed batch of posts with IDs ``start`` .. ``start + size - 1``."""
+    # Every title and selftext is one of a few hundred combinations, so build
+    # those once and index into them instead of formatting per post
+    titles = [template.format(topic) for template in TITLE_TEMPLATES for topic in TOPICS]
+    bodies = [
+        " ".join(SENTENCES[(first + k) % len(SENTENCES)] for k in range(length))
+        for first in range(len(SENTENCES)) for length in range(1, 5)
+    ]
+
+    # Heavy-tailed scores: most posts get a handful of votes, a few go viral
+    score = np.floor(rng.pareto(1.2, size) * 10).astype(np.int64)
+    num_comments = rng.poisson(score * 0.15 + 1).astype(np.int32)
+    upvote_ratio = np.clip(rng.normal(0.9, 0.07, size), 0.5, 1.0).astype(np.float32)
+    created_utc = now_utc - rng.uniform(0, span, size)
+
+    ids = pd.Series(_base36(np.arange(start, start + size) + 36 ** 5), dtype='string[pyarrow]')
+    subreddit_index = rng.integers(0, len(subreddits), size)
+    subreddit = _pick(subreddits, subreddit_index)
+    author = np.asarray(authors, dtype=object)[np.minimum(rng.zipf(1.5, size) - 1, len(authors) - 1)]
+
+    is_self = rng.random(size) < 0.4
+    selftext = _pick(bodies, rng.integers(0, len(bodies), size)).where(is_self, "")
+    link_domain = _pick(LINK_DOMAINS, rng.integers(0, len(LINK_DOMAINS), size))
+    permalink = "https://reddit.com/r/" + subreddit + "/comments/" + ids + "/"
+
+    df = pd.DataFrame({
+        'title': _pick(titles, rng.integers(0, len(titles), size)),
+        'author': author,
+        'score': score,
+        'upvote_ratio': upvote_ratio,
+        'num_comments': num_comments,
+        'created_utc': created_utc,
+        'url': permalink.where(is_self, "https://" + link_domain + "/" + ids),
+        'permalink': permalink,
+        'selftext': selftext,
+        'is_self': is_self,
+        'subreddit': subreddit,
+        'post_id': ids,
+        'domain': ("self." + subreddit).where(is_self, link_domain),
+        'over_18': rng.random(size) < 0.02,
+        'spoiler': rng.random(size) < 0.01,
+        'stickied': np.zeros(size, dtype=bool),
+        'locked': rng.random(size) < 0.005
+    })
+    return apply_dtypes(df, POST_DTYPES)
+
+
+def iter_synthetic_posts(n, subreddits=("demo",), seed=0, now_utc=EPOCH_UTC, span=7 * 86400,
+                         batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Stream synthetic posts in typed batches, so millions of rows never sit in memory at once.
+
+    Output depends only on the arguments: the same seed and batch size
+    always give the same posts.
+
+    Args:
+        n (int): Total number of posts
+        subreddits (list): Subreddit names the posts are spread over
+        seed (int): Random seed
+        now_utc (float): Newest possible creation time; posts fall within ``span`` seconds before it
+        span (float): Age range of the posts in seconds
+        batch_size (int): Maximum number of posts per batch
+
+    Yields:
+        pandas.DataFrame: Post data with the scraper's schema
+    """
+    subreddits = list(subreddits)
+    authors = _authors(max(100, min(n // 20, 50_000)), seed)
+    for index, start in enumerate(range(0, n, batch_size)):
+        rng = np.random.default_rng([seed, index])
+        yield _post_batch(rng, start, min(batch_size, n - start), subreddits, authors, now_utc, span)
+
+
+def synthetic_posts(n, subreddits=("demo",), seed=0, now_utc=EPOCH_UTC, span=7 * 86400):
+    """
+    Generate synthetic posts as one DataFrame.
+
+    Args:
+        n (int): Number of posts
+        subreddits (list): Subreddit names the posts are spread over
+        seed (int): Random seed
+        now_utc (float): Newest possible creation time
+        span (float): Age range of the posts in seconds
+
+    Returns:
+        pandas.DataFrame: Post data with the scraper's schema
+    """
+    frames = list(iter_synthetic_posts(n, subreddits, seed, now_utc, span))
+    if not frames:
+        return pd.DataFrame()
+    if len(frames) == 1:
+        return frames[0]
+    return apply_dtypes(pd.concat(frames, ignore_index=True), POST_DTYPES)
+
+
+def synthetic_comments(posts, seed=0, max_comments=500, max_depth=10, reply_chance=0.6):
+    """
+    Generate a comment tree for each post.
+
+    Each post gets ``num_comments`` comments (capped at ``max_comments``).
+    A comment replies to an earlier comment of the same thread with
+    probability ``reply_chance``, preferring recent ones, otherwise it is
+    top-level; replies are never deeper than ``max_depth`` and never older
+    than what they reply to.
+
+    Args:
+        posts (pandas.DataFrame): Posts as returned by synthetic_posts
+        seed (int): Random seed
+        max_comments (int): Upper bound on comments per post
+        max_depth (int): Deepest allowed reply level (0 = top-level only)
+        reply_chance (float): Probability that a comment is a reply
+
+    Returns:
+        pandas.DataFrame: Comment data with the scraper's comment schema
+    """
+    rng = np.random.default_rng([seed, 0xC0])
+    counts = np.minimum(posts['num_comments'].to_numpy(), max_comments)
+    total = int(counts.sum())
+    if not total:
+        return pd.DataFrame()
+
+    # Pick every random number up front; only the tree wiring is a Python loop
+    is_reply = rng.random(total) < reply_chance
+    lookback = rng.geometric(0.3, total)
+    delays = rng.exponential(1800.0, total)
+    bodies = rng.integers(0, len(COMMENT_BODIES), total)
+    scores = np.floor(rng.pareto(1.5, total) * 3).astype(np.int64) - 1
+    author_pool = _authors(max(100, min(total // 10, 50_000)), seed)
+    authors = np.minimum(rng.zipf(1.5, total) - 1, len(author_pool) - 1)
+
+    comment_ids = _base36(np.arange(total) + 36 ** 6)
+    parent_ids = []
+    depths = np.zeros(total, dtype=np.int16)
+    created = np.empty(total)
+    post_ids = []
+    subreddits = []
+    permalinks = []
+    submitter = np.zeros(total, dtype=bool)
+
+    position = 0
+    for post_id, subreddit, post_author, post_created, count in zip(
+        posts['post_id'], posts['subreddit'], posts['author'], posts['created_utc'], counts
+    ):
+        first = position
+        for offset in range(int(count)):
+            i = first + offset
+            parent = i - int(lookback[i]) if is_reply[i] and offset else -1
+            if parent >= first and depths[parent] < max_depth:
+                parent_ids.append(f"t1_{comment_ids[parent]}")
+                depths[i] = depths[parent] + 1
+                created[i] = created[parent] + delays[i]
+            else:
+                parent_ids.append(f"t3_{post_id}")
+                created[i] = post_created + delays[i]
+            post_ids.append(post_id)
+            subreddits.append(subreddit)
+            permalinks.append(f"https://reddit.com/r/{subreddit}/comments/{post_id}/_/{comment_ids[i]}/")
+            submitter[i] = author_pool[authors[i]] == post_author
+        position += int(count)
+
+    df = pd.DataFrame({
+        'comment_id': comment_ids,
+        'post_id': post_ids,
+        'parent_id': parent_ids,
+        'depth': depths,
+        'author': np.asarray(author_pool, dtype=object)[authors],
+        'body': np.asarray(COMMENT_BODIES, dtype=object)[bodies],
+        'score': scores,
+        'created_utc': created,
+        'is_submitter': submitter,
+        'stickied': np.zeros(total, dtype=bool),
+        'permalink': permalinks,
+        'subreddit': subreddits
+    })
+    return apply_dtypes(df, COMMENT_DTYPES)
+
+
+def listing_children(posts):
+    """
+    Render posts as Reddit listing children, e.g. as a FakeReddit fixture.
+
+    Args:
+        posts (pandas.DataFrame): Posts as returned by synthetic_posts
+
+    Returns:
+        list: ``{'kind': 't3', 'data': {...}}`` entries with the fields the scrapers read
+    """
+    children = []
+    for post in posts.drop(columns='created_date').to_dict('records'):
+        data = dict(post)
+        data['id'] = data.pop('post_id')
+        data['name'] = f"t3_{data['id']}"
+        data['permalink'] = data['permalink'].replace("https://reddit.com", "", 1)
+        data['created'] = data['created_utc']
+        data['upvote_ratio'] = float(data['upvote_ratio'])
+        children.append({'kind': 't3', 'data': data})
+    return children
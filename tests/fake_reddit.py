@@ -0,0 +1,205 @@
+"""
+Local stand-in for the Reddit API that replays recorded listing fixtures.
+
+Listing pages are built by cycling the fixture's posts with rewritten IDs,
+so any depth of ``after`` pagination can be served offline. Only the
+endpoints the scraper uses are implemented. Shared by the tests and the
+benchmarks; ``make_scraper`` builds a scraper pointed at a running server.
+"""
+import copy
+import json
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import praw
+
+from reddit_scraper import RateLimitedRequestor, RedditScraper, disable_session_retries
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+LISTING_PATH = re.compile(r"^/r/(?P<subreddit>[^/]+)/(?P<sort>hot|new|top|rising|search)(?:\.json)?/?$")
+
+RATE_LIMIT_HEADERS = {
+    'x-ratelimit-remaining': '995.0',
+    'x-ratelimit-used': '5',
+    'x-ratelimit-reset': '300'
+}
+
+
+def load_fixture(name="listing_python_new.json"):
+    """Load a recorded listing page from the fixtures directory."""
+    with open(os.path.join(FIXTURE_DIR, name), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+class FakeReddit:
+    """
+    Threaded HTTP server serving fixture-backed listings on localhost.
+
+    Use as a context manager; ``url`` is the base URL to pass to PRAW as
+    ``oauth_url``/``reddit_url`` or to the JSON listing client.
+    """
+
+    def __init__(self, fixture=None, depth=1000, latency=0.0, fail_every=0, rate_limit_headers=None):
+        """
+        Initialize the server.
+
+        Args:
+            fixture (dict): Listing JSON whose children are replayed, defaults to the recorded fixture
+            depth (int): Number of posts each listing holds before running out
+            latency (float): Artificial per-request delay in seconds
+            fail_every (int): Answer every n-th GET with a 503, 0 to never fail
+            rate_limit_headers (dict): X-Ratelimit-* headers sent with every response; may be changed while serving
+        """
+        self.template = (fixture or load_fixture())['data']['children']
+        self.depth = depth
+        self.latency = latency
+        self.fail_every = fail_every
+        self.rate_limit_headers = dict(rate_limit_headers or RATE_LIMIT_HEADERS)
+        self.request_count = 0
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+        self.url = None
+
+    def post(self, subreddit, index):
+        """Build the listing child at a given position of a subreddit's listing."""
+        child = copy.deepcopy(self.template[index % len(self.template)])
+        data = child['data']
+        post_id = f"{subreddit.lower()[:4]}{index:06d}"
+        data.update({
+            'id': post_id,
+            'name': f"t3_{post_id}",
+            'subreddit': subreddit,
+            'subreddit_name_prefixed': f"r/{subreddit}",
+            'permalink': f"/r/{subreddit}/comments/{post_id}/x/",
+            'created_utc': data['created_utc'] - index * 60,
+            'created': data['created_utc'] - index * 60
+        })
+        return child
+
+    def listing(self, subreddit, params):
+        """Build one listing page honouring ``limit`` and ``after``."""
+        limit = min(int(params.get('limit', ['25'])[0]), 100)
+        after = params.get('after', [None])[0]
+        start = int(after[-6:]) + 1 if after else 0
+        end = min(start + limit, self.depth)
+
+        children = [self.post(subreddit, index) for index in range(start, end)]
+        return {
+            'kind': 'Listing',
+            'data': {
+                'after': children[-1]['data']['name'] if children and end < self.depth else None,
+                'before': None,
+                'dist': len(children),
+                'children': children
+            }
+        }
+
+    def info(self, params):
+        """Serve /api/info lookups by fullname."""
+        children = []
+        for fullname in params.get('id', [''])[0].split(','):
+            match = re.match(r"^t3_(?P<prefix>\w{1,4}?)(?P<index>\d{6})$", fullname)
+            if match:
+                children.append(self.post(match.group('prefix'), int(match.group('index'))))
+        return {'kind': 'Listing', 'data': {'after': None, 'before': None, 'children': children}}
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, body, status=200, headers=None):
+                payload = json.dumps(body).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json; charset=UTF-8')
+                self.send_header('Content-Length', str(len(payload)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                for key, value in fake.rate_limit_headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                self._send({'access_token': 'fake-token', 'token_type': 'bearer', 'expires_in': 86400, 'scope': '*'})
+
+            def do_GET(self):
+                with fake._lock:
+                    fake.request_count += 1
+                    count = fake.request_count
+                if fake.latency:
+                    threading.Event().wait(fake.latency)
+                if fake.fail_every and count % fake.fail_every == 0:
+                    return self._send({'message': 'Service Unavailable', 'error': 503}, status=503,
+                                      headers={'Retry-After': '0'})
+
+                url = urlparse(self.path)
+                params = parse_qs(url.query)
+                match = LISTING_PATH.match(url.path)
+                if match:
+                    return self._send(fake.listing(match.group('subreddit'), params))
+                if url.path.rstrip('/') in ('/api/info', '/api/info.json'):
+                    return self._send(fake.info(params))
+                self._send({'message': 'Not Found', 'error': 404}, status=404)
+
+        return Handler
+
+    def start(self):
+        """Start serving on a free localhost port."""
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        return self
+
+    def stop(self):
+        """Shut the server down."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def make_scraper(url, backend, cache=None, metrics=None, rate_limiter=None):
+    """Build a scraper whose PRAW and JSON clients both point at the fake server."""
+    scraper = RedditScraper(backend=backend, cache=cache, metrics=metrics)
+    if rate_limiter is not None:
+        scraper.rate_limiter = rate_limiter
+    scraper.client_id = "bench-client"
+    scraper.client_secret = "bench-secret"
+    scraper.reddit = praw.Reddit(
+        client_id=scraper.client_id,
+        client_secret=scraper.client_secret,
+        user_agent=scraper.user_agent,
+        oauth_url=url,
+        reddit_url=url,
+        requestor_class=RateLimitedRequestor,
+        requestor_kwargs={
+            'rate_limiter': scraper.rate_limiter,
+            'cache': scraper.cache,
+            'retry_policy': scraper.retry_policy,
+            'metrics': scraper.metrics
+        }
+    )
+    disable_session_retries(scraper.reddit)
+    client = scraper.json_client()
+    client.oauth_url = url
+    client.reddit_url = url
+    return scraper
@@ -0,0 +1,26 @@
+import pytest
+
+from errors import CircuitOpen, NotFound, Private, RateLimited, Transient, Unauthorized, error_for_status
+from reddit_scraper import RedditScraper
+
+
+@pytest.mark.parametrize("error, keeps_status", [
+    (NotFound("no such subreddit"), True),
+    (Private("private"), True),
+    (CircuitOpen("paused", 30.0), True),
+    (Transient("503"), False),
+    (RateLimited("429", 10.0), False),
+    (Unauthorized("401"), False),
+])
+def test_only_api_level_failures_drop_the_cached_health_check(error, keeps_status):
+    scraper = RedditScraper()
+    scraper._set_api_status(True)
+
+    raised = scraper._api_error(error, "Error scraping subreddit", "python")
+
+    assert type(raised) is type(error)
+    assert (scraper._api_status is True) == keeps_status
+
+
+def test_rejected_credentials_are_unauthorized():
+    assert error_for_status(401) is Unauthorized
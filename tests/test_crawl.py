@@ -0,0 +1,61 @@
+import json
+
+import pytest
+
+from errors import Transient
+from fake_reddit import FakeReddit, make_scraper
+from post_store import PostStore
+from seen_index import SeenIndex
+
+
+def no_praw():
+    raise AssertionError("the JSON backend must not go through PRAW")
+
+
+@pytest.mark.parametrize("backend", ["praw", "json"])
+def test_interrupted_crawl_keeps_its_pages_and_resumes_after_them(backend, monkeypatch, tmp_path):
+    checkpoint_path = str(tmp_path / "crawl.json")
+    store = PostStore(":memory:")
+
+    # The third listing page fails, after two pages were fetched
+    with FakeReddit(depth=500, fail_every=3) as server:
+        scraper = make_scraper(server.url, backend)
+        if backend == "json":
+            monkeypatch.setattr(scraper, '_client', no_praw)
+        scraper.store = store
+        scraper.retry_policy.max_attempts = 1
+
+        with pytest.raises(Transient):
+            scraper.crawl_subreddit("Python", "new", max_posts=500, checkpoint_path=checkpoint_path)
+
+        with open(checkpoint_path, encoding='utf-8') as f:
+            checkpoint = json.load(f)
+        assert checkpoint['count'] == 200 and not checkpoint['complete']
+        assert store.count_posts() == 200
+
+        server.fail_every = 0
+        scraper.circuit_breaker.record_success("Python")
+        resumed = scraper.crawl_subreddit("Python", "new", max_posts=500, checkpoint_path=checkpoint_path)
+
+    assert len(resumed) == 300
+    assert store.count_posts() == 500
+    with open(checkpoint_path, encoding='utf-8') as f:
+        assert json.load(f)['complete']
+    store.close()
+
+
+def test_incremental_scrape_uses_the_json_backend(monkeypatch, tmp_path):
+    seen_index = SeenIndex(str(tmp_path / "seen.db"))
+    with FakeReddit(depth=300) as server:
+        scraper = make_scraper(server.url, "json")
+        monkeypatch.setattr(scraper, '_client', no_praw)
+
+        first = scraper.scrape_new_since("Python", seen_index, limit=300)
+        requests = server.request_count
+        second = scraper.scrape_new_since("Python", seen_index, limit=300)
+
+    assert len(first) == 300
+    assert second.empty
+    # The second run stops on the first page, at the newest post it has already seen
+    assert server.request_count - requests == 1
+    seen_index.close()
@@ -0,0 +1,41 @@
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from exporters import ArrowIPCWriter, ParquetDatasetWriter
+from synthetic import synthetic_posts
+
+
+def test_arrow_writer_accepts_batches_with_different_categories(tmp_path):
+    first = synthetic_posts(50, ["python"], seed=1)
+    second = synthetic_posts(70, ["rust", "news"], seed=2)
+    path = str(tmp_path / "posts.arrow")
+
+    with ArrowIPCWriter(path) as writer:
+        writer.write_batch(first)
+        writer.write_batch(second)
+
+    table = pa.ipc.open_file(path).read_all()
+    assert table.num_rows == 120
+    assert table.schema.field('subreddit').type == pa.string()
+    assert set(table.column('subreddit').to_pylist()) == {"python", "rust", "news"}
+
+
+def test_parquet_writer_bounds_open_files_and_buffers_row_groups(tmp_path):
+    posts = synthetic_posts(3000, [f"sub{index}" for index in range(20)], seed=3)
+    posts['created_utc'] = 1.7e9 + (pd.Series(range(len(posts))) % 5) * 86400.0
+    base_dir = str(tmp_path / "dataset")
+
+    with ParquetDatasetWriter(base_dir, row_group_size=20, max_open_files=8) as writer:
+        for start in range(0, len(posts), 100):
+            writer.write_batch(posts.iloc[start:start + 100])
+            assert len(writer._writers) <= 8
+
+    dataset = ds.dataset(base_dir, format='parquet', partitioning='hive')
+    assert dataset.count_rows() == 3000
+    # Rows arrive a few per partition and batch, but only the last row group of a partition may be short
+    partitions = posts.groupby(['subreddit', posts['created_utc'] // 86400], observed=True).ngroups
+    assert sum(fragment.num_row_groups for fragment in dataset.get_fragments()) <= 3000 // 20 + partitions
+    assert sorted(dataset.to_table().column('post_id').to_pylist()) == sorted(posts['post_id'])
@@ -0,0 +1,98 @@
+import threading
+import time
+
+import pandas as pd
+
+from jobs import JobRunner
+from post_store import PostStore
+from synthetic import synthetic_posts
+
+
+class PagedScraper:
+    """Stands in for RedditScraper: one page per listing after a fixed delay."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.started = []
+        self._lock = threading.Lock()
+
+    def iter_frames(self, subreddit_name, post_type, limit, time_filter):
+        with self._lock:
+            self.started.append(subreddit_name)
+        time.sleep(self.delay)
+        yield pd.DataFrame({'subreddit': [subreddit_name], 'post_id': [subreddit_name]})
+
+    def _persist(self, df):
+        pass
+
+
+class StoringScraper:
+    """Stands in for RedditScraper: fixed pages of posts, upserted into a real store."""
+
+    def __init__(self, store, pages):
+        self.store = store
+        self.pages = pages
+
+    def iter_frames(self, subreddit_name, post_type, limit, time_filter):
+        yield from self.pages
+
+    def _persist(self, df):
+        self.store.upsert_posts(df)
+
+
+def posts(n, prefix, seed):
+    df = synthetic_posts(n, ["Python"], seed=seed)
+    df['post_id'] = [f"{prefix}{index}" for index in range(n)]
+    return df
+
+
+def wait_for(jobs, timeout=10.0):
+    deadline = time.time() + timeout
+    while not all(job.finished for job in jobs) and time.time() < deadline:
+        time.sleep(0.01)
+
+
+def test_small_job_is_not_queued_behind_a_large_one():
+    runner = JobRunner(max_workers=2)
+    scraper = PagedScraper()
+    large = runner.submit(scraper, [f"large{index}" for index in range(20)])
+    small = runner.submit(scraper, ["small"])
+    wait_for([large, small])
+
+    # Two large tasks were running; the next free workers alternate between the jobs
+    assert scraper.started.index("small") == 3
+    assert small.snapshot()['status'] == "done"
+    assert small.finished_at < large.finished_at
+    assert large.snapshot()['fetched'] == 20
+    runner.shutdown()
+
+
+def test_shutdown_finishes_queued_jobs():
+    runner = JobRunner(max_workers=1)
+    scraper = PagedScraper(delay=0.2)
+    running = runner.submit(scraper, ["first", "second"])
+    queued = runner.submit(scraper, ["third"])
+    runner.shutdown()
+    wait_for([running, queued])
+
+    assert queued.snapshot()['status'] == "cancelled"
+    assert running.snapshot()['status'] == "cancelled"
+    assert "third" not in scraper.started
+
+
+def test_job_results_cover_only_the_posts_it_stored():
+    store = PostStore(":memory:")
+    # An earlier run of another sort order left posts for the same subreddit
+    store.upsert_posts(posts(50, "old", seed=1))
+    runner = JobRunner(max_workers=1)
+    job = runner.submit(StoringScraper(store, [posts(20, "new", seed=2), posts(10, "newer", seed=3)]), ["Python"])
+    wait_for([job])
+
+    assert len(job.post_ids) == 30
+    assert store.summary(["Python"])['total_posts'] == 80
+    assert store.summary(["Python"], post_ids=job.post_ids)['total_posts'] == 30
+    assert store.count_posts(["Python"], min_score=0, post_ids=job.post_ids) == 30
+    assert not store.query_posts(["Python"], post_ids=job.post_ids)['post_id'].str.startswith("old").any()
+    # A job that has stored nothing yet shows nothing, not the whole history
+    assert store.summary(["Python"], post_ids=[])['total_posts'] == 0
+    runner.shutdown()
@@ -0,0 +1,96 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from link_content import LinkEnricher
+
+ARTICLE = ("<html><head><title>Local article</title></head><body><article><h1>Local article</h1><p>"
+           + "A sentence of article text for the extractor to find. " * 40
+           + "</p></article></body></html>").encode('utf-8')
+
+
+class LocalSite:
+    """Local HTTP stand-in for linked sites: /redirect/<n> redirects to localhost, anything else is an article."""
+
+    def __init__(self):
+        self.hits = []
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                site.hits.append((self.headers['Host'].split(':')[0], self.path, time.monotonic()))
+                if self.path.startswith('/redirect/'):
+                    self.send_response(302)
+                    self.send_header('Location', f"http://localhost:{site.port}/article/{self.path.rsplit('/', 1)[1]}")
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(ARTICLE)))
+                self.end_headers()
+                self.wfile.write(ARTICLE)
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def site():
+    site = LocalSite()
+    yield site
+    site.close()
+
+
+def test_private_addresses_are_not_fetched(site):
+    enricher = LinkEnricher()
+    url = f"http://127.0.0.1:{site.port}/article/1"
+    enricher.submit([{'url': url, 'is_self': False}])
+    assert enricher.join(timeout=10)
+
+    record = enricher.content([url]).iloc[0]
+    assert record['status'] == 'error'
+    assert "non-public address" in record['error']
+    assert site.hits == []
+    enricher.close()
+
+
+def test_redirect_hops_go_through_the_target_domain_limits(site):
+    enricher = LinkEnricher(per_domain=1, domain_interval=0.5, allow_private=True)
+    direct = f"http://localhost:{site.port}/article/0"
+    redirected = f"http://127.0.0.1:{site.port}/redirect/1"
+    enricher.submit([{'url': direct, 'is_self': False}, {'url': redirected, 'is_self': False}])
+    assert enricher.join(timeout=10)
+
+    content = enricher.content([direct, redirected]).set_index('url')
+    assert list(content['status']) == ['ok', 'ok']
+    assert "article text" in content.loc[redirected, 'text']
+
+    # The redirect target is on localhost, so it waits out localhost's interval after the direct fetch
+    localhost = [at for host, _, at in site.hits if host == 'localhost']
+    assert len(localhost) == 2
+    assert localhost[1] - localhost[0] >= 0.45
+    enricher.close()
+
+
+def test_redirect_loops_stop_after_max_redirects(site):
+    enricher = LinkEnricher(domain_interval=0.0, max_redirects=0, allow_private=True)
+    url = f"http://127.0.0.1:{site.port}/redirect/1"
+    enricher.submit([{'url': url, 'is_self': False}])
+    assert enricher.join(timeout=10)
+
+    record = enricher.content([url]).iloc[0]
+    assert record['status'] == 'error'
+    assert "redirects" in record['error']
+    enricher.close()
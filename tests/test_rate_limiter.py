@@ -0,0 +1,76 @@
+import time
+
+import pytest
+
+from fake_reddit import FakeReddit, make_scraper
+from rate_limiter import RateLimiter
+
+
+class FakeClock:
+    """Monotonic clock that only moves when the limiter sleeps."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_limiter(clock):
+    return RateLimiter(clock=clock, sleep=clock.sleep)
+
+
+def test_acquire_does_not_block_while_budget_remains():
+    clock = FakeClock()
+    limiter = make_limiter(clock)
+    limiter.update_from_headers({'X-Ratelimit-Remaining': '3', 'X-Ratelimit-Used': '997', 'X-Ratelimit-Reset': '42'})
+
+    assert [limiter.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert clock.sleeps == []
+
+
+def test_acquire_waits_for_the_reset_once_the_budget_is_exhausted():
+    clock = FakeClock()
+    limiter = make_limiter(clock)
+    limiter.update_from_headers({'X-Ratelimit-Remaining': '0', 'X-Ratelimit-Used': '1000', 'X-Ratelimit-Reset': '42'})
+
+    assert limiter.acquire() == 42.0
+    assert clock.sleeps == [42.0]
+    # The whole budget comes back at the reset
+    assert limiter.stats()['remaining'] == 999
+
+
+@pytest.mark.parametrize("backend", ["praw", "json"])
+def test_scrape_makes_no_per_post_sleeps(backend, monkeypatch):
+    clock = FakeClock()
+    slept = []
+    with FakeReddit(depth=300) as server:
+        scraper = make_scraper(server.url, backend, rate_limiter=make_limiter(clock))
+        monkeypatch.setattr(time, 'sleep', slept.append)
+        df = scraper.scrape_subreddit("Python", "new", 300)
+
+    assert len(df) == 300
+    assert server.request_count == 3
+    assert clock.sleeps == []
+    assert slept == []
+
+
+def test_scrape_blocks_only_when_headers_report_an_exhausted_budget():
+    clock = FakeClock()
+    with FakeReddit(depth=300, rate_limit_headers={'x-ratelimit-remaining': '1', 'x-ratelimit-used': '999',
+                                                   'x-ratelimit-reset': '30'}) as server:
+        scraper = make_scraper(server.url, "json", rate_limiter=make_limiter(clock))
+        first = scraper.scrape_subreddit("Python", "new", 100)
+        assert clock.sleeps == []
+
+        # The next page would go over the reported budget, so the limiter waits for the reset
+        server.rate_limit_headers['x-ratelimit-remaining'] = '0'
+        second = scraper.scrape_subreddit("Rust", "new", 200)
+
+    assert len(first) == 100 and len(second) == 200
+    assert clock.sleeps == [30.0]
@@ -0,0 +1,40 @@
+import requests
+
+from response_cache import ResponseCache
+
+
+def make_response(body):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    return response
+
+
+def fetch(cache, name, size):
+    return cache.fetch('GET', f"https://oauth.reddit.com/r/{name}/new", None, None,
+                       lambda headers: make_response(b"x" * size))
+
+
+def test_size_bound_holds_across_processes_sharing_the_file(tmp_path):
+    path = str(tmp_path / "http_cache.db")
+    first = ResponseCache(path, max_bytes=1000)
+    second = ResponseCache(path, max_bytes=1000)
+
+    # Each connection stands in for a separate process filling the same file
+    for index in range(6):
+        fetch(first if index % 2 else second, f"sub{index}", 300)
+        assert first.stats()['bytes'] == second.stats()['bytes'] <= 1000
+
+    stored = first._conn.execute("SELECT COALESCE(SUM(size), 0), COUNT(*) FROM responses").fetchone()
+    assert stored == (900, 3)
+    assert first.evictions + second.evictions == 3
+
+    # Replacing an expired entry counts its new size only once
+    with first._conn:
+        first._conn.execute("UPDATE responses SET expires_at = 0")
+    fetch(first, "sub5", 100)
+    assert second.stats()['bytes'] == 700
+    first.clear()
+    assert second.stats()['bytes'] == 0
+    first.close()
+    second.close()
@@ -0,0 +1,16 @@
+import pytest
+
+from fake_reddit import FakeReddit, make_scraper
+
+
+@pytest.mark.parametrize("backend", ["praw", "json"])
+def test_persistent_503_is_attempted_max_attempts_times(backend):
+    with FakeReddit(fail_every=1) as server:
+        scraper = make_scraper(server.url, backend)
+        scraper.retry_policy._sleep = lambda seconds: None
+
+        with pytest.raises(Exception):
+            scraper.scrape_subreddit("Python", "new", 10)
+
+        # One listing request, retried by the scraper's RetryPolicy alone
+        assert server.request_count == scraper.retry_policy.max_attempts